@@ -2,13 +2,15 @@
 """Flask web application for health activity scheduler."""
 
 import sys
+import gzip
 from pathlib import Path
-from flask import Flask, render_template, jsonify, send_from_directory
-from datetime import datetime, date as date_type
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from flask import Flask, Response, render_template, jsonify, request, send_from_directory
+from datetime import date as date_type
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from utils import load_json
+from utils import load_json, ScheduleRepository
 
 app = Flask(__name__)
 
@@ -16,6 +18,107 @@ app = Flask(__name__)
 BASE_DIR = Path(__file__).parent.absolute()
 OUTPUT_DIR = BASE_DIR / "output" / "results"
 DATA_DIR = BASE_DIR / "data" / "generated"
+COLUMNS_DIR = OUTPUT_DIR / "schedule_columns"
+
+# Schedule loaded once and indexed; reloaded when the files change
+repository = ScheduleRepository(
+    OUTPUT_DIR / "schedule.json",
+    DATA_DIR / "activities.json",
+    COLUMNS_DIR,
+    OUTPUT_DIR / "calendar.json"
+)
+
+
+# Fields of an enriched schedule slot, for ?fields= projection
+SCHEDULE_FIELDS = (
+    "activity_id", "date", "start_time", "duration_minutes", "specialist_id",
+    "equipment_ids", "activity_name", "activity_type", "priority"
+)
+
+# Bodies smaller than this aren't worth compressing
+GZIP_MIN_SIZE = 1024
+
+# Encoded response bodies keyed by (URL, ETag, accepted encoding)
+_body_cache: Dict[Tuple[str, str, str], Tuple[bytes, str]] = {}
+_BODY_CACHE_SIZE = 64
+
+
+def cached_json(build: Callable[[], Dict[str, Any]]) -> Response:
+    """Send repository-backed JSON with ETag/Last-Modified revalidation and gzip.
+
+    Answers If-None-Match / If-Modified-Since with 304 before building
+    anything. Otherwise the encoded (and, if accepted, gzipped) body is cached
+    per URL until the schedule files change.
+
+    Args:
+        build: Returns the response fields besides "success" (e.g. {"data": ...})
+
+    Returns:
+        A 200 JSON response or a bodiless 304
+    """
+    etag, last_modified = repository.cache_validators()
+
+    if request.if_none_match:
+        not_modified = request.if_none_match.contains_weak(etag)
+    else:
+        since = request.if_modified_since
+        not_modified = since is not None and last_modified <= since
+
+    if not_modified:
+        response = Response(status=304)
+    else:
+        accepted = "gzip" if "gzip" in request.accept_encodings else "identity"
+        key = (request.full_path, etag, accepted)
+        cached = _body_cache.get(key)
+        if cached is None:
+            body = jsonify({"success": True, **build()}).get_data()
+            encoding = "identity"
+            if accepted == "gzip" and len(body) >= GZIP_MIN_SIZE:
+                body, encoding = gzip.compress(body, compresslevel=6), "gzip"
+            if len(_body_cache) >= _BODY_CACHE_SIZE:
+                _body_cache.clear()
+            cached = _body_cache[key] = (body, encoding)
+        body, encoding = cached
+
+        response = Response(body, mimetype="application/json")
+        if encoding == "gzip":
+            response.headers["Content-Encoding"] = "gzip"
+
+    # Weak ETag: the gzip and identity bodies are equivalent, not byte-identical
+    response.set_etag(etag, weak=True)
+    response.last_modified = last_modified
+    response.cache_control.no_cache = True
+    response.vary.add("Accept-Encoding")
+    return response
+
+
+def _date_arg(name: str) -> Optional[str]:
+    """Parse an optional YYYY-MM-DD query parameter."""
+    value = request.args.get(name)
+    return date_type.fromisoformat(value).isoformat() if value else None
+
+
+def _int_arg(name: str) -> Optional[int]:
+    """Parse an optional integer query parameter."""
+    value = request.args.get(name)
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer, got {value!r}") from None
+
+
+def _fields_arg() -> Optional[List[str]]:
+    """Parse an optional ?fields=a,b,c projection."""
+    value = request.args.get("fields")
+    if not value:
+        return None
+    fields = [f.strip() for f in value.split(",") if f.strip()]
+    unknown = [f for f in fields if f not in SCHEDULE_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)} (available: {', '.join(SCHEDULE_FIELDS)})")
+    return fields
 
 
 @app.route("/")
@@ -59,29 +162,46 @@ def get_summary():
 
 @app.route("/api/schedule")
 def get_schedule():
-    """Get full schedule data."""
+    """Get schedule data.
+
+    Query parameters (all optional):
+        start, end: Date range as YYYY-MM-DD (inclusive)
+        activity_id, type, priority: Only matching slots
+        limit: Page size; the response then includes "next_cursor"
+        cursor: "next_cursor" from the previous page
+        fields: Comma-separated fields to return per slot
+    """
     try:
-        schedule = load_json(OUTPUT_DIR / "schedule.json")
-        activities = load_json(DATA_DIR / "activities.json")
-
-        # Create activity lookup
-        activity_map = {a["id"]: a for a in activities}
-
-        # Enrich schedule with activity details
-        enriched_schedule = []
-        for slot in schedule:
-            activity = activity_map.get(slot["activity_id"], {})
-            enriched_schedule.append({
-                **slot,
-                "activity_name": activity.get("name", "Unknown"),
-                "activity_type": activity.get("type", "Unknown"),
-                "priority": activity.get("priority", 5)
-            })
-
-        return jsonify({
-            "success": True,
-            "data": enriched_schedule
-        })
+        if not request.args:
+            return cached_json(lambda: {"data": repository.all_slots()})
+
+        start, end = _date_arg("start"), _date_arg("end")
+        priority, limit = _int_arg("priority"), _int_arg("limit")
+        if limit is not None and limit < 1:
+            raise ValueError("limit must be at least 1")
+        fields = _fields_arg()
+
+        def build():
+            slots, next_cursor = repository.query(
+                start, end,
+                activity_id=request.args.get("activity_id"),
+                activity_type=request.args.get("type"),
+                priority=priority,
+                limit=limit,
+                cursor=request.args.get("cursor")
+            )
+            if fields:
+                slots = [{f: slot[f] for f in fields} for slot in slots]
+
+            payload = {"data": slots}
+            if limit is not None:
+                payload["next_cursor"] = next_cursor
+            return payload
+
+        return cached_json(build)
+    except ValueError as e:
+        # Malformed parameters and stale cursors are client errors
+        return jsonify({"success": False, "error": str(e)}), 400
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
@@ -90,32 +210,12 @@ def get_schedule():
 def get_day_schedule(date):
     """Get schedule for a specific day."""
     try:
-        schedule = load_json(OUTPUT_DIR / "schedule.json")
-        activities = load_json(DATA_DIR / "activities.json")
-
-        # Create activity lookup
-        activity_map = {a["id"]: a for a in activities}
-
-        # Filter by date and enrich
-        day_schedule = []
-        for slot in schedule:
-            if slot["date"] == date:
-                activity = activity_map.get(slot["activity_id"], {})
-                day_schedule.append({
-                    **slot,
-                    "activity_name": activity.get("name", "Unknown"),
-                    "activity_type": activity.get("type", "Unknown"),
-                    "priority": activity.get("priority", 5),
-                    "details": activity.get("details", "")
-                })
-
-        # Sort by start time
-        day_schedule.sort(key=lambda x: x["start_time"])
+        day = date_type.fromisoformat(date).isoformat()
 
-        return jsonify({
-            "success": True,
-            "data": day_schedule
-        })
+        return cached_json(lambda: {"data": repository.day(day)})
+    except ValueError as e:
+        # Not a YYYY-MM-DD date, as for /api/schedule?start=
+        return jsonify({"success": False, "error": str(e)}), 400
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
@@ -124,33 +224,24 @@ def get_day_schedule(date):
 def get_month_calendar(year, month):
     """Get calendar data for a specific month."""
     try:
-        schedule = load_json(OUTPUT_DIR / "schedule.json")
-
-        # Filter by year/month
         year, month = int(year), int(month)
-        month_schedule = {}
-
-        for slot in schedule:
-            slot_date = datetime.fromisoformat(slot["date"]).date()
-            if slot_date.year == year and slot_date.month == month:
-                date_key = slot["date"]
-                if date_key not in month_schedule:
-                    month_schedule[date_key] = []
-                month_schedule[date_key].append(slot)
-
-        # Calculate stats per day
-        calendar_data = {}
-        for date_key, slots in month_schedule.items():
-            calendar_data[date_key] = {
-                "count": len(slots),
-                "has_priority_1": any(s.get("priority", 5) == 1 for s in slots),
-                "types": list(set(s.get("activity_type", "Unknown") for s in slots))
-            }
 
-        return jsonify({
-            "success": True,
-            "data": calendar_data
-        })
+        def build():
+            days, month_stats = repository.calendar(year, month)
+
+            calendar_data = {}
+            for date_key, stats in days.items():
+                calendar_data[date_key] = {
+                    "count": stats["count"],
+                    "has_priority_1": "1" in stats["priorities"],
+                    "types": sorted(stats["types"]),
+                    "booked_minutes": stats["booked_minutes"],
+                    "priority_mix": stats["priorities"],
+                    "type_mix": stats["types"]
+                }
+            return {"data": calendar_data, "month": month_stats}
+
+        return cached_json(build)
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
@@ -7,8 +7,9 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from utils import load_activities, load_specialists, load_equipment, load_travel, load_json, save_json
+from utils import load_json, save_json, save_schedule
 from scheduler import GreedyScheduler
+from scheduler.problem import load_problem
 
 
 def main():
@@ -22,13 +23,15 @@ def main():
     data_dir = Path("data/generated")
 
     metadata = load_json(data_dir / "metadata.json")
-    start_date_str = metadata.get("start_date")
-    start_date = datetime.fromisoformat(start_date_str).date()
 
-    activities = load_activities(data_dir / "activities.json")
-    specialists = load_specialists(data_dir / "specialists.json")
-    equipment = load_equipment(data_dir / "equipment.json")
-    travel = load_travel(data_dir / "travel.json")
+    # Reuses data/generated/problem.bin while the source JSON is unchanged
+    problem = load_problem(data_dir)
+    start_date = problem.start_date
+
+    activities = problem.activities
+    specialists = problem.specialists
+    equipment = problem.equipment
+    travel = problem.travel_periods
 
     print(f"   ✓ {len(activities)} activities")
     print(f"   ✓ {len(specialists)} specialists")
@@ -45,7 +48,8 @@ def main():
         equipment=equipment,
         travel_periods=travel,
         start_date=start_date,
-        duration_days=90
+        duration_days=90,
+        availability=problem.availability
     )
 
     state = scheduler.schedule()
@@ -94,7 +98,7 @@ def main():
     print(f"\n💾 Saving schedule to {output_dir}/...")
 
     # Save time slots
-    save_json(state.booked_slots, output_dir / "schedule.json")
+    save_schedule(state.booked_slots, output_dir / "schedule.json")
     print(f"   ✓ schedule.json ({len(state.booked_slots)} time slots)")
 
     # Save statistics
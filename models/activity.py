@@ -116,6 +116,20 @@ class Activity(BaseModel):
         description="Measurements to track"
     )
 
+    @property
+    def window_start_min(self) -> Optional[int]:
+        """Time window start in minutes since midnight (None if no window)."""
+        if self.time_window_start is None:
+            return None
+        return self.time_window_start.hour * 60 + self.time_window_start.minute
+
+    @property
+    def window_end_min(self) -> Optional[int]:
+        """Time window end in minutes since midnight (None if no window)."""
+        if self.time_window_end is None:
+            return None
+        return self.time_window_end.hour * 60 + self.time_window_end.minute
+
     @model_validator(mode='after')
     def validate_time_window(self):
         """Validate time window."""
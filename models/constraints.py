@@ -67,6 +67,20 @@ class MaintenanceWindow(BaseModel):
     start_time: Optional[time] = Field(default=None, description="Start time (None = all day)")
     end_time: Optional[time] = Field(default=None, description="End time (None = all day)")
 
+    @property
+    def start_min(self) -> Optional[int]:
+        """Start time in minutes since midnight (None = all day)."""
+        if self.start_time is None:
+            return None
+        return self.start_time.hour * 60 + self.start_time.minute
+
+    @property
+    def end_min(self) -> Optional[int]:
+        """End time in minutes since midnight (None = all day)."""
+        if self.end_time is None:
+            return None
+        return self.end_time.hour * 60 + self.end_time.minute
+
     @field_validator('end_date')
     @classmethod
     def validate_date_range(cls, v, info):
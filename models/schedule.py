@@ -25,3 +25,13 @@ class TimeSlot(BaseModel):
     duration_minutes: int = Field(ge=5, le=480, description="Duration in minutes")
     specialist_id: Optional[str] = Field(default=None, description="Specialist facilitating")
     equipment_ids: List[str] = Field(default_factory=list, description="Equipment being used")
+
+    @property
+    def start_min(self) -> int:
+        """Start time in minutes since midnight."""
+        return self.start_time.hour * 60 + self.start_time.minute
+
+    @property
+    def end_min(self) -> int:
+        """End time in minutes since midnight (may exceed 1440 past midnight)."""
+        return self.start_min + self.duration_minutes
@@ -192,6 +192,7 @@ def _prepare_failure_data(state: SchedulerState) -> Dict[str, Any]:
             "priority": report["priority"],
             "failed_count": report["attempts"],
             "reason": report["sample_reason"] or "Unknown",
+            "other_reasons": state.failed_activities[report["activity_id"]].sample_reasons(),
             "violation_types": report["violation_types"]
         })
 
@@ -284,10 +285,12 @@ def _format_failure_list(failures: List[Dict[str, Any]]) -> str:
     """Format failure list for prompt."""
     lines = []
     for failure in failures:
+        other_reasons = [r for r in failure['other_reasons'] if r != failure['reason']]
         lines.append(
             f"- {failure['name']} (P{failure['priority']}, {failure['type']})\n"
             f"  Failed: {failure['failed_count']} occurrences\n"
             f"  Reason: {failure['reason']}\n"
-            f"  Violation Types: {', '.join(failure['violation_types'].keys())}"
+            + (f"  Other Reasons: {'; '.join(other_reasons)}\n" if other_reasons else "")
+            + f"  Violation Types: {', '.join(failure['violation_types'].keys())}"
         )
     return "\n\n".join(lines)
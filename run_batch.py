@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Schedule many clients in parallel against shared specialists and equipment.
+
+Usage:
+    python run_batch.py clients/alice clients/bob --resources data/generated --output-dir output/batch
+
+Each client directory is shaped like data/generated (activities.json, plus
+optional travel.json and metadata.json). Specialists and equipment are read
+once from the resources directory and shared by every client.
+
+With --shared-capacity, clients are scheduled one after another against a
+single resource ledger, so specialist and equipment concurrency limits hold
+across all clients instead of per client.
+"""
+
+import argparse
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from utils import load_specialists, load_equipment
+from scheduler.batch import SCHEDULERS, schedule_clients, schedule_clients_shared
+
+
+def main():
+    """Run batch scheduling and report each client as it finishes."""
+    parser = argparse.ArgumentParser(description="Schedule many clients in parallel")
+    parser.add_argument("clients", nargs="+", type=Path, help="Client dataset directories")
+    parser.add_argument("--resources", type=Path, default=Path("data/generated"),
+                        help="Directory with shared specialists.json and equipment.json")
+    parser.add_argument("--output-dir", type=Path, default=Path("output/batch"),
+                        help="Root directory for per-client results")
+    parser.add_argument("--scheduler", choices=sorted(SCHEDULERS), default="greedy")
+    parser.add_argument("--days", type=int, default=90, help="Scheduling horizon in days")
+    parser.add_argument("--start-date", type=date.fromisoformat, default=None,
+                        help="Start date for clients without metadata.json (YYYY-MM-DD)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--shared-capacity", action="store_true",
+                        help="Enforce specialist/equipment limits across clients (runs sequentially)")
+    parser.add_argument("--schedule-file", default="schedule.json",
+                        help="Per-client schedule file name (e.g. schedule.ndjson.gz for gzipped NDJSON)")
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("HEALTH ACTIVITY SCHEDULER - BATCH")
+    print("=" * 80)
+
+    specialists = load_specialists(args.resources / "specialists.json")
+    equipment = load_equipment(args.resources / "equipment.json")
+
+    print(f"\n📂 {len(args.clients)} clients, {len(specialists)} specialists, {len(equipment)} equipment items")
+    print(f"⚙️  Running {args.scheduler} scheduler over {args.days} days...\n")
+
+    started = time.perf_counter()
+    if args.shared_capacity:
+        summaries = schedule_clients_shared(
+            args.clients,
+            args.output_dir,
+            specialists,
+            equipment,
+            scheduler_name=args.scheduler,
+            duration_days=args.days,
+            default_start_date=args.start_date,
+            schedule_file=args.schedule_file
+        )
+    else:
+        summaries = schedule_clients(
+            args.clients,
+            args.output_dir,
+            specialists,
+            equipment,
+            scheduler_name=args.scheduler,
+            duration_days=args.days,
+            default_start_date=args.start_date,
+            max_workers=args.workers,
+            schedule_file=args.schedule_file
+        )
+
+    for summary in summaries:
+        print(
+            f"   ✓ {summary['client']}: {summary['success_rate']:.1f}% "
+            f"({summary['total_slots']}/{summary['total_required']}) "
+            f"in {summary['seconds']:.1f}s → {summary['output_dir']}"
+        )
+
+    print(f"\n✅ Batch complete in {time.perf_counter() - started:.1f}s")
+    print("\n" + "=" * 80 + "\n")
+
+
+if __name__ == "__main__":
+    main()
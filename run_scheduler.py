@@ -2,13 +2,13 @@
 """Main script to run the complete health activity scheduler."""
 
 import sys
-from datetime import datetime
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from utils import load_activities, load_specialists, load_equipment, load_travel, load_json, save_json
+from utils import load_json, save_json, save_schedule, save_columnar, save_aggregates
 from scheduler import GreedyScheduler
+from scheduler.problem import load_problem
 from output import CalendarFormatter, MetricsCalculator
 
 # Optional LLM summary generation
@@ -31,13 +31,15 @@ def main():
 
     data_dir = Path("data/generated")
     metadata = load_json(data_dir / "metadata.json")
-    start_date_str = metadata.get("start_date")
-    start_date = datetime.fromisoformat(start_date_str).date()
 
-    activities = load_activities(data_dir / "activities.json")
-    specialists = load_specialists(data_dir / "specialists.json")
-    equipment = load_equipment(data_dir / "equipment.json")
-    travel = load_travel(data_dir / "travel.json")
+    # Reuses data/generated/problem.bin while the source JSON is unchanged
+    problem = load_problem(data_dir)
+    start_date = problem.start_date
+
+    activities = problem.activities
+    specialists = problem.specialists
+    equipment = problem.equipment
+    travel = problem.travel_periods
 
     print(f"✓ Loaded {len(activities)} activities")
     print(f"✓ Loaded {len(specialists)} specialists")
@@ -55,7 +57,8 @@ def main():
         equipment=equipment,
         travel_periods=travel,
         start_date=start_date,
-        duration_days=90
+        duration_days=90,
+        availability=problem.availability
     )
 
     state = scheduler.schedule()
@@ -119,7 +122,9 @@ def main():
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Save JSON outputs
-    save_json(state.booked_slots, output_dir / "schedule.json")
+    save_schedule(state.booked_slots, output_dir / "schedule.json")
+    save_columnar(state.booked_slots, output_dir / "schedule_columns")
+    save_aggregates(state.booked_slots, activities, output_dir / "calendar.json")
     save_json(metrics_report, output_dir / "metrics.json")
     save_json(state.get_failure_report(), output_dir / "failures.json")
 
@@ -137,6 +142,8 @@ def main():
         f.write(summary)
 
     print(f"✓ schedule.json ({len(state.booked_slots)} slots)")
+    print(f"✓ schedule_columns/ (columnar store)")
+    print(f"✓ calendar.json (day and month aggregates)")
     print(f"✓ metrics.json")
     print(f"✓ failures.json ({len(state.get_failure_report())} failed activities)")
     print(f"✓ weekly_calendar.txt")
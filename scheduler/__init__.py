@@ -5,6 +5,11 @@ from .scoring import SlotScorer
 from .state import SchedulerState
 from .greedy import GreedyScheduler
 from .balanced import BalancedScheduler
+from .rolling import RollingScheduler
+from .changes import (
+    AddActivity, AddMaintenance, AddTravel, RemoveActivity, RescheduleResult,
+    ScheduleChange, SpecialistDayOff
+)
 
 __all__ = [
     "ConstraintChecker",
@@ -12,5 +17,13 @@ __all__ = [
     "SlotScorer",
     "SchedulerState",
     "GreedyScheduler",
-    "BalancedScheduler"
+    "BalancedScheduler",
+    "RollingScheduler",
+    "AddActivity",
+    "AddMaintenance",
+    "AddTravel",
+    "RemoveActivity",
+    "RescheduleResult",
+    "ScheduleChange",
+    "SpecialistDayOff"
 ]
@@ -0,0 +1,100 @@
+"""Compiled specialist availability for fast per-date lookups.
+
+A Specialist describes availability as weekly blocks plus a list of days off.
+``SpecialistAvailability`` compiles that once into merged, sorted minute
+blocks per weekday and maps every date of the scheduling horizon to its
+blocks (days off map to no blocks). Checking whether an activity fits is then
+one dict lookup plus a ``bisect`` over a handful of blocks.
+"""
+
+from bisect import bisect_right
+from datetime import date as date_type, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from models import Specialist
+from .times import to_minutes
+
+# Parallel (starts, ends) minute lists, sorted and non-overlapping
+Blocks = Tuple[Tuple[int, ...], Tuple[int, ...]]
+
+NO_BLOCKS: Blocks = ((), ())
+
+
+def merge_blocks(intervals: Iterable[Tuple[int, int]]) -> Blocks:
+    """Merge overlapping or touching (start, end) minute intervals.
+
+    Args:
+        intervals: Unsorted (start, end) pairs
+
+    Returns:
+        Parallel tuples of merged starts and ends
+    """
+    merged: List[List[int]] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1][1] = end
+        else:
+            merged.append([start, end])
+
+    return tuple(s for s, _ in merged), tuple(e for _, e in merged)
+
+
+class SpecialistAvailability:
+    """Per-date availability mask for one specialist."""
+
+    def __init__(
+        self,
+        specialist: Specialist,
+        start_date: Optional[date_type] = None,
+        end_date: Optional[date_type] = None
+    ):
+        """Compile a specialist's weekly blocks and days off.
+
+        Args:
+            specialist: The specialist to compile
+            start_date: First date of the horizon to precompute (optional)
+            end_date: Last date of the horizon to precompute (optional)
+        """
+        self.days_off = frozenset(specialist.days_off)
+        self.weekly: List[Blocks] = [
+            merge_blocks(
+                (to_minutes(block.start_time), to_minutes(block.end_time))
+                for block in specialist.availability
+                if block.day_of_week == weekday
+            )
+            for weekday in range(7)
+        ]
+        self._dates: Dict[date_type, Blocks] = {}
+
+        if start_date is not None and end_date is not None:
+            current = start_date
+            while current <= end_date:
+                self._dates[current] = self._compile(current)
+                current += timedelta(days=1)
+
+    def blocks(self, date: date_type) -> Blocks:
+        """Get the merged availability blocks on a date.
+
+        Dates outside the precomputed horizon are compiled on first use.
+        """
+        blocks = self._dates.get(date)
+        if blocks is None:
+            blocks = self._dates[date] = self._compile(date)
+        return blocks
+
+    def forget_before(self, date: date_type) -> None:
+        """Drop compiled dates earlier than `date` (they are recompiled if asked for again)."""
+        self._dates = {d: blocks for d, blocks in self._dates.items() if d >= date}
+
+    def covers(self, date: date_type, start: int, end: int) -> bool:
+        """Check that [start, end) lies inside a single merged block."""
+        starts, ends = self.blocks(date)
+        i = bisect_right(starts, start) - 1
+        return i >= 0 and end <= ends[i]
+
+    def _compile(self, date: date_type) -> Blocks:
+        """Build the blocks for one date."""
+        if date in self.days_off:
+            return NO_BLOCKS
+        return self.weekly[date.weekday()]
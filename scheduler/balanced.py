@@ -13,15 +13,19 @@ This addresses the core limitation of pure greedy scheduling where
 P1-P2 activities fill the calendar before P3-P4 get scheduled.
 """
 
-from datetime import date as date_type, time as time_type, datetime, timedelta
-from typing import List, Optional, Tuple, Dict
+from datetime import date as date_type, timedelta
+from typing import List, Optional, Dict
 from collections import defaultdict
 import logging
 
-from models import Activity, Specialist, Equipment, TravelPeriod, TimeSlot, FrequencyPattern
+from models import Activity, Specialist, Equipment, TravelPeriod, FrequencyPattern
+from .availability import SpecialistAvailability
 from .constraints import ConstraintChecker
 from .scoring import SlotScorer
+from .booking import Booking
+from .ledger import ResourceLedger
 from .state import SchedulerState
+from .times import MINUTES_PER_DAY, from_minutes
 
 
 logger = logging.getLogger(__name__)
@@ -49,7 +53,9 @@ class BalancedScheduler:
         equipment: List[Equipment],
         travel_periods: List[TravelPeriod],
         start_date: date_type,
-        duration_days: int = 90
+        duration_days: int = 90,
+        ledger: Optional[ResourceLedger] = None,
+        availability: Optional[Dict[str, SpecialistAvailability]] = None
     ):
         """Initialize scheduler with activities and constraints.
 
@@ -60,6 +66,9 @@ class BalancedScheduler:
             travel_periods: List of client travel periods
             start_date: First day of scheduling horizon
             duration_days: Length of scheduling period (default 90 days)
+            ledger: Specialist/equipment ledger shared with other clients (optional)
+            availability: Compiled specialist availability to reuse instead of
+                compiling it again, e.g. from ``load_problem`` (optional)
         """
         self.activities = activities
         self.start_date = start_date
@@ -67,9 +76,12 @@ class BalancedScheduler:
         self.duration_days = duration_days
 
         # Initialize components
-        self.checker = ConstraintChecker(specialists, equipment, travel_periods)
+        self.checker = ConstraintChecker(
+            specialists, equipment, travel_periods, self.start_date, self.end_date,
+            availability=availability
+        )
         self.scorer = SlotScorer()
-        self.state = SchedulerState()
+        self.state = SchedulerState(ledger)
 
         # Track daily capacity usage by priority
         self.daily_capacity: Dict[date_type, Dict[int, int]] = defaultdict(lambda: defaultdict(int))
@@ -230,7 +242,7 @@ class BalancedScheduler:
         activity: Activity,
         occurrence_index: int,
         enforce_quota: bool = True
-    ) -> Optional[TimeSlot]:
+    ) -> Optional[Booking]:
         """Find the best available time slot for an activity occurrence.
 
         Args:
@@ -239,49 +251,69 @@ class BalancedScheduler:
             enforce_quota: Whether to enforce daily capacity quotas
 
         Returns:
-            TimeSlot if successful, None if no valid slot found
+            Booking if successful, None if no valid slot found
         """
-        candidate_slots = self._generate_candidate_slots(activity, occurrence_index)
-
-        # Score all candidates
-        scored_slots = []
-        for date, start_time in candidate_slots:
-            # Check capacity quota
-            if enforce_quota and not self._check_quota(date, activity.priority):
-                continue
-
-            # Check hard constraints
-            violation = self.checker.check_time_slot(
-                activity, date, start_time, self.state.booked_slots
-            )
+        candidate_dates = self._generate_candidate_dates(activity, occurrence_index)
 
-            if violation is None:  # Valid slot
-                score = self.scorer.score_slot(
-                    activity, date, start_time, self.state.booked_slots
-                )
-                scored_slots.append((score, date, start_time))
-            else:
-                # Record violation for failure tracking
-                self.state.record_failure(activity, violation)
+        # Skip dates whose capacity quota is used up
+        if enforce_quota:
+            candidate_dates = [
+                date for date in candidate_dates
+                if self._check_quota(date, activity.priority)
+            ]
+
+        start_minutes = self._generate_start_minutes(activity)
+
+        # Drop dates blocked for the whole day before expanding times
+        candidate_dates, blocked = self.checker.prune_dates(
+            activity, candidate_dates, start_minutes, self.state
+        )
+        # Each stands for every candidate time on its date, as if expanded
+        for violation in blocked:
+            self.state.record_failure(activity, violation, len(start_minutes))
+
+        # Check and score the remaining candidates as a date x time grid
+        violations = self.checker.check_many(
+            activity, candidate_dates, start_minutes, self.state, dates_checked=True
+        )
 
-        if not scored_slots:
+        valid_rows = [
+            i for i, row in enumerate(violations)
+            if any(violation is None for violation in row)
+        ]
+        scores = self.scorer.score_many(
+            activity, [candidate_dates[i] for i in valid_rows], start_minutes
+        )
+        row_scores = dict(zip(valid_rows, scores))
+
+        best = None
+        for i, row in enumerate(violations):
+            for j, violation in enumerate(row):
+                if violation is None:  # Valid slot
+                    score = row_scores[i][j]
+                    if best is None or score > best[0]:
+                        best = (score, candidate_dates[i], start_minutes[j])
+                else:
+                    # Record violation for failure tracking
+                    self.state.record_failure(activity, violation)
+
+        if best is None:
             logger.debug(f"    No valid slots found for {activity.id} occurrence {occurrence_index}")
             return None
 
-        # Sort by score (descending) and take best
-        scored_slots.sort(reverse=True, key=lambda x: x[0])
-        best_score, best_date, best_time = scored_slots[0]
+        # First highest-scoring valid slot in candidate order
+        best_score, best_date, best_start = best
 
-        logger.debug(f"    Selected slot with score {best_score:.1f}: {best_date} at {best_time}")
+        logger.debug(f"    Selected slot with score {best_score:.1f}: {best_date} at {from_minutes(best_start)}")
 
-        # Create TimeSlot
-        return TimeSlot(
+        # Create booking
+        return Booking(
             activity_id=activity.id,
             date=best_date,
-            start_time=best_time,
+            start_min=best_start,
             duration_minutes=activity.duration_minutes,
             specialist_id=activity.specialist_id,
-            equipment_ids=activity.equipment_ids or []
+            equipment_ids=activity.equipment_ids
         )
 
     def _check_quota(self, date: date_type, priority: int) -> bool:
@@ -299,12 +331,12 @@ class BalancedScheduler:
 
         return current_usage < quota_limit
 
-    def _generate_candidate_slots(
+    def _generate_candidate_dates(
         self,
         activity: Activity,
         occurrence_index: int
-    ) -> List[Tuple[date_type, time_type]]:
-        """Generate candidate (date, time) pairs for an activity occurrence.
+    ) -> List[date_type]:
+        """Generate candidate dates for an activity occurrence.
 
         Strategy:
         - For Daily: spread evenly across all days
@@ -317,16 +349,16 @@ class BalancedScheduler:
             occurrence_index: Which occurrence (0-indexed)
 
         Returns:
-            List of (date, start_time) tuples to try
+            List of dates to try, in preference order
         """
         freq = activity.frequency
-        candidates = []
+        candidate_dates = []
 
         # Generate candidate dates based on frequency pattern
         if freq.pattern == FrequencyPattern.DAILY:
             candidate_date = self.start_date + timedelta(days=occurrence_index)
             if candidate_date <= self.end_date:
-                candidates.extend(self._generate_times_for_date(activity, candidate_date))
+                candidate_dates.append(candidate_date)
 
         elif freq.pattern == FrequencyPattern.WEEKLY:
             # Spread across weeks
@@ -346,7 +378,7 @@ class BalancedScheduler:
             candidate_date = week_start + timedelta(days=days_to_add)
 
             if candidate_date <= self.end_date:
-                candidates.extend(self._generate_times_for_date(activity, candidate_date))
+                candidate_dates.append(candidate_date)
 
         elif freq.pattern == FrequencyPattern.MONTHLY:
             # Spread across months
@@ -354,72 +386,69 @@ class BalancedScheduler:
             candidate_date = self.start_date + timedelta(days=30 * month_number)
 
             if candidate_date <= self.end_date:
-                candidates.extend(self._generate_times_for_date(activity, candidate_date))
+                candidate_dates.append(candidate_date)
 
         elif freq.pattern == FrequencyPattern.CUSTOM:
             if freq.interval_days:
                 candidate_date = self.start_date + timedelta(days=occurrence_index * freq.interval_days)
                 if candidate_date <= self.end_date:
-                    candidates.extend(self._generate_times_for_date(activity, candidate_date))
-
-        # If primary strategy fails, add backup dates (±1 day)
-        if len(candidates) < 3:
-            for date, time in list(candidates):
+                    candidate_dates.append(candidate_date)
+
+        # If primary strategy yields fewer than 3 candidate slots, add backup
+        # dates (±1 day), each date once
+        times_per_date = len(self._generate_start_minutes(activity))
+        if len(candidate_dates) * times_per_date < 3:
+            backup_dates = []
+            for date in candidate_dates:
                 # Add previous day
                 prev_date = date - timedelta(days=1)
                 if prev_date >= self.start_date:
-                    candidates.extend(self._generate_times_for_date(activity, prev_date))
+                    backup_dates.append(prev_date)
 
                 # Add next day
                 next_date = date + timedelta(days=1)
                 if next_date <= self.end_date:
-                    candidates.extend(self._generate_times_for_date(activity, next_date))
+                    backup_dates.append(next_date)
 
-        return candidates
+            candidate_dates = list(dict.fromkeys(candidate_dates + backup_dates))
 
-    def _generate_times_for_date(
-        self,
-        activity: Activity,
-        date: date_type
-    ) -> List[Tuple[date_type, time_type]]:
-        """Generate candidate times for a specific date.
+        return candidate_dates
+
+    def _generate_start_minutes(self, activity: Activity) -> List[int]:
+        """Generate candidate start times (minutes since midnight) for an activity.
+
+        The same times are tried on every candidate date.
 
         Args:
             activity: The activity to generate times for
-            date: The date to generate times on
 
         Returns:
-            List of (date, time) pairs
+            List of start minutes in ascending order
         """
-        times = []
+        starts = []
 
         # If activity has time window, generate times within it
         if activity.time_window_start and activity.time_window_end:
-            start_hour = activity.time_window_start.hour
-            end_hour = activity.time_window_end.hour
+            window_start = activity.window_start_min
+            window_end = activity.window_end_min
 
             # Generate hourly slots within window
-            for hour in range(start_hour, end_hour + 1):
+            for hour in range(window_start // 60, window_end // 60 + 1):
                 for minute in [0, 30]:  # Try on the hour and half-hour
-                    candidate_time = time_type(hour, minute)
+                    start = hour * 60 + minute
 
-                    # Check if this time fits within window
-                    if activity.time_window_start <= candidate_time:
-                        # Check if activity finishes before window end
-                        end_time = self._add_minutes_to_time(candidate_time, activity.duration_minutes)
-                        if end_time <= activity.time_window_end:
-                            times.append((date, candidate_time))
+                    # Check the activity starts and finishes inside the window
+                    if window_start <= start and start + activity.duration_minutes <= window_end:
+                        starts.append(start)
 
         else:
             # No time window - generate times across reasonable hours (6 AM - 8 PM)
             for hour in range(6, 21):  # 6 AM to 8 PM
                 for minute in [0, 30]:
-                    times.append((date, time_type(hour, minute)))
+                    start = hour * 60 + minute
 
-        return times
+                    # Bookings can't run past midnight into the next date
+                    if start + activity.duration_minutes <= MINUTES_PER_DAY:
+                        starts.append(start)
 
-    def _add_minutes_to_time(self, t: time_type, minutes: int) -> time_type:
-        """Add minutes to a time object."""
-        dt = datetime.combine(date_type.today(), t)
-        dt += timedelta(minutes=minutes)
-        return dt.time()
+        return starts
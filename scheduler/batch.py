@@ -0,0 +1,294 @@
+"""Batch scheduling of many independent clients across a process pool.
+
+Each client is a directory shaped like ``data/generated``: it must hold
+``activities.json`` and may hold ``travel.json`` and ``metadata.json`` (for
+the start date). Specialists and equipment are shared by every client, so
+they are shipped to each worker process once, together with their compiled
+availability masks, through the pool initializer.
+
+Workers write each client's outputs straight to ``<output_root>/<client>/``
+and send back only a small summary, so results stream to disk as clients
+finish instead of being collected in the parent process.
+
+Parallel runs treat clients as independent. When clients compete for the
+same specialists and equipment, ``schedule_clients_shared`` schedules them
+one after another against a single ``ResourceLedger`` so capacity limits
+hold across all of them.
+"""
+
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date as date_type, datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from models import Specialist, Equipment
+from utils import load_activities, load_travel, load_json, save_json, save_schedule
+from .availability import SpecialistAvailability
+from .balanced import BalancedScheduler
+from .greedy import GreedyScheduler
+from .ledger import ResourceLedger
+
+SCHEDULERS = {
+    "greedy": GreedyScheduler,
+    "balanced": BalancedScheduler,
+}
+
+# Resources shared by every client handled in this worker process
+_shared: Dict[str, object] = {}
+
+
+def _init_worker(
+    specialists: List[Specialist],
+    equipment: List[Equipment],
+    availability: Dict[str, SpecialistAvailability]
+) -> None:
+    """Store the shared resources in the worker process."""
+    _shared["specialists"] = specialists
+    _shared["equipment"] = equipment
+    _shared["availability"] = availability
+
+
+def schedule_client(
+    client_dir: Path,
+    output_dir: Path,
+    scheduler_name: str = "greedy",
+    duration_days: int = 90,
+    default_start_date: Optional[date_type] = None,
+    schedule_file: str = "schedule.json"
+) -> Dict:
+    """Schedule one client against the worker's shared resources and save the results.
+
+    Runs inside a worker process initialized by ``_init_worker``.
+
+    Args:
+        client_dir: Directory with the client's activities (and optional travel/metadata)
+        output_dir: Directory to write the schedule, failures.json and schedule_metadata.json
+        scheduler_name: "greedy" or "balanced"
+        duration_days: Length of scheduling period
+        default_start_date: Start date used when the client has no metadata.json
+        schedule_file: Schedule file name; .ndjson/.jsonl and .gz suffixes pick the format
+
+    Returns:
+        Summary of the client's run
+    """
+    return _run_client(
+        client_dir,
+        output_dir,
+        _shared["specialists"],
+        _shared["equipment"],
+        _shared["availability"],
+        scheduler_name,
+        duration_days,
+        default_start_date,
+        schedule_file=schedule_file
+    )
+
+
+def _run_client(
+    client_dir: Path,
+    output_dir: Path,
+    specialists: List[Specialist],
+    equipment: List[Equipment],
+    availability: Dict[str, SpecialistAvailability],
+    scheduler_name: str,
+    duration_days: int,
+    default_start_date: Optional[date_type],
+    ledger: Optional[ResourceLedger] = None,
+    schedule_file: str = "schedule.json"
+) -> Dict:
+    """Load, schedule and save one client; return its summary."""
+    started = time.perf_counter()
+
+    start_date = _client_start_date(client_dir, default_start_date)
+    if start_date is None:
+        raise ValueError(f"{client_dir} has no metadata.json and no default start date was given")
+
+    travel_path = client_dir / "travel.json"
+    activities = load_activities(client_dir / "activities.json")
+    travel = load_travel(travel_path) if travel_path.exists() else []
+
+    scheduler = SCHEDULERS[scheduler_name](
+        activities=activities,
+        specialists=specialists,
+        equipment=equipment,
+        travel_periods=travel,
+        start_date=start_date,
+        duration_days=duration_days,
+        ledger=ledger,
+        availability=availability
+    )
+    state = scheduler.schedule()
+
+    total_required = sum(
+        scheduler._calculate_required_occurrences(activity)
+        for activity in activities
+    )
+    total_slots = len(state.booked_slots)
+    success_rate = (total_slots / total_required * 100) if total_required > 0 else 0
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    failure_report = state.get_failure_report()
+    save_schedule(state.booked_slots, output_dir / schedule_file)
+    save_json(failure_report, output_dir / "failures.json")
+    save_json({
+        "generation_date": str(datetime.now().date()),
+        "start_date": str(scheduler.start_date),
+        "end_date": str(scheduler.end_date),
+        "total_slots": total_slots,
+        "total_required": total_required,
+        "success_rate": round(success_rate, 2),
+        "total_activities": len(activities),
+    }, output_dir / "schedule_metadata.json")
+
+    return {
+        "client": client_dir.name,
+        "output_dir": str(output_dir),
+        "total_slots": total_slots,
+        "total_required": total_required,
+        "success_rate": round(success_rate, 2),
+        "failed_activities": len(failure_report),
+        "seconds": round(time.perf_counter() - started, 2),
+    }
+
+
+def _client_start_date(client_dir: Path, default_start_date: Optional[date_type]) -> Optional[date_type]:
+    """A client's start date from its metadata.json, else the default."""
+    metadata_path = client_dir / "metadata.json"
+    if metadata_path.exists():
+        return datetime.fromisoformat(load_json(metadata_path)["start_date"]).date()
+    return default_start_date
+
+
+def _compile_availability(
+    client_dirs: List[Path],
+    specialists: List[Specialist],
+    duration_days: int,
+    default_start_date: Optional[date_type]
+) -> Dict[str, SpecialistAvailability]:
+    """Compile the shared availability masks once over every client's horizon."""
+    starts = [
+        start for start in (_client_start_date(Path(d), default_start_date) for d in client_dirs)
+        if start is not None
+    ]
+    if not starts:
+        return {s.id: SpecialistAvailability(s) for s in specialists}
+
+    first = min(starts)
+    last = max(starts) + timedelta(days=duration_days - 1)
+    return {s.id: SpecialistAvailability(s, first, last) for s in specialists}
+
+
+def _client_names(client_dirs: List[Path], scheduler_name: str) -> List[str]:
+    """Validate batch arguments and return the client output names."""
+    if scheduler_name not in SCHEDULERS:
+        raise ValueError(f"Unknown scheduler '{scheduler_name}' (expected one of {sorted(SCHEDULERS)})")
+
+    names = [Path(d).name for d in client_dirs]
+    if len(set(names)) != len(names):
+        raise ValueError("Client directory names must be unique (they name the output directories)")
+    return names
+
+
+def schedule_clients(
+    client_dirs: List[Path],
+    output_root: Path,
+    specialists: List[Specialist],
+    equipment: List[Equipment],
+    scheduler_name: str = "greedy",
+    duration_days: int = 90,
+    default_start_date: Optional[date_type] = None,
+    max_workers: Optional[int] = None,
+    schedule_file: str = "schedule.json"
+) -> Iterator[Dict]:
+    """Schedule many clients in parallel, yielding summaries as they finish.
+
+    Args:
+        client_dirs: One dataset directory per client
+        output_root: Results go to ``output_root/<client directory name>/``
+        specialists: Specialists shared by all clients
+        equipment: Equipment shared by all clients
+        scheduler_name: "greedy" or "balanced"
+        duration_days: Length of scheduling period
+        default_start_date: Start date for clients without metadata.json
+        max_workers: Number of worker processes (default: CPU count)
+        schedule_file: Schedule file name; .ndjson/.jsonl and .gz suffixes pick the format
+
+    Yields:
+        Per-client summaries in completion order
+    """
+    names = _client_names(client_dirs, scheduler_name)
+
+    # Compiled once for the whole batch and shipped to each worker once
+    availability = _compile_availability(client_dirs, specialists, duration_days, default_start_date)
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(specialists, equipment, availability)
+    ) as pool:
+        futures = [
+            pool.submit(
+                schedule_client,
+                Path(client_dir),
+                Path(output_root) / name,
+                scheduler_name,
+                duration_days,
+                default_start_date,
+                schedule_file
+            )
+            for client_dir, name in zip(client_dirs, names)
+        ]
+
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def schedule_clients_shared(
+    client_dirs: List[Path],
+    output_root: Path,
+    specialists: List[Specialist],
+    equipment: List[Equipment],
+    scheduler_name: str = "greedy",
+    duration_days: int = 90,
+    default_start_date: Optional[date_type] = None,
+    ledger: Optional[ResourceLedger] = None,
+    schedule_file: str = "schedule.json"
+) -> Iterator[Dict]:
+    """Schedule clients in order against one shared specialist/equipment ledger.
+
+    Earlier clients get first pick of shared resources; later clients see
+    their bookings when checking specialist and equipment capacity.
+
+    Args:
+        client_dirs: One dataset directory per client, in scheduling order
+        output_root: Results go to ``output_root/<client directory name>/``
+        specialists: Specialists shared by all clients
+        equipment: Equipment shared by all clients
+        scheduler_name: "greedy" or "balanced"
+        duration_days: Length of scheduling period
+        default_start_date: Start date for clients without metadata.json
+        ledger: Existing ledger to extend (default: a new empty one)
+        schedule_file: Schedule file name; .ndjson/.jsonl and .gz suffixes pick the format
+
+    Yields:
+        Per-client summaries in scheduling order
+    """
+    names = _client_names(client_dirs, scheduler_name)
+    availability = _compile_availability(client_dirs, specialists, duration_days, default_start_date)
+    if ledger is None:
+        ledger = ResourceLedger()
+
+    for client_dir, name in zip(client_dirs, names):
+        yield _run_client(
+            Path(client_dir),
+            Path(output_root) / name,
+            specialists,
+            equipment,
+            availability,
+            scheduler_name,
+            duration_days,
+            default_start_date,
+            ledger,
+            schedule_file
+        )
@@ -0,0 +1,101 @@
+"""Lightweight booking record used inside the scheduling engine.
+
+Pydantic ``TimeSlot`` models validate every field on construction, which is
+wasted work for the thousands of bookings the schedulers create from inputs
+that were already validated at load time. ``Booking`` is a plain
+``__slots__`` record with the same read interface as ``TimeSlot`` (plus
+integer-minute accessors); it is converted to ``TimeSlot`` only when a
+schedule is exported or saved.
+"""
+
+from datetime import date as date_type, time as time_type
+from typing import Iterable, Optional, Tuple
+
+from models import TimeSlot
+from .times import from_minutes, to_minutes
+
+
+class Booking:
+    """A scheduled instance of an activity, with times in minutes since midnight."""
+
+    __slots__ = ("activity_id", "date", "start_min", "duration_minutes", "specialist_id", "equipment_ids")
+
+    def __init__(
+        self,
+        activity_id: str,
+        date: date_type,
+        start_min: int,
+        duration_minutes: int,
+        specialist_id: Optional[str] = None,
+        equipment_ids: Iterable[str] = ()
+    ):
+        self.activity_id = activity_id
+        self.date = date
+        self.start_min = start_min
+        self.duration_minutes = duration_minutes
+        self.specialist_id = specialist_id
+        self.equipment_ids: Tuple[str, ...] = tuple(equipment_ids)
+
+    @property
+    def end_min(self) -> int:
+        """End time in minutes since midnight (may exceed 1440 past midnight)."""
+        return self.start_min + self.duration_minutes
+
+    @property
+    def start_time(self) -> time_type:
+        """Start time as a time of day."""
+        return from_minutes(self.start_min)
+
+    @classmethod
+    def from_time_slot(cls, slot: TimeSlot) -> "Booking":
+        """Build a booking from a validated TimeSlot."""
+        return cls(
+            activity_id=slot.activity_id,
+            date=slot.date,
+            start_min=to_minutes(slot.start_time),
+            duration_minutes=slot.duration_minutes,
+            specialist_id=slot.specialist_id,
+            equipment_ids=slot.equipment_ids
+        )
+
+    def to_time_slot(self) -> TimeSlot:
+        """Convert to the public TimeSlot model."""
+        return TimeSlot(
+            activity_id=self.activity_id,
+            date=self.date,
+            start_time=self.start_time,
+            duration_minutes=self.duration_minutes,
+            specialist_id=self.specialist_id,
+            equipment_ids=list(self.equipment_ids)
+        )
+
+    def to_dict(self) -> dict:
+        """Serialize to the same JSON-ready dict as ``TimeSlot.model_dump(mode='json')``."""
+        return {
+            "activity_id": self.activity_id,
+            "date": self.date.isoformat(),
+            "start_time": self.start_time.isoformat(),
+            "duration_minutes": self.duration_minutes,
+            "specialist_id": self.specialist_id,
+            "equipment_ids": list(self.equipment_ids)
+        }
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Booking):
+            return NotImplemented
+        return (
+            self.activity_id == other.activity_id
+            and self.date == other.date
+            and self.start_min == other.start_min
+            and self.duration_minutes == other.duration_minutes
+            and self.specialist_id == other.specialist_id
+            and self.equipment_ids == other.equipment_ids
+        )
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (
+            f"Booking(activity_id={self.activity_id!r}, date={self.date}, "
+            f"start_time={self.start_time}, duration_minutes={self.duration_minutes})"
+        )
@@ -0,0 +1,56 @@
+"""Schedule changes accepted by incremental rescheduling.
+
+Each change describes one disruption to an existing schedule. The
+scheduler's ``reschedule`` applies it to its inputs, unbooks only the
+bookings it invalidates and re-places them.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date as date_type
+from typing import List, Union
+
+from models import Activity, MaintenanceWindow, TravelPeriod
+from .booking import Booking
+
+
+@dataclass
+class AddTravel:
+    """The client gained a travel period."""
+    travel: TravelPeriod
+
+
+@dataclass
+class SpecialistDayOff:
+    """A specialist is unavailable on a date (e.g. called in sick)."""
+    specialist_id: str
+    date: date_type
+
+
+@dataclass
+class AddMaintenance:
+    """A piece of equipment gained a maintenance window."""
+    equipment_id: str
+    window: MaintenanceWindow
+
+
+@dataclass
+class AddActivity:
+    """A new activity joined the program."""
+    activity: Activity
+
+
+@dataclass
+class RemoveActivity:
+    """An activity left the program."""
+    activity_id: str
+
+
+ScheduleChange = Union[AddTravel, SpecialistDayOff, AddMaintenance, AddActivity, RemoveActivity]
+
+
+@dataclass
+class RescheduleResult:
+    """Bookings touched by one reschedule."""
+    removed: List[Booking] = field(default_factory=list)
+    added: List[Booking] = field(default_factory=list)
+    unplaced: int = 0  # Invalidated occurrences that found no new slot
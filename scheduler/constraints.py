@@ -9,33 +9,121 @@ Hard constraints include:
 - Travel conflicts (remote-only activities during travel OR no scheduling during certain travel)
 - Time window constraints (activity must fit in specified window)
 - Time overlap detection (no double-booking)
+
+Times are handled as integer minutes since midnight; ``datetime.time`` values
+are only built for the violations reported back to callers.
+
+Schedulers reject far more candidate slots than they book, so a
+``ConstraintViolation`` stores a reason template and its arguments and only
+formats the message when ``reason`` is read.
 """
 
-from datetime import date as date_type, time as time_type, datetime, timedelta
-from typing import List, Optional, Dict, Set
 from dataclasses import dataclass
+from datetime import date as date_type, time as time_type, timedelta
+from time import perf_counter
+from typing import Callable, List, Optional, Dict, Tuple, TYPE_CHECKING
 
-from models import Activity, Specialist, Equipment, TravelPeriod, TimeSlot
+from models import Activity, Specialist, Equipment, MaintenanceWindow, TravelPeriod
+from .availability import SpecialistAvailability
+from .times import from_minutes, to_minutes
+
+if TYPE_CHECKING:
+    from .state import SchedulerState
 
 
-@dataclass
 class ConstraintViolation:
     """Represents a constraint violation with details."""
-    constraint_type: str  # "specialist", "equipment", "travel", "time_window", "overlap"
-    reason: str
-    activity_id: str
-    date: date_type
-    start_time: time_type
+
+    __slots__ = ("constraint_type", "activity_id", "date", "start_min", "resource", "template", "args")
+
+    def __init__(
+        self,
+        constraint_type: str,
+        activity_id: str,
+        date: date_type,
+        start_min: int,
+        template: str,
+        args: tuple = (),
+        resource: Optional[str] = None
+    ):
+        """Initialize a violation.
+
+        Args:
+            constraint_type: "specialist", "equipment", "travel", "time_window" or "overlap"
+            activity_id: The activity that couldn't be placed
+            date: Date of the rejected slot
+            start_min: Start of the rejected slot in minutes since midnight
+            template: ``str.format`` template for the reason; may also use
+                ``{date}`` and ``{start_time}``
+            args: Positional arguments for the template
+            resource: Specialist, equipment or travel location involved, if any
+        """
+        self.constraint_type = constraint_type
+        self.activity_id = activity_id
+        self.date = date
+        self.start_min = start_min
+        self.template = template
+        self.args = args
+        self.resource = resource
+
+    @property
+    def start_time(self) -> time_type:
+        """Start of the rejected slot as a time of day."""
+        return from_minutes(self.start_min)
+
+    @property
+    def reason(self) -> str:
+        """Human-readable explanation, formatted on access."""
+        return self.template.format(*self.args, date=self.date, start_time=self.start_time)
+
+    def __repr__(self) -> str:
+        return (
+            f"ConstraintViolation({self.constraint_type!r}, {self.activity_id!r}, "
+            f"{self.date}, {self.start_time}, {self.reason!r})"
+        )
+
+
+# Constraint names used in stats, in default evaluation order
+DATE_CHECKS = ("travel", "specialist_day", "equipment_day", "day_full")
+SLOT_CHECKS = ("overlap", "specialist", "specialist_capacity", "equipment")
+SPECIALIST_CHECKS = ("specialist", "specialist_capacity")
+EQUIPMENT_CHECKS = ("equipment",)
+
+# Per-slot checks between re-sorts of the evaluation order
+REORDER_INTERVAL = 1000
+
+
+@dataclass
+class ConstraintStats:
+    """How often one constraint was evaluated and how often it rejected."""
+    checks: int = 0
+    rejections: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rejection_rate(self) -> float:
+        """Fraction of evaluations that rejected the candidate."""
+        return self.rejections / self.checks if self.checks else 0.0
 
 
 class ConstraintChecker:
-    """Validates hard constraints for activity scheduling."""
+    """Validates hard constraints for activity scheduling.
+
+    Whole-day constraints run before any per-slot check. Per-slot checks
+    are re-ordered every ``REORDER_INTERVAL`` evaluations so the one that
+    has rejected most often runs first. A slot failing several constraints
+    is reported with whichever check rejected it first.
+    """
 
     def __init__(
         self,
         specialists: List[Specialist],
         equipment: List[Equipment],
-        travel_periods: List[TravelPeriod]
+        travel_periods: List[TravelPeriod],
+        start_date: Optional[date_type] = None,
+        end_date: Optional[date_type] = None,
+        timing: bool = False,
+        availability: Optional[Dict[str, SpecialistAvailability]] = None
     ):
         """Initialize constraint checker with resource data.
 
@@ -43,17 +131,103 @@ class ConstraintChecker:
             specialists: List of all specialists with availability
             equipment: List of all equipment with maintenance windows
             travel_periods: List of client travel periods
+            start_date: First day of the scheduling horizon (optional)
+            end_date: Last day of the scheduling horizon (optional)
+            timing: Also measure time spent per constraint (adds clock reads)
+            availability: Already compiled masks by specialist ID to reuse
+                (e.g. shared by several clients); missing ones are compiled
+        """
+        self.start_date = start_date
+        self.end_date = end_date
+        self.timing = timing
+        self.set_equipment(equipment)
+        self.set_travel_periods(travel_periods)
+        self.set_specialists(specialists, availability)
+        self.reset_stats()
+
+    def set_equipment(self, equipment: List[Equipment]) -> None:
+        """Replace the equipment and rebuild the per-date maintenance index.
+
+        Must be called whenever equipment or maintenance windows change.
+        The index maps (equipment ID, date) to (start_min, end_min, window)
+        for each window covering that date, in list order, so checks never
+        scan other dates' windows. All-day windows have None bounds.
+
+        Args:
+            equipment: List of all equipment with maintenance windows
         """
-        self.specialists = {s.id: s for s in specialists}
         self.equipment = {e.id: e for e in equipment}
+        self.maintenance: Dict[
+            Tuple[str, date_type], List[Tuple[Optional[int], Optional[int], MaintenanceWindow]]
+        ] = {}
+        for equip in equipment:
+            for window in equip.maintenance_windows:
+                entry = (window.start_min, window.end_min, window)
+                date = window.start_date
+                while date <= window.end_date:
+                    self.maintenance.setdefault((equip.id, date), []).append(entry)
+                    date += timedelta(days=1)
+
+    def set_travel_periods(self, travel_periods: List[TravelPeriod]) -> None:
+        """Replace the travel periods and rebuild the per-date travel lookup.
+
+        Must be called whenever travel changes. Only remote-only trips can
+        block an activity, so the lookup maps each date they cover to the
+        first such trip (in list order, as a linear scan would find it).
+
+        Args:
+            travel_periods: List of client travel periods
+        """
         self.travel_periods = travel_periods
+        self.remote_only_travel: Dict[date_type, TravelPeriod] = {}
+        for travel in travel_periods:
+            if not travel.remote_activities_only:
+                continue
+            date = travel.start_date
+            while date <= travel.end_date:
+                self.remote_only_travel.setdefault(date, travel)
+                date += timedelta(days=1)
+
+    def travel_blocks(self, activity: Activity, date: date_type) -> bool:
+        """Check whether a remote-only trip rules out an activity on a date.
+
+        Args:
+            activity: Activity to check
+            date: Date to check
+
+        Returns:
+            True if the activity is not remote-capable and the client is on
+            a remote-only trip that day
+        """
+        return not activity.remote_capable and date in self.remote_only_travel
+
+    def set_specialists(
+        self,
+        specialists: List[Specialist],
+        availability: Optional[Dict[str, SpecialistAvailability]] = None
+    ) -> None:
+        """Replace the specialists and recompile their availability masks.
+
+        Must be called whenever specialist availability or days off change.
+
+        Args:
+            specialists: List of all specialists with availability
+            availability: Already compiled masks by specialist ID to reuse
+                (e.g. shared by several clients); missing ones are compiled
+        """
+        availability = availability or {}
+        self.specialists = {s.id: s for s in specialists}
+        self.specialist_availability = {
+            s.id: availability.get(s.id) or SpecialistAvailability(s, self.start_date, self.end_date)
+            for s in specialists
+        }
 
     def check_time_slot(
         self,
         activity: Activity,
         date: date_type,
         start_time: time_type,
-        booked_slots: List[TimeSlot]
+        state: "SchedulerState"
     ) -> Optional[ConstraintViolation]:
         """Check if an activity can be scheduled at a specific time slot.
 
@@ -63,193 +237,453 @@ class ConstraintChecker:
             activity: The activity to schedule
             date: The date to schedule on
             start_time: The start time
-            booked_slots: Already scheduled time slots (for overlap checking)
+            state: Scheduler state holding existing bookings and their indexes
         """
+        start = to_minutes(start_time)
+
+        # Whole-day constraints first: travel, specialist day, equipment day
+        violation = self.check_date(activity, date)
+        if violation:
+            return violation
+
         # Check time window constraint
-        if activity.time_window_start and activity.time_window_end:
-            end_time = self._add_minutes_to_time(start_time, activity.duration_minutes)
+        if not self._fits_time_window(activity, start):
+            return self._time_window_violation(activity, date, start)
 
-            if start_time < activity.time_window_start or end_time > activity.time_window_end:
-                return ConstraintViolation(
-                    constraint_type="time_window",
-                    reason=f"Activity must be scheduled between {activity.time_window_start} and {activity.time_window_end}",
-                    activity_id=activity.id,
-                    date=date,
-                    start_time=start_time
-                )
+        return self._check_slot(activity, date, start, state, self._slot_checks(activity))
 
-        # Check time overlap
-        overlap = self._check_overlap(activity, date, start_time, booked_slots)
-        if overlap:
-            return overlap
+    def check_many(
+        self,
+        activity: Activity,
+        dates: List[date_type],
+        start_minutes: List[int],
+        state: "SchedulerState",
+        dates_checked: bool = False
+    ) -> List[List[Optional[ConstraintViolation]]]:
+        """Check an activity against a whole grid of candidate slots.
+
+        Gives the same result as calling ``check_time_slot`` for every
+        (date, start) pair, but whole-day constraints are evaluated once per
+        date (a blocked date rejects its entire row) and the time window
+        once per start.
 
-        # Check specialist availability
-        if activity.specialist_id:
-            violation = self._check_specialist(activity, date, start_time)
+        Args:
+            activity: The activity to schedule
+            dates: Candidate dates (rows)
+            start_minutes: Candidate start times in minutes since midnight (columns)
+            state: Scheduler state holding existing bookings and their indexes
+            dates_checked: The dates already passed ``prune_dates``; skip whole-day checks
+
+        Returns:
+            Matrix indexed [date][start]; None marks a valid slot
+        """
+        fits_window = [self._fits_time_window(activity, start) for start in start_minutes]
+        checks = self._slot_checks(activity)
+
+        matrix = []
+        for date in dates:
+            blocked = None if dates_checked else self.check_date(activity, date)
+            if blocked:
+                matrix.append([blocked] * len(start_minutes))
+                continue
+
+            row = []
+            for start, fits in zip(start_minutes, fits_window):
+                if not fits:
+                    row.append(self._time_window_violation(activity, date, start))
+                else:
+                    row.append(self._check_slot(activity, date, start, state, checks))
+
+            matrix.append(row)
+
+        return matrix
+
+    def check_date(self, activity: Activity, date: date_type) -> Optional[ConstraintViolation]:
+        """Check the constraints that reject a whole day, whatever the time.
+
+        Covers remote-only travel, the specialist being missing, off that
+        day or not working that weekday, and equipment being missing or under
+        all-day maintenance.
+
+        Args:
+            activity: The activity to schedule
+            date: The candidate date
+
+        Returns:
+            A violation if no time on that date can work, else None
+        """
+        for name, check in self._date_checks(activity):
+            stats = self.stats[name]
+            stats.checks += 1
+            if self.timing:
+                started = perf_counter()
+                violation = check(activity, date)
+                stats.seconds += perf_counter() - started
+            else:
+                violation = check(activity, date)
             if violation:
+                stats.rejections += 1
                 return violation
 
-        # Check equipment availability
+        return None
+
+    def prune_dates(
+        self,
+        activity: Activity,
+        dates: List[date_type],
+        start_minutes: List[int],
+        state: "SchedulerState"
+    ) -> Tuple[List[date_type], List[ConstraintViolation]]:
+        """Drop candidate dates on which the activity can't go at any time.
+
+        Runs the whole-day checks of ``check_date`` and also rejects dates
+        whose client calendar has no free gap of the activity's duration
+        between the first candidate start and the last candidate end.
+        Only the surviving dates need expanding into times.
+
+        Args:
+            activity: The activity to schedule
+            dates: Candidate dates in preference order
+            start_minutes: Candidate start times in minutes since midnight
+            state: Scheduler state holding existing bookings and their indexes
+
+        Returns:
+            (surviving dates in the same order, one violation per dropped date)
+        """
+        if not start_minutes:
+            return [], []
+
+        earliest = start_minutes[0]
+        latest_end = start_minutes[-1] + activity.duration_minutes
+        stats = self.stats["day_full"]
+
+        open_dates = []
+        blocked = []
+        for date in dates:
+            violation = self.check_date(activity, date)
+            if violation is None:
+                stats.checks += 1
+                if state.slot_index.next_free_gap(
+                    date, earliest, activity.duration_minutes, latest_end
+                ) is None:
+                    stats.rejections += 1
+                    violation = ConstraintViolation(
+                        "overlap", activity.id, date, earliest,
+                        "No free {0}-minute gap on {date} between {1} and {2}",
+                        (activity.duration_minutes, from_minutes(earliest), from_minutes(latest_end))
+                    )
+
+            if violation is None:
+                open_dates.append(date)
+            else:
+                blocked.append(violation)
+
+        return open_dates, blocked
+
+    def _date_checks(self, activity: Activity) -> List[Tuple[str, Callable]]:
+        """Whole-day checks that apply to an activity."""
+        checks = [("travel", self._check_travel)]
+        if activity.specialist_id:
+            checks.append(("specialist_day", self._check_specialist_day))
         if activity.equipment_ids:
-            violation = self._check_equipment(activity, date, start_time, booked_slots)
+            checks.append(("equipment_day", self._check_equipment_day))
+        return checks
+
+    def _slot_checks(self, activity: Activity) -> List[Tuple[str, Callable]]:
+        """Per-slot checks that apply to an activity, most selective first."""
+        return [
+            (name, check) for name, check in self._slot_order
+            if (name not in SPECIALIST_CHECKS or activity.specialist_id)
+            and (name not in EQUIPMENT_CHECKS or activity.equipment_ids)
+        ]
+
+    def _check_slot(
+        self,
+        activity: Activity,
+        date: date_type,
+        start: int,
+        state: "SchedulerState",
+        checks: List[Tuple[str, Callable]]
+    ) -> Optional[ConstraintViolation]:
+        """Run per-slot checks in order, stopping at the first violation."""
+        for name, check in checks:
+            stats = self.stats[name]
+            stats.checks += 1
+            if self.timing:
+                started = perf_counter()
+                violation = check(activity, date, start, state)
+                stats.seconds += perf_counter() - started
+            else:
+                violation = check(activity, date, start, state)
             if violation:
-                return violation
+                stats.rejections += 1
+                break
+        else:
+            violation = None
+
+        self._until_reorder -= 1
+        if self._until_reorder <= 0:
+            self._reorder_slot_checks()
+
+        return violation
+
+    def _reorder_slot_checks(self) -> None:
+        """Sort per-slot checks by measured rejection rate, highest first."""
+        self._slot_order.sort(key=lambda item: -self.stats[item[0]].rejection_rate)
+        self._until_reorder = REORDER_INTERVAL
+
+    def reset_stats(self) -> None:
+        """Zero the per-constraint counters and restore the default check order."""
+        self.stats = {name: ConstraintStats() for name in DATE_CHECKS + SLOT_CHECKS}
+        self._slot_order = [
+            ("overlap", self._check_overlap),
+            ("specialist", self._check_specialist),
+            ("specialist_capacity", self._check_specialist_capacity),
+            ("equipment", self._check_equipment),
+        ]
+        self._until_reorder = REORDER_INTERVAL
 
-        # Check travel conflicts
-        violation = self._check_travel(activity, date)
-        if violation:
-            return violation
+    def stats_report(self) -> Dict[str, Dict[str, float]]:
+        """Summarize how often each constraint ran and rejected.
+
+        Returns:
+            Constraint name -> checks, rejections, rejection_rate and seconds
+            (seconds is only measured while ``timing`` is enabled)
+        """
+        return {
+            name: {
+                "checks": stats.checks,
+                "rejections": stats.rejections,
+                "rejection_rate": stats.rejection_rate,
+                "seconds": stats.seconds,
+            }
+            for name, stats in self.stats.items()
+        }
+
+    def _fits_time_window(self, activity: Activity, start: int) -> bool:
+        """Check that the activity starts and ends inside its time window.
+
+        An activity running past midnight never fits a same-day window.
+        """
+        if activity.window_start_min is None or activity.window_end_min is None:
+            return True
 
-        return None  # All constraints satisfied
+        return (
+            activity.window_start_min <= start
+            and start + activity.duration_minutes <= activity.window_end_min
+        )
+
+    def _time_window_violation(
+        self,
+        activity: Activity,
+        date: date_type,
+        start: int
+    ) -> ConstraintViolation:
+        """Build the violation for a slot outside the activity's time window."""
+        return ConstraintViolation(
+            "time_window", activity.id, date, start,
+            "Activity must be scheduled between {0.time_window_start} and {0.time_window_end}",
+            (activity,)
+        )
 
     def _check_overlap(
         self,
         activity: Activity,
         date: date_type,
-        start_time: time_type,
-        booked_slots: List[TimeSlot]
+        start: int,
+        state: "SchedulerState"
     ) -> Optional[ConstraintViolation]:
-        """Check if activity overlaps with any existing bookings."""
-        end_time = self._add_minutes_to_time(start_time, activity.duration_minutes)
+        """Check if activity overlaps with any existing bookings.
 
-        for slot in booked_slots:
-            if slot.date != date:
-                continue
+        The client's occupancy grid answers the common free case with one
+        slice test; only busy buckets fall through to the per-date interval
+        index, which also names the conflicting slot.
+        """
+        end = start + activity.duration_minutes
 
-            slot_end = self._add_minutes_to_time(slot.start_time, slot.duration_minutes)
+        if state.client_occupancy.is_free(date, start, end):
+            return None
 
-            # Check for overlap: (start1 < end2) AND (start2 < end1)
-            if start_time < slot_end and slot.start_time < end_time:
-                return ConstraintViolation(
-                    constraint_type="overlap",
-                    reason=f"Overlaps with {slot.activity_id} at {slot.start_time}",
-                    activity_id=activity.id,
-                    date=date,
-                    start_time=start_time
-                )
+        slot = state.slot_index.find_overlap(date, start, end)
+
+        if slot is not None:
+            return ConstraintViolation(
+                "overlap", activity.id, date, start,
+                "Overlaps with {0.activity_id} at {0.start_time}",
+                (slot,)
+            )
 
         return None
 
+    def _check_specialist_day(
+        self,
+        activity: Activity,
+        date: date_type
+    ) -> Optional[ConstraintViolation]:
+        """Check the specialist exists, isn't off that day and works that weekday."""
+        specialist = self.specialists.get(activity.specialist_id)
+        if not specialist:
+            return ConstraintViolation(
+                "specialist", activity.id, date, 0,
+                "Specialist {0} not found",
+                (activity.specialist_id,), activity.specialist_id
+            )
+
+        availability = self.specialist_availability[specialist.id]
+        if date in availability.days_off:
+            template = "{0} is unavailable on {date} (day off)"
+        elif not availability.weekly[date.weekday()][0]:
+            template = "{0} doesn't work on {date:%A}s"
+        else:
+            return None
+
+        return ConstraintViolation(
+            "specialist", activity.id, date, 0,
+            template, (specialist.name,), specialist.id
+        )
+
     def _check_specialist(
         self,
         activity: Activity,
         date: date_type,
-        start_time: time_type
+        start: int,
+        state: Optional["SchedulerState"] = None
     ) -> Optional[ConstraintViolation]:
-        """Check if specialist is available at the given time."""
+        """Check if specialist is available at the given time.
+
+        Uses the availability mask compiled in ``set_specialists``; the
+        slower reason lookup only runs once the slot is known to be invalid.
+        """
         specialist = self.specialists.get(activity.specialist_id)
         if not specialist:
             return ConstraintViolation(
-                constraint_type="specialist",
-                reason=f"Specialist {activity.specialist_id} not found",
-                activity_id=activity.id,
-                date=date,
-                start_time=start_time
+                "specialist", activity.id, date, start,
+                "Specialist {0} not found",
+                (activity.specialist_id,), activity.specialist_id
             )
 
+        availability = self.specialist_availability[specialist.id]
+        if availability.covers(date, start, start + activity.duration_minutes):
+            return None  # Fits inside a merged availability block
+
         # Check if on a day off
-        if date in specialist.days_off:
-            return ConstraintViolation(
-                constraint_type="specialist",
-                reason=f"{specialist.name} is unavailable on {date} (day off)",
-                activity_id=activity.id,
-                date=date,
-                start_time=start_time
-            )
+        if date in availability.days_off:
+            template = "{0} is unavailable on {date} (day off)"
 
         # Check day of week availability
-        day_of_week = date.weekday()  # 0=Monday, 6=Sunday
-        available_blocks = [
-            block for block in specialist.availability
-            if block.day_of_week == day_of_week
-        ]
+        elif not availability.weekly[date.weekday()][0]:
+            template = "{0} doesn't work on {date:%A}s"
 
-        if not available_blocks:
+        else:
+            template = "{0} not available at {start_time} on {date:%A}s"
+
+        return ConstraintViolation(
+            "specialist", activity.id, date, start,
+            template, (specialist.name,), specialist.id
+        )
+
+    def _check_specialist_capacity(
+        self,
+        activity: Activity,
+        date: date_type,
+        start: int,
+        state: "SchedulerState"
+    ) -> Optional[ConstraintViolation]:
+        """Check the specialist's concurrent client limit across all clients.
+
+        Slot checks are reordered by rejection rate, so this may run before
+        ``_check_specialist`` and reports an unknown specialist itself.
+        """
+        specialist = self.specialists.get(activity.specialist_id)
+        if not specialist:
             return ConstraintViolation(
-                constraint_type="specialist",
-                reason=f"{specialist.name} doesn't work on {date.strftime('%A')}s",
-                activity_id=activity.id,
-                date=date,
-                start_time=start_time
+                "specialist", activity.id, date, start,
+                "Specialist {0} not found",
+                (activity.specialist_id,), activity.specialist_id
             )
 
-        # Check if activity fits within any availability block
-        end_time = self._add_minutes_to_time(start_time, activity.duration_minutes)
-
-        for block in available_blocks:
-            if block.start_time <= start_time and end_time <= block.end_time:
-                return None  # Found a valid block
+        if state.ledger.specialist_has_capacity(
+            specialist.id, date, start, start + activity.duration_minutes,
+            specialist.max_concurrent_clients
+        ):
+            return None
 
         return ConstraintViolation(
-            constraint_type="specialist",
-            reason=f"{specialist.name} not available at {start_time} on {date.strftime('%A')}s",
-            activity_id=activity.id,
-            date=date,
-            start_time=start_time
+            "specialist", activity.id, date, start,
+            "{0.name} at capacity ({0.max_concurrent_clients} clients)",
+            (specialist,), specialist.id
         )
 
+    def _check_equipment_day(
+        self,
+        activity: Activity,
+        date: date_type
+    ) -> Optional[ConstraintViolation]:
+        """Check all required equipment exists and none is under all-day maintenance."""
+        for equip_id in activity.equipment_ids:
+            equip = self.equipment.get(equip_id)
+            if not equip:
+                return ConstraintViolation(
+                    "equipment", activity.id, date, 0,
+                    "Equipment {0} not found",
+                    (equip_id,), equip_id
+                )
+
+            for window_start, window_end, _ in self.maintenance.get((equip_id, date), ()):
+                if window_start is None or window_end is None:
+                    return ConstraintViolation(
+                        "equipment", activity.id, date, 0,
+                        "{0} under maintenance on {date}",
+                        (equip.name,), equip_id
+                    )
+
+        return None
+
     def _check_equipment(
         self,
         activity: Activity,
         date: date_type,
-        start_time: time_type,
-        booked_slots: List[TimeSlot]
+        start: int,
+        state: "SchedulerState"
     ) -> Optional[ConstraintViolation]:
         """Check if all required equipment is available."""
-        end_time = self._add_minutes_to_time(start_time, activity.duration_minutes)
+        end = start + activity.duration_minutes
 
         for equip_id in activity.equipment_ids:
             equip = self.equipment.get(equip_id)
             if not equip:
                 return ConstraintViolation(
-                    constraint_type="equipment",
-                    reason=f"Equipment {equip_id} not found",
-                    activity_id=activity.id,
-                    date=date,
-                    start_time=start_time
+                    "equipment", activity.id, date, start,
+                    "Equipment {0} not found",
+                    (equip_id,), equip_id
                 )
 
-            # Check maintenance windows
-            for window in equip.maintenance_windows:
-                if window.start_date <= date <= window.end_date:
-                    # If no specific times, maintenance is all day
-                    if window.start_time is None or window.end_time is None:
-                        return ConstraintViolation(
-                            constraint_type="equipment",
-                            reason=f"{equip.name} under maintenance on {date}",
-                            activity_id=activity.id,
-                            date=date,
-                            start_time=start_time
-                        )
-
-                    # Check time overlap with maintenance
-                    if start_time < window.end_time and window.start_time < end_time:
-                        return ConstraintViolation(
-                            constraint_type="equipment",
-                            reason=f"{equip.name} under maintenance {window.start_time}-{window.end_time}",
-                            activity_id=activity.id,
-                            date=date,
-                            start_time=start_time
-                        )
-
-            # Check concurrent usage limit
-            concurrent_count = sum(
-                1 for slot in booked_slots
-                if equip_id in slot.equipment_ids
-                and slot.date == date
-                and self._times_overlap(
-                    start_time, end_time,
-                    slot.start_time, self._add_minutes_to_time(slot.start_time, slot.duration_minutes)
-                )
-            )
+            # Check maintenance windows on this date
+            for window_start, window_end, window in self.maintenance.get((equip_id, date), ()):
+                # If no specific times, maintenance is all day
+                if window_start is None or window_end is None:
+                    return ConstraintViolation(
+                        "equipment", activity.id, date, start,
+                        "{0} under maintenance on {date}",
+                        (equip.name,), equip_id
+                    )
+
+                # Check time overlap with maintenance
+                if start < window_end and window_start < end:
+                    return ConstraintViolation(
+                        "equipment", activity.id, date, start,
+                        "{0} under maintenance {1.start_time}-{1.end_time}",
+                        (equip.name, window), equip_id
+                    )
 
-            if concurrent_count >= equip.max_concurrent_users:
+            # Check concurrent usage limit across every client sharing the ledger
+            if not state.ledger.equipment_has_capacity(
+                equip_id, date, start, end, equip.max_concurrent_users
+            ):
                 return ConstraintViolation(
-                    constraint_type="equipment",
-                    reason=f"{equip.name} at capacity ({equip.max_concurrent_users} users)",
-                    activity_id=activity.id,
-                    date=date,
-                    start_time=start_time
+                    "equipment", activity.id, date, start,
+                    "{0.name} at capacity ({0.max_concurrent_users} users)",
+                    (equip,), equip_id
                 )
 
         return None
@@ -259,33 +693,19 @@ class ConstraintChecker:
         activity: Activity,
         date: date_type
     ) -> Optional[ConstraintViolation]:
-        """Check if travel conflicts with activity scheduling."""
-        for travel in self.travel_periods:
-            if travel.start_date <= date <= travel.end_date:
-                # If travel requires remote-only, check if activity supports it
-                if travel.remote_activities_only and not activity.remote_capable:
-                    return ConstraintViolation(
-                        constraint_type="travel",
-                        reason=f"Traveling to {travel.location} (remote-only), activity not remote-capable",
-                        activity_id=activity.id,
-                        date=date,
-                        start_time=time_type(0, 0)  # Placeholder
-                    )
+        """Check if travel conflicts with activity scheduling.
 
-        return None
+        A single lookup in the per-date table built by ``set_travel_periods``.
+        """
+        if activity.remote_capable:
+            return None
 
-    def _add_minutes_to_time(self, t: time_type, minutes: int) -> time_type:
-        """Add minutes to a time object, handling day overflow."""
-        dt = datetime.combine(date_type.today(), t)
-        dt += timedelta(minutes=minutes)
-        return dt.time()
+        travel = self.remote_only_travel.get(date)
+        if travel is None:
+            return None
 
-    def _times_overlap(
-        self,
-        start1: time_type,
-        end1: time_type,
-        start2: time_type,
-        end2: time_type
-    ) -> bool:
-        """Check if two time ranges overlap."""
-        return start1 < end2 and start2 < end1
+        return ConstraintViolation(
+            "travel", activity.id, date, 0,  # Applies to the whole day
+            "Traveling to {0} (remote-only), activity not remote-capable",
+            (travel.location,), travel.location
+        )
@@ -15,14 +15,22 @@ Algorithm guarantees:
 - Deterministic output (no randomness or LLM involvement)
 """
 
-from datetime import date as date_type, time as time_type, datetime, timedelta
-from typing import List, Optional, Tuple
+from datetime import date as date_type, timedelta
+from typing import Dict, List, Optional, Tuple
 import logging
 
-from models import Activity, Specialist, Equipment, TravelPeriod, TimeSlot, FrequencyPattern
+from models import Activity, Specialist, Equipment, TravelPeriod, FrequencyPattern
+from .changes import (
+    AddActivity, AddMaintenance, AddTravel, RemoveActivity, RescheduleResult,
+    ScheduleChange, SpecialistDayOff
+)
+from .availability import SpecialistAvailability
 from .constraints import ConstraintChecker
 from .scoring import SlotScorer
+from .booking import Booking
+from .ledger import ResourceLedger
 from .state import SchedulerState
+from .times import MINUTES_PER_DAY, from_minutes
 
 
 logger = logging.getLogger(__name__)
@@ -38,7 +46,10 @@ class GreedyScheduler:
         equipment: List[Equipment],
         travel_periods: List[TravelPeriod],
         start_date: date_type,
-        duration_days: int = 90
+        duration_days: int = 90,
+        ledger: Optional[ResourceLedger] = None,
+        elapsed_days: int = 0,
+        availability: Optional[Dict[str, SpecialistAvailability]] = None
     ):
         """Initialize scheduler with activities and constraints.
 
@@ -49,16 +60,25 @@ class GreedyScheduler:
             travel_periods: List of client travel periods
             start_date: First day of scheduling horizon
             duration_days: Length of scheduling period (default 90 days)
+            ledger: Specialist/equipment ledger shared with other clients (optional)
+            elapsed_days: Days of the program already scheduled before start_date
+                (rolling mode); required occurrences are this window's share
+            availability: Compiled specialist availability to reuse instead of
+                compiling it again, e.g. from ``load_problem`` (optional)
         """
         self.activities = activities
         self.start_date = start_date
         self.end_date = start_date + timedelta(days=duration_days - 1)
         self.duration_days = duration_days
+        self.elapsed_days = elapsed_days
 
         # Initialize components
-        self.checker = ConstraintChecker(specialists, equipment, travel_periods)
+        self.checker = ConstraintChecker(
+            specialists, equipment, travel_periods, self.start_date, self.end_date,
+            availability=availability
+        )
         self.scorer = SlotScorer()
-        self.state = SchedulerState()
+        self.state = SchedulerState(ledger)
 
     def schedule(self) -> SchedulerState:
         """Execute greedy scheduling algorithm with backfill.
@@ -91,6 +111,187 @@ class GreedyScheduler:
 
         return self.state
 
+    def reschedule(self, change: ScheduleChange) -> RescheduleResult:
+        """Apply one change to an already scheduled calendar.
+
+        Only bookings the change invalidates are unbooked; each is re-placed
+        using the candidate dates of the occurrence it filled. All other
+        bookings stay exactly where they are.
+
+        Args:
+            change: The disruption to apply (see ``scheduler.changes``)
+
+        Returns:
+            Bookings removed and added by the change
+        """
+        result = RescheduleResult()
+        activities = {a.id: a for a in self.activities}
+
+        if isinstance(change, AddActivity):
+            if change.activity.id in activities:
+                raise ValueError(f"Activity {change.activity.id} is already scheduled")
+            self.activities = self.activities + [change.activity]
+            booked_before = len(self.state.booked_slots)
+            self._schedule_activity(change.activity)
+            result.added = self.state.booked_slots[booked_before:]
+            return result
+
+        if isinstance(change, RemoveActivity):
+            activity = activities.get(change.activity_id)
+            if activity is None:
+                raise ValueError(f"Unknown activity {change.activity_id}")
+            self.activities = [a for a in self.activities if a.id != activity.id]
+            for slot in self.state.get_slots_for_activity(activity.id):
+                self._unbook(activity, slot)
+                result.removed.append(slot)
+            self.state.failed_activities.pop(activity.id, None)
+            return result
+
+        invalidated = self._apply_change(change, activities)
+
+        # Free every invalidated slot before re-placing any of them
+        for slot in invalidated:
+            self._unbook(activities[slot.activity_id], slot)
+        result.removed = invalidated
+
+        for slot in sorted(
+            invalidated,
+            key=lambda s: (activities[s.activity_id].priority, s.date, s.start_min)
+        ):
+            activity = activities[slot.activity_id]
+            occurrence_index = self._occurrence_index_for_date(activity, slot.date)
+            new_slot = self._find_best_slot(activity, occurrence_index)
+
+            if new_slot:
+                result.added.append(self.state.add_booking(new_slot))
+                self.scorer.record_booking(activity, new_slot.date)
+            else:
+                result.unplaced += 1
+
+        logger.info(
+            f"Rescheduled {type(change).__name__}: {len(result.removed)} removed, "
+            f"{len(result.added)} re-placed, {result.unplaced} unplaced"
+        )
+        return result
+
+    def _apply_change(
+        self,
+        change: ScheduleChange,
+        activities: Dict[str, Activity]
+    ) -> List[Booking]:
+        """Update the constraint data for a change and find the bookings it breaks.
+
+        Only dates the change touches are inspected, through the per-date
+        booking index.
+
+        Args:
+            change: A travel, specialist day off or maintenance change
+            activities: Scheduled activities by ID
+
+        Returns:
+            Invalidated bookings in calendar order
+        """
+        checker = self.checker
+
+        if isinstance(change, AddTravel):
+            travel = change.travel
+            checker.set_travel_periods(checker.travel_periods + [travel])
+            dates = self._dates_between(travel.start_date, travel.end_date)
+            return [
+                slot for date in dates for _, _, slot in self.state.slot_index.intervals(date)
+                if checker.travel_blocks(activities[slot.activity_id], date)
+            ]
+
+        if isinstance(change, SpecialistDayOff):
+            specialist = checker.specialists.get(change.specialist_id)
+            if specialist is None:
+                raise ValueError(f"Unknown specialist {change.specialist_id}")
+            updated = specialist.model_copy(
+                update={"days_off": specialist.days_off + [change.date]}
+            )
+            # Only the changed specialist's availability is recompiled
+            checker.set_specialists(
+                [updated if s.id == updated.id else s for s in checker.specialists.values()],
+                {
+                    spec_id: availability
+                    for spec_id, availability in checker.specialist_availability.items()
+                    if spec_id != updated.id
+                }
+            )
+            return [
+                slot for _, _, slot in self.state.slot_index.intervals(change.date)
+                if slot.specialist_id == updated.id
+            ]
+
+        if isinstance(change, AddMaintenance):
+            equip = checker.equipment.get(change.equipment_id)
+            if equip is None:
+                raise ValueError(f"Unknown equipment {change.equipment_id}")
+            window = change.window
+            updated = equip.model_copy(
+                update={"maintenance_windows": equip.maintenance_windows + [window]}
+            )
+            checker.set_equipment(
+                [updated if e.id == updated.id else e for e in checker.equipment.values()]
+            )
+            all_day = window.start_min is None or window.end_min is None
+            dates = self._dates_between(window.start_date, window.end_date)
+            return [
+                slot for date in dates for start, end, slot in self.state.slot_index.intervals(date)
+                if equip.id in slot.equipment_ids
+                and (all_day or (start < window.end_min and window.start_min < end))
+            ]
+
+        raise TypeError(f"Unsupported schedule change: {type(change).__name__}")
+
+    def _unbook(self, activity: Activity, slot: Booking) -> None:
+        """Remove a booking from the state and the scorer's counters."""
+        if self.state.remove_booking(slot):
+            self.scorer.unrecord_booking(activity, slot.date)
+
+    def _dates_between(self, first: date_type, last: date_type) -> List[date_type]:
+        """List the horizon dates from `first` to `last` inclusive."""
+        first = max(first, self.start_date)
+        last = min(last, self.end_date)
+        return [first + timedelta(days=offset) for offset in range((last - first).days + 1)]
+
+    def _occurrence_index_for_date(self, activity: Activity, date: date_type) -> int:
+        """Map a booked date back to the occurrence whose candidates produced it.
+
+        Inverse of the primary date choice in ``_generate_candidate_dates``.
+
+        Args:
+            activity: The booked activity
+            date: The date it was booked on
+
+        Returns:
+            Occurrence index (0-indexed)
+        """
+        freq = activity.frequency
+        offset = (date - self.start_date).days
+
+        if freq.pattern == FrequencyPattern.DAILY:
+            return offset
+
+        elif freq.pattern == FrequencyPattern.WEEKLY:
+            week_number = offset // 7
+            for within_week_index in range(freq.count):
+                if freq.preferred_days:
+                    target_weekday = freq.preferred_days[within_week_index % len(freq.preferred_days)]
+                else:
+                    target_weekday = within_week_index % 5
+                if target_weekday == date.weekday():
+                    return week_number * freq.count + within_week_index
+            return week_number * freq.count
+
+        elif freq.pattern == FrequencyPattern.MONTHLY:
+            return (offset // 30) * freq.count
+
+        elif freq.pattern == FrequencyPattern.CUSTOM and freq.interval_days:
+            return offset // freq.interval_days
+
+        return 0
+
     def _sort_activities(self, activities: List[Activity]) -> List[Activity]:
         """Sort activities by priority (ASC) then frequency importance (DESC).
 
@@ -142,28 +343,39 @@ class GreedyScheduler:
     def _calculate_required_occurrences(self, activity: Activity) -> int:
         """Calculate how many times an activity should be scheduled.
 
+        In rolling mode this is the difference between the occurrences due by
+        the end of this window and those due before it, so windows of any
+        length add up to the same total as one long horizon.
+
         Args:
             activity: The activity to calculate for
 
         Returns:
             Number of required occurrences over the scheduling horizon
         """
+        due = self._occurrences_due(activity, self.elapsed_days + self.duration_days)
+        if self.elapsed_days:
+            due -= self._occurrences_due(activity, self.elapsed_days)
+        return due
+
+    def _occurrences_due(self, activity: Activity, days: int) -> int:
+        """Count the occurrences an activity needs over its first `days` program days."""
         freq = activity.frequency
 
         if freq.pattern == FrequencyPattern.DAILY:
-            return self.duration_days
+            return days
 
         elif freq.pattern == FrequencyPattern.WEEKLY:
-            weeks = self.duration_days // 7
+            weeks = days // 7
             return weeks * freq.count
 
         elif freq.pattern == FrequencyPattern.MONTHLY:
-            months = self.duration_days // 30  # Approximate
+            months = days // 30  # Approximate
             return months * freq.count
 
         elif freq.pattern == FrequencyPattern.CUSTOM:
             if freq.interval_days:
-                return self.duration_days // freq.interval_days
+                return days // freq.interval_days
             else:
                 return freq.count  # Fallback
 
@@ -173,7 +385,7 @@ class GreedyScheduler:
         self,
         activity: Activity,
         occurrence_index: int
-    ) -> Optional[TimeSlot]:
+    ) -> Optional[Booking]:
         """Find the best available time slot for an activity occurrence.
 
         Args:
@@ -181,53 +393,91 @@ class GreedyScheduler:
             occurrence_index: Which occurrence (0-indexed)
 
         Returns:
-            TimeSlot if successful, None if no valid slot found
+            Booking if successful, None if no valid slot found
         """
-        candidate_slots = self._generate_candidate_slots(activity, occurrence_index)
-
-        # Score all candidates
-        scored_slots = []
-        for date, start_time in candidate_slots:
-            # Check hard constraints
-            violation = self.checker.check_time_slot(
-                activity, date, start_time, self.state.booked_slots
-            )
+        candidate_dates = self._generate_candidate_dates(activity, occurrence_index)
+        best = self._evaluate_candidates(activity, candidate_dates, record_failures=True)
 
-            if violation is None:  # Valid slot
-                score = self.scorer.score_slot(
-                    activity, date, start_time, self.state.booked_slots
-                )
-                scored_slots.append((score, date, start_time))
-            else:
-                # Record violation for failure tracking
-                self.state.record_failure(activity, violation)
-
-        if not scored_slots:
+        if best is None:
             logger.debug(f"    No valid slots found for {activity.id} occurrence {occurrence_index}")
             return None
 
-        # Sort by score (descending) and take best
-        scored_slots.sort(reverse=True, key=lambda x: x[0])
-        best_score, best_date, best_time = scored_slots[0]
+        best_score, best_date, best_start = best
 
-        logger.debug(f"    Selected slot with score {best_score:.1f}: {best_date} at {best_time}")
+        logger.debug(f"    Selected slot with score {best_score:.1f}: {best_date} at {from_minutes(best_start)}")
 
-        # Create TimeSlot
-        return TimeSlot(
+        # Create booking
+        return Booking(
             activity_id=activity.id,
             date=best_date,
-            start_time=best_time,
+            start_min=best_start,
             duration_minutes=activity.duration_minutes,
             specialist_id=activity.specialist_id,
-            equipment_ids=activity.equipment_ids or []
+            equipment_ids=activity.equipment_ids
         )
 
-    def _generate_candidate_slots(
+    def _evaluate_candidates(
+        self,
+        activity: Activity,
+        candidate_dates: List[date_type],
+        record_failures: bool = False
+    ) -> Optional[Tuple[float, date_type, int]]:
+        """Check and score every candidate time on the given dates.
+
+        Dates blocked for the whole day are dropped first (each recorded as
+        one failure per candidate time, as if expanded); constraint checks and scores for the rest are computed
+        as whole date x time grids. The best slot is the first highest-scoring
+        valid cell in date order.
+
+        Args:
+            activity: The activity to schedule
+            candidate_dates: Dates to try, in preference order
+            record_failures: Whether to record violations for failure tracking
+
+        Returns:
+            (score, date, start minute) of the best valid slot, or None
+        """
+        start_minutes = self._generate_start_minutes(activity)
+
+        # Only expand dates where the activity could go at some time
+        candidate_dates, blocked = self.checker.prune_dates(
+            activity, candidate_dates, start_minutes, self.state
+        )
+        if record_failures:
+            for violation in blocked:
+                self.state.record_failure(activity, violation, len(start_minutes))
+
+        violations = self.checker.check_many(
+            activity, candidate_dates, start_minutes, self.state, dates_checked=True
+        )
+
+        valid_rows = [
+            i for i, row in enumerate(violations)
+            if any(violation is None for violation in row)
+        ]
+        scores = self.scorer.score_many(
+            activity, [candidate_dates[i] for i in valid_rows], start_minutes
+        )
+        row_scores = dict(zip(valid_rows, scores))
+
+        best = None
+        for i, row in enumerate(violations):
+            for j, violation in enumerate(row):
+                if violation is None:
+                    score = row_scores[i][j]
+                    if best is None or score > best[0]:
+                        best = (score, candidate_dates[i], start_minutes[j])
+                elif record_failures:
+                    self.state.record_failure(activity, violation)
+
+        return best
+
+    def _generate_candidate_dates(
         self,
         activity: Activity,
         occurrence_index: int
-    ) -> List[Tuple[date_type, time_type]]:
-        """Generate candidate (date, time) pairs for an activity occurrence.
+    ) -> List[date_type]:
+        """Generate candidate dates for an activity occurrence.
 
         IMPROVED STRATEGY with flexible date selection:
         - Generate primary candidates based on occurrence pattern
@@ -239,10 +489,9 @@ class GreedyScheduler:
             occurrence_index: Which occurrence (0-indexed)
 
         Returns:
-            List of (date, start_time) tuples to try
+            List of dates to try, in preference order
         """
         freq = activity.frequency
-        candidates = []
         candidate_dates = []
 
         # Generate candidate dates based on frequency pattern
@@ -305,58 +554,46 @@ class GreedyScheduler:
         if activity.priority >= 3:
             candidate_dates = self._sort_dates_by_lightness(candidate_dates)
 
-        # Generate time slots for all candidate dates
-        for candidate_date in candidate_dates:
-            candidates.extend(self._generate_times_for_date(activity, candidate_date))
+        return candidate_dates
 
-        return candidates
+    def _generate_start_minutes(self, activity: Activity) -> List[int]:
+        """Generate candidate start times (minutes since midnight) for an activity.
 
-    def _generate_times_for_date(
-        self,
-        activity: Activity,
-        date: date_type
-    ) -> List[Tuple[date_type, time_type]]:
-        """Generate candidate times for a specific date.
+        The same times are tried on every candidate date.
 
         Args:
             activity: The activity to generate times for
-            date: The date to generate times on
 
         Returns:
-            List of (date, time) pairs
+            List of start minutes in ascending order
         """
-        times = []
+        starts = []
 
         # If activity has time window, generate times within it
         if activity.time_window_start and activity.time_window_end:
-            start_hour = activity.time_window_start.hour
-            end_hour = activity.time_window_end.hour
+            window_start = activity.window_start_min
+            window_end = activity.window_end_min
 
             # Generate hourly slots within window
-            for hour in range(start_hour, end_hour + 1):
+            for hour in range(window_start // 60, window_end // 60 + 1):
                 for minute in [0, 30]:  # Try on the hour and half-hour
-                    candidate_time = time_type(hour, minute)
+                    start = hour * 60 + minute
 
-                    # Check if this time fits within window
-                    if activity.time_window_start <= candidate_time:
-                        # Check if activity finishes before window end
-                        end_time = self._add_minutes_to_time(candidate_time, activity.duration_minutes)
-                        if end_time <= activity.time_window_end:
-                            times.append((date, candidate_time))
+                    # Check the activity starts and finishes inside the window
+                    if window_start <= start and start + activity.duration_minutes <= window_end:
+                        starts.append(start)
 
         else:
             # No time window - generate times across reasonable hours (6 AM - 8 PM)
             for hour in range(6, 21):  # 6 AM to 8 PM
                 for minute in [0, 30]:
-                    times.append((date, time_type(hour, minute)))
+                    start = hour * 60 + minute
 
-        return times
+                    # Bookings can't run past midnight into the next date
+                    if start + activity.duration_minutes <= MINUTES_PER_DAY:
+                        starts.append(start)
 
-    def _add_minutes_to_time(self, t: time_type, minutes: int) -> time_type:
-        """Add minutes to a time object."""
-        dt = datetime.combine(date_type.today(), t)
-        dt += timedelta(minutes=minutes)
-        return dt.time()
+        return starts
 
     def _sort_dates_by_lightness(self, dates: List[date_type]) -> List[date_type]:
         """Sort dates by how many activities are already scheduled (ascending).
@@ -369,13 +606,7 @@ class GreedyScheduler:
         Returns:
             Sorted list with lightest days first
         """
-        from collections import Counter
-
-        # Count activities per day
-        activity_counts = Counter(slot.date for slot in self.state.booked_slots)
-
-        # Sort dates by count (ascending - lightest first)
-        return sorted(dates, key=lambda d: activity_counts.get(d, 0))
+        return self.state.get_lightest_days(dates)
 
     def _backfill_failed_activities(self, sorted_activities: List[Activity]) -> int:
         """Attempt to schedule failed activities on the lightest days.
@@ -407,42 +638,26 @@ class GreedyScheduler:
 
             # Try to schedule missing occurrences on light days
             for _ in range(missing):
-                # Generate candidates from light days only
-                candidates = []
-                for light_day in light_days:
-                    candidates.extend(self._generate_times_for_date(activity, light_day))
-
-                # Try to book best valid slot
-                scored_slots = []
-                for date, start_time in candidates:
-                    violation = self.checker.check_time_slot(
-                        activity, date, start_time, self.state.booked_slots
-                    )
-
-                    if violation is None:
-                        score = self.scorer.score_slot(
-                            activity, date, start_time, self.state.booked_slots
-                        )
-                        scored_slots.append((score, date, start_time))
+                # Try to book best valid slot on light days only
+                best = self._evaluate_candidates(activity, light_days)
 
-                if scored_slots:
+                if best is not None:
                     # Book best slot
-                    scored_slots.sort(reverse=True, key=lambda x: x[0])
-                    _, best_date, best_time = scored_slots[0]
+                    _, best_date, best_start = best
 
-                    slot = TimeSlot(
+                    slot = Booking(
                         activity_id=activity.id,
                         date=best_date,
-                        start_time=best_time,
+                        start_min=best_start,
                         duration_minutes=activity.duration_minutes,
                         specialist_id=activity.specialist_id,
-                        equipment_ids=activity.equipment_ids or []
+                        equipment_ids=activity.equipment_ids
                     )
 
                     self.state.add_booking(slot)
                     self.scorer.record_booking(activity, slot.date)
                     backfilled_count += 1
-                    logger.debug(f"  ✓ Backfilled on {best_date} at {best_time}")
+                    logger.debug(f"  ✓ Backfilled on {best_date} at {slot.start_time}")
 
                     # Update light_days list to reflect new booking
                     light_days = self._find_light_days(max_activities=15)
@@ -461,23 +676,10 @@ class GreedyScheduler:
         Returns:
             List of dates sorted by activity count (lightest first)
         """
-        from collections import Counter
-
-        # Count activities per day
-        activity_counts = Counter(slot.date for slot in self.state.booked_slots)
-
-        # Generate all days in horizon
-        all_days = []
-        current_date = self.start_date
-        while current_date <= self.end_date:
-            all_days.append(current_date)
-            current_date += timedelta(days=1)
-
-        # Filter to light days and sort by lightness
-        light_days = [
-            day for day in all_days
-            if activity_counts.get(day, 0) < max_activities
+        all_days = [
+            self.start_date + timedelta(days=offset)
+            for offset in range(self.duration_days)
         ]
 
-        # Sort by activity count (ascending - lightest first)
-        return sorted(light_days, key=lambda d: activity_counts.get(d, 0))
+        # Filter to light days and sort by lightness (lightest first)
+        return self.state.get_lightest_days(all_days, max_count=max_activities)
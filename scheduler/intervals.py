@@ -0,0 +1,233 @@
+"""Per-date interval index for fast calendar queries.
+
+Bookings are grouped by date, and each date keeps its intervals as parallel
+start/end minute arrays sorted by start time. Lookups use ``bisect`` so that
+overlap tests, "is the day free at t" tests and "next free gap" searches are
+logarithmic in the number of bookings on that date rather than linear in the
+size of the whole schedule.
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import date as date_type
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .times import MINUTES_PER_DAY
+
+
+def peak_concurrency(intervals: Iterable[Tuple[int, int]], start: int, end: int) -> int:
+    """Get the largest number of intervals in use at once within [start, end).
+
+    Args:
+        intervals: (start, end) minute pairs
+        start: Start of the query range
+        end: End of the query range
+
+    Returns:
+        Peak number of simultaneously active intervals
+    """
+    events = []
+    for s, e in intervals:
+        if s < end and start < e:
+            events.append((max(s, start), 1))
+            events.append((min(e, end), -1))
+
+    # Ends sort before starts at the same minute (half-open intervals)
+    events.sort()
+    peak = active = 0
+    for _, delta in events:
+        active += delta
+        if active > peak:
+            peak = active
+    return peak
+
+
+class DayIntervals:
+    """Sorted intervals booked on a single date.
+
+    ``max_ends[i]`` is the largest end among the first ``i + 1`` intervals,
+    which lets overlap queries stay logarithmic even if intervals overlap
+    each other (e.g. shared equipment with several concurrent users).
+    """
+
+    __slots__ = ("starts", "ends", "max_ends", "items")
+
+    def __init__(self):
+        self.starts: List[int] = []
+        self.ends: List[int] = []
+        self.max_ends: List[int] = []
+        self.items: List[Any] = []
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def add(self, start: int, end: int, item: Any = None) -> None:
+        """Insert an interval, keeping the arrays sorted by start minute."""
+        i = bisect_right(self.starts, start)
+        self.starts.insert(i, start)
+        self.ends.insert(i, end)
+        self.items.insert(i, item)
+        self.max_ends.insert(i, 0)
+        self._refresh_max_ends(i)
+
+    def remove(self, start: int, end: int, item: Any = None) -> bool:
+        """Remove an interval previously added with the same values.
+
+        Returns:
+            True if an interval was removed
+        """
+        i = bisect_left(self.starts, start)
+        while i < len(self.starts) and self.starts[i] == start:
+            if self.ends[i] == end and (item is None or self.items[i] is item):
+                del self.starts[i], self.ends[i], self.items[i], self.max_ends[i]
+                self._refresh_max_ends(i)
+                return True
+            i += 1
+        return False
+
+    def find_overlap(self, start: int, end: int) -> Optional[int]:
+        """Return the position of an interval overlapping [start, end), if any."""
+        i = bisect_left(self.starts, end)  # intervals [0, i) start before `end`
+        if i == 0 or self.max_ends[i - 1] <= start:
+            return None
+
+        # Some interval in [0, i) ends after `start`; the latest-starting one
+        # is almost always it, so walk backwards from there.
+        for j in range(i - 1, -1, -1):
+            if self.ends[j] > start:
+                return j
+        return None
+
+    def count_overlaps(self, start: int, end: int) -> int:
+        """Count intervals overlapping [start, end)."""
+        i = bisect_left(self.starts, end)
+        if i == 0 or self.max_ends[i - 1] <= start:
+            return 0
+        return sum(1 for j in range(i) if self.ends[j] > start)
+
+    def next_free_gap(
+        self,
+        earliest: int,
+        duration: int,
+        latest_end: int = MINUTES_PER_DAY
+    ) -> Optional[int]:
+        """Find the first start >= earliest where `duration` minutes are free.
+
+        Returns:
+            Start minute of the gap, or None if nothing fits before latest_end
+        """
+        cursor = earliest
+        i = bisect_right(self.starts, cursor)
+        if i and self.max_ends[i - 1] > cursor:
+            cursor = self.max_ends[i - 1]
+
+        n = len(self.starts)
+        while i < n and self.starts[i] < cursor + duration:
+            if self.ends[i] > cursor:
+                cursor = self.ends[i]
+            i += 1
+
+        if cursor + duration <= latest_end:
+            return cursor
+        return None
+
+    def _refresh_max_ends(self, i: int) -> None:
+        """Recompute the running maximum of ends from position i onwards."""
+        running = self.max_ends[i - 1] if i > 0 else 0
+        for j in range(i, len(self.ends)):
+            if self.ends[j] > running:
+                running = self.ends[j]
+            self.max_ends[j] = running
+
+
+class IntervalIndex:
+    """Date-keyed collection of DayIntervals."""
+
+    def __init__(self):
+        self._days: Dict[date_type, DayIntervals] = {}
+
+    def __len__(self) -> int:
+        return sum(len(day) for day in self._days.values())
+
+    def day(self, date: date_type) -> Optional[DayIntervals]:
+        """Get the intervals booked on a date (None if nothing is booked)."""
+        return self._days.get(date)
+
+    def dates(self) -> Iterator[date_type]:
+        """Iterate over dates that have at least one interval."""
+        return iter(self._days)
+
+    def add(self, date: date_type, start: int, end: int, item: Any = None) -> None:
+        """Add an interval [start, end) on a date."""
+        day = self._days.get(date)
+        if day is None:
+            day = self._days[date] = DayIntervals()
+        day.add(start, end, item)
+
+    def remove(self, date: date_type, start: int, end: int, item: Any = None) -> bool:
+        """Remove an interval from a date.
+
+        Returns:
+            True if an interval was removed
+        """
+        day = self._days.get(date)
+        if day is None or not day.remove(start, end, item):
+            return False
+        if not day:
+            del self._days[date]
+        return True
+
+    def find_overlap(self, date: date_type, start: int, end: int) -> Optional[Any]:
+        """Return the item of an interval overlapping [start, end), if any."""
+        day = self._days.get(date)
+        if day is None:
+            return None
+        j = day.find_overlap(start, end)
+        return None if j is None else day.items[j]
+
+    def overlaps(self, date: date_type, start: int, end: int) -> bool:
+        """Check whether [start, end) overlaps any interval on the date."""
+        day = self._days.get(date)
+        return day is not None and day.find_overlap(start, end) is not None
+
+    def count_overlaps(self, date: date_type, start: int, end: int) -> int:
+        """Count intervals on the date overlapping [start, end)."""
+        day = self._days.get(date)
+        return 0 if day is None else day.count_overlaps(start, end)
+
+    def peak_overlap(self, date: date_type, start: int, end: int) -> int:
+        """Get the largest number of the date's intervals in use at once within [start, end)."""
+        day = self._days.get(date)
+        if day is None:
+            return 0
+        i = bisect_left(day.starts, end)
+        if i == 0 or day.max_ends[i - 1] <= start:
+            return 0
+        return peak_concurrency(zip(day.starts[:i], day.ends[:i]), start, end)
+
+    def is_free(self, date: date_type, minute: int) -> bool:
+        """Check whether nothing is booked on the date at the given minute."""
+        return not self.overlaps(date, minute, minute + 1)
+
+    def next_free_gap(
+        self,
+        date: date_type,
+        earliest: int,
+        duration: int,
+        latest_end: int = MINUTES_PER_DAY
+    ) -> Optional[int]:
+        """Find the first start >= earliest on the date with `duration` free minutes."""
+        day = self._days.get(date)
+        if day is None:
+            return earliest if earliest + duration <= latest_end else None
+        return day.next_free_gap(earliest, duration, latest_end)
+
+    def intervals(self, date: date_type) -> List[Tuple[int, int, Any]]:
+        """List (start, end, item) intervals booked on a date in start order."""
+        day = self._days.get(date)
+        if day is None:
+            return []
+        return list(zip(day.starts, day.ends, day.items))
+
+    def clear(self) -> None:
+        """Remove every interval."""
+        self._days.clear()
@@ -0,0 +1,109 @@
+"""Shared ledger of specialist and equipment usage.
+
+Specialists and equipment have concurrency limits that apply across every
+client using them, not per client. ``ResourceLedger`` records each booking's
+use of those resources in per-resource occupancy grids (a fast upper bound)
+and per-resource interval indexes (the exact count). A ledger normally
+belongs to a single ``SchedulerState``, but one ledger can be shared by the
+states of many clients so that capacity checks see everyone's bookings.
+"""
+
+from collections import defaultdict
+from datetime import date as date_type
+from typing import Dict, Mapping, Union
+
+from models import TimeSlot
+from .booking import Booking
+from .intervals import IntervalIndex
+from .occupancy import OccupancyGrid
+
+
+class ResourceLedger:
+    """Per-resource, per-date usage of specialists and equipment."""
+
+    def __init__(self):
+        """Initialize an empty ledger."""
+        self.specialist_occupancy: Dict[str, OccupancyGrid] = defaultdict(OccupancyGrid)
+        self.specialist_index: Dict[str, IntervalIndex] = defaultdict(IntervalIndex)
+        self.equipment_occupancy: Dict[str, OccupancyGrid] = defaultdict(OccupancyGrid)
+        self.equipment_index: Dict[str, IntervalIndex] = defaultdict(IntervalIndex)
+
+    def add(self, slot: Union[Booking, TimeSlot]) -> None:
+        """Record a booking's use of its specialist and equipment."""
+        start = slot.start_min
+        end = slot.end_min
+
+        if slot.specialist_id:
+            self.specialist_occupancy[slot.specialist_id].add(slot.date, start, end)
+            self.specialist_index[slot.specialist_id].add(slot.date, start, end, slot)
+
+        for equip_id in slot.equipment_ids:
+            self.equipment_occupancy[equip_id].add(slot.date, start, end)
+            self.equipment_index[equip_id].add(slot.date, start, end, slot)
+
+    def remove(self, slot: Union[Booking, TimeSlot]) -> None:
+        """Release a booking previously recorded with ``add``."""
+        start = slot.start_min
+        end = slot.end_min
+
+        if slot.specialist_id and slot.specialist_id in self.specialist_index:
+            if self.specialist_index[slot.specialist_id].remove(slot.date, start, end, slot):
+                self.specialist_occupancy[slot.specialist_id].remove(slot.date, start, end)
+
+        for equip_id in slot.equipment_ids:
+            if equip_id in self.equipment_index:
+                if self.equipment_index[equip_id].remove(slot.date, start, end, slot):
+                    self.equipment_occupancy[equip_id].remove(slot.date, start, end)
+
+    def specialist_has_capacity(
+        self,
+        specialist_id: str,
+        date: date_type,
+        start: int,
+        end: int,
+        capacity: int
+    ) -> bool:
+        """Check the specialist has fewer than `capacity` clients throughout [start, end)."""
+        return self._has_capacity(
+            self.specialist_occupancy, self.specialist_index, specialist_id, date, start, end, capacity
+        )
+
+    def equipment_has_capacity(
+        self,
+        equip_id: str,
+        date: date_type,
+        start: int,
+        end: int,
+        capacity: int
+    ) -> bool:
+        """Check the equipment has fewer than `capacity` users throughout [start, end)."""
+        return self._has_capacity(
+            self.equipment_occupancy, self.equipment_index, equip_id, date, start, end, capacity
+        )
+
+    def clear(self) -> None:
+        """Drop every recorded booking."""
+        self.specialist_occupancy.clear()
+        self.specialist_index.clear()
+        self.equipment_occupancy.clear()
+        self.equipment_index.clear()
+
+    def _has_capacity(
+        self,
+        grids: Mapping[str, OccupancyGrid],
+        indexes: Mapping[str, IntervalIndex],
+        resource_id: str,
+        date: date_type,
+        start: int,
+        end: int,
+        capacity: int
+    ) -> bool:
+        """Grid peak is an upper bound; only near-capacity ranges need the exact index.
+
+        The grid counts every booking exactly per 5-minute bucket (rows widen
+        past 255), so its peak never under-reports, at any capacity.
+        """
+        grid = grids.get(resource_id)
+        if grid is None or grid.peak(date, start, end) < capacity:
+            return True
+        return indexes[resource_id].peak_overlap(date, start, end) < capacity
@@ -0,0 +1,96 @@
+"""Compact occupancy calendars at 5-minute resolution.
+
+Each (calendar, date) pair is a 288-byte ``bytearray`` where byte ``i`` holds
+the number of bookings touching minutes ``[5 * i, 5 * i + 5)``. Free-time and
+concurrent-capacity tests become slice operations over that array instead of
+Python loops over TimeSlot objects, and memory is a predictable
+288 bytes x dates x resources. A row whose count would pass 255 (a resource
+shared by hundreds of clients) is widened to 32-bit counters, so counts are
+never clipped.
+
+Bookings are marked on every bucket they touch, so the grid can only
+over-report usage at 5-minute boundaries, never under-report it. Callers
+use it as a fast filter and fall back to exact interval data when a bucket
+is busy.
+"""
+
+from array import array
+from datetime import date as date_type
+from typing import Dict, Optional, Tuple, Union
+
+from .times import MINUTES_PER_DAY
+
+SLOT_MINUTES = 5
+SLOTS_PER_DAY = MINUTES_PER_DAY // SLOT_MINUTES
+
+# One date's bucket counts: bytes until a count passes 255, then 32-bit
+Row = Union[bytearray, array]
+
+
+def bucket_range(start: int, end: int) -> Tuple[int, int]:
+    """Map a [start, end) minute range to the buckets it touches."""
+    first = max(0, start // SLOT_MINUTES)
+    last = min(SLOTS_PER_DAY, -(-end // SLOT_MINUTES))
+    return first, last
+
+
+class OccupancyGrid:
+    """Per-date usage counts for one calendar (a client, specialist or equipment)."""
+
+    def __init__(self):
+        self._days: Dict[date_type, Row] = {}
+
+    def __len__(self) -> int:
+        return len(self._days)
+
+    def row(self, date: date_type) -> Optional[Row]:
+        """Get the raw bucket counts for a date (None if nothing is booked)."""
+        return self._days.get(date)
+
+    def add(self, date: date_type, start: int, end: int) -> None:
+        """Mark [start, end) as used by one more booking."""
+        row = self._days.get(date)
+        if row is None:
+            row = self._days[date] = bytearray(SLOTS_PER_DAY)
+        first, last = bucket_range(start, end)
+        for i in range(first, last):
+            try:
+                row[i] += 1
+            except ValueError:
+                # Byte counter full: widen the row and keep counting exactly
+                row = self._days[date] = array("I", list(row))
+                row[i] += 1
+
+    def remove(self, date: date_type, start: int, end: int) -> None:
+        """Release one booking's usage of [start, end)."""
+        row = self._days.get(date)
+        if row is None:
+            return
+        first, last = bucket_range(start, end)
+        for i in range(first, last):
+            if row[i]:
+                row[i] -= 1
+        if not any(row):
+            del self._days[date]
+
+    def is_free(self, date: date_type, start: int, end: int) -> bool:
+        """Check that no booking touches any bucket of [start, end)."""
+        row = self._days.get(date)
+        if row is None:
+            return True
+        first, last = bucket_range(start, end)
+        return row[first:last].count(0) == last - first
+
+    def peak(self, date: date_type, start: int, end: int) -> int:
+        """Get the highest bucket count within [start, end)."""
+        row = self._days.get(date)
+        if row is None:
+            return 0
+        first, last = bucket_range(start, end)
+        if first >= last:
+            return 0
+        return max(row[first:last])
+
+    def clear(self) -> None:
+        """Drop every date."""
+        self._days.clear()
@@ -0,0 +1,199 @@
+"""Compiled scheduling problems for fast reloads.
+
+Loading a dataset directory means parsing and validating every activity,
+specialist, equipment item and travel period, then compiling specialist
+availability. ``compile_problem`` does that once and writes the result to a
+binary file; ``load_problem`` restores it without any re-validation as long
+as the source JSON and the code that defines the payload are unchanged.
+
+File layout::
+
+    MAGIC (8 bytes) | schema hash (32 bytes) | source hash (32 bytes) | pickle payload
+
+The payload holds the validated models with interned IDs plus the
+availability masks (integer-minute blocks) precomputed for the dataset's
+horizon. The source hash covers the name and content of every source file,
+so any edit to the JSON triggers a recompile. The schema hash covers the
+modules whose classes are pickled (``models/``, ``scheduler/availability.py``
+and this module), so upgrading them does too; any error while reading the
+file is likewise treated as a stale cache. The file is a local cache written
+by this module; never load one from an untrusted source.
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+from dataclasses import dataclass
+from datetime import date as date_type, datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from models import Activity, Specialist, Equipment, TravelPeriod
+from utils import load_activities, load_specialists, load_equipment, load_travel, load_json
+from .availability import SpecialistAvailability
+
+MAGIC = b"ELYXPRB2"
+HEADER_SIZE = len(MAGIC) + 2 * hashlib.sha256().digest_size
+
+# Source files hashed into the header; travel.json is optional
+SOURCE_FILES = ("activities.json", "specialists.json", "equipment.json", "travel.json", "metadata.json")
+
+DEFAULT_CACHE_NAME = "problem.bin"
+
+# Modules defining the pickled classes, relative to the project root
+_ROOT = Path(__file__).resolve().parent.parent
+SCHEMA_SOURCES = ("models", "scheduler/availability.py", "scheduler/problem.py")
+
+
+@dataclass
+class Problem:
+    """A validated dataset ready to schedule."""
+    activities: List[Activity]
+    specialists: List[Specialist]
+    equipment: List[Equipment]
+    travel_periods: List[TravelPeriod]
+    start_date: date_type
+    end_date: date_type
+    availability: Dict[str, SpecialistAvailability]
+
+
+@lru_cache(maxsize=None)
+def schema_hash() -> bytes:
+    """Hash the code that defines the compiled payload.
+
+    Returns:
+        SHA-256 digest of every module in ``SCHEMA_SOURCES``
+    """
+    digest = hashlib.sha256(MAGIC)
+    for source in SCHEMA_SOURCES:
+        path = _ROOT / source
+        for module in sorted(path.glob("*.py")) if path.is_dir() else [path]:
+            content = module.read_bytes()
+            digest.update(module.relative_to(_ROOT).as_posix().encode())
+            digest.update(len(content).to_bytes(8, "little"))
+            digest.update(content)
+    return digest.digest()
+
+
+def source_hash(data_dir: Path) -> bytes:
+    """Hash the dataset's source files.
+
+    Args:
+        data_dir: Directory holding the source JSON files
+
+    Returns:
+        SHA-256 digest of every present source file's name and content
+    """
+    digest = hashlib.sha256(MAGIC)
+    for name in SOURCE_FILES:
+        path = data_dir / name
+        if not path.exists():
+            continue
+        content = path.read_bytes()
+        digest.update(name.encode())
+        digest.update(len(content).to_bytes(8, "little"))
+        digest.update(content)
+    return digest.digest()
+
+
+def compile_problem(data_dir: str | Path, cache_path: Optional[str | Path] = None) -> Problem:
+    """Load and validate a dataset, then write its compiled binary form.
+
+    Args:
+        data_dir: Directory holding the source JSON files
+        cache_path: Compiled file to write (default: data_dir/problem.bin)
+
+    Returns:
+        The compiled problem
+    """
+    data_dir = Path(data_dir)
+    cache_path = Path(cache_path) if cache_path else data_dir / DEFAULT_CACHE_NAME
+    digest = source_hash(data_dir)
+
+    metadata = load_json(data_dir / "metadata.json")
+    start_date = datetime.fromisoformat(metadata["start_date"]).date()
+    if metadata.get("end_date"):
+        end_date = datetime.fromisoformat(metadata["end_date"]).date()
+    else:
+        end_date = start_date + timedelta(days=89)
+
+    travel_path = data_dir / "travel.json"
+    problem = Problem(
+        activities=load_activities(data_dir / "activities.json"),
+        specialists=load_specialists(data_dir / "specialists.json"),
+        equipment=load_equipment(data_dir / "equipment.json"),
+        travel_periods=load_travel(travel_path) if travel_path.exists() else [],
+        start_date=start_date,
+        end_date=end_date,
+        availability={}
+    )
+    _intern_ids(problem)
+    problem.availability = {
+        s.id: SpecialistAvailability(s, start_date, end_date)
+        for s in problem.specialists
+    }
+
+    # Write to a temporary file first so readers never see a partial file
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(schema_hash())
+        f.write(digest)
+        pickle.dump(problem, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_path)
+
+    return problem
+
+
+def load_problem(data_dir: str | Path, cache_path: Optional[str | Path] = None) -> Problem:
+    """Load a dataset, from its compiled file when that is up to date.
+
+    The compiled file is only used when its header matches the current code
+    and source files and it unpickles cleanly; otherwise the dataset is
+    recompiled.
+
+    Args:
+        data_dir: Directory holding the source JSON files
+        cache_path: Compiled file to use (default: data_dir/problem.bin)
+
+    Returns:
+        The validated problem
+    """
+    data_dir = Path(data_dir)
+    cache_path = Path(cache_path) if cache_path else data_dir / DEFAULT_CACHE_NAME
+
+    if cache_path.exists():
+        problem = _read_compiled(cache_path, source_hash(data_dir))
+        if problem is not None:
+            return problem
+
+    return compile_problem(data_dir, cache_path)
+
+
+def _read_compiled(cache_path: Path, digest: bytes) -> Optional[Problem]:
+    """Read a compiled problem, or None if it is stale or unreadable."""
+    try:
+        with open(cache_path, "rb") as f:
+            if f.read(HEADER_SIZE) != MAGIC + schema_hash() + digest:
+                return None
+            problem = pickle.load(f)
+    except Exception:
+        # Any failure to restore the payload is a cache miss, not an error
+        return None
+
+    return problem if isinstance(problem, Problem) else None
+
+
+def _intern_ids(problem: Problem) -> None:
+    """Intern IDs so each distinct ID is stored only once in the compiled file."""
+    for activity in problem.activities:
+        activity.id = sys.intern(activity.id)
+        if activity.specialist_id:
+            activity.specialist_id = sys.intern(activity.specialist_id)
+        activity.equipment_ids = [sys.intern(e) for e in activity.equipment_ids]
+    for specialist in problem.specialists:
+        specialist.id = sys.intern(specialist.id)
+    for equip in problem.equipment:
+        equip.id = sys.intern(equip.id)
@@ -0,0 +1,130 @@
+"""Rolling-horizon scheduling for long programs.
+
+Instead of one scheduler over the whole program, ``RollingScheduler`` runs a
+fresh ``GreedyScheduler`` per window of N days. Earlier windows are frozen:
+their bookings are never revisited, so each window costs the same no matter
+how long the program already is, and only the current window's state has to
+be held in memory.
+
+Between windows only what affects future decisions is carried forward: the
+scorer's weekly consistency counters (seven per activity), the compiled
+specialist availability with dates before the next window dropped, and
+(optionally) a shared resource ledger. Each window schedules its share of
+the program's required occurrences, so windows add up to the same totals as
+a single long horizon.
+"""
+
+from collections import defaultdict
+from datetime import date as date_type, timedelta
+from typing import Dict, Iterator, List, Optional
+
+from models import Activity, Specialist, Equipment, TravelPeriod
+from .availability import SpecialistAvailability
+from .greedy import GreedyScheduler
+from .ledger import ResourceLedger
+
+
+class RollingScheduler:
+    """Schedules a program window by window with the greedy scheduler."""
+
+    def __init__(
+        self,
+        activities: List[Activity],
+        specialists: List[Specialist],
+        equipment: List[Equipment],
+        travel_periods: List[TravelPeriod],
+        start_date: date_type,
+        window_days: int = 28,
+        elapsed_days: int = 0,
+        weekly_patterns: Optional[Dict[str, List[int]]] = None,
+        ledger: Optional[ResourceLedger] = None
+    ):
+        """Initialize the rolling scheduler.
+
+        To extend an existing schedule, pass the first unscheduled date as
+        `start_date`, the days already scheduled as `elapsed_days` and that
+        run's ``scheduler.scorer.weekly_patterns``.
+
+        Args:
+            activities: List of activities to schedule
+            specialists: List of specialists with availability
+            equipment: List of equipment with maintenance windows
+            travel_periods: List of client travel periods
+            start_date: First day of the first window
+            window_days: Length of each window (default 4 weeks)
+            elapsed_days: Program days already scheduled before start_date
+            weekly_patterns: Per-weekday booking counts carried over from an earlier run
+            ledger: Specialist/equipment ledger shared with other clients (optional)
+        """
+        if window_days < 1:
+            raise ValueError("window_days must be at least 1")
+
+        self.activities = activities
+        self.specialists = specialists
+        self.equipment = equipment
+        self.travel_periods = travel_periods
+        self.window_days = window_days
+        self.next_start = start_date
+        self.elapsed_days = elapsed_days
+        self.weekly_patterns: Dict[str, List[int]] = defaultdict(lambda: [0] * 7)
+        for activity_id, counts in (weekly_patterns or {}).items():
+            self.weekly_patterns[activity_id] = list(counts)
+        self.ledger = ledger
+
+        # Compiled without a fixed horizon; dates are filled in lazily per window
+        # and dropped once their window is frozen
+        self.availability = {s.id: SpecialistAvailability(s) for s in specialists}
+
+    def schedule_window(self, days: Optional[int] = None) -> GreedyScheduler:
+        """Schedule the next window and freeze it.
+
+        Args:
+            days: Length of this window (default: window_days)
+
+        Returns:
+            The window's scheduler; its ``state`` holds the window's bookings
+
+        Raises:
+            ValueError: If days is less than 1
+        """
+        if days is None:
+            days = self.window_days
+        if days < 1:
+            raise ValueError("days must be at least 1")
+
+        scheduler = GreedyScheduler(
+            activities=self.activities,
+            specialists=self.specialists,
+            equipment=self.equipment,
+            travel_periods=self.travel_periods,
+            start_date=self.next_start,
+            duration_days=days,
+            ledger=self.ledger,
+            elapsed_days=self.elapsed_days,
+            availability=self.availability
+        )
+        scheduler.scorer.weekly_patterns = self.weekly_patterns
+        scheduler.schedule()
+
+        self.next_start += timedelta(days=days)
+        self.elapsed_days += days
+        for availability in self.availability.values():
+            availability.forget_before(self.next_start)
+        return scheduler
+
+    def run(self, total_days: int) -> Iterator[GreedyScheduler]:
+        """Schedule `total_days` more days, yielding each window as it is frozen.
+
+        The last window is shortened to end exactly after `total_days`.
+
+        Args:
+            total_days: Number of days to schedule
+
+        Yields:
+            One scheduler per window, in date order
+        """
+        remaining = total_days
+        while remaining > 0:
+            days = min(self.window_days, remaining)
+            yield self.schedule_window(days)
+            remaining -= days
@@ -12,10 +12,11 @@ Scoring factors:
 """
 
 from datetime import date as date_type, time as time_type, datetime, timedelta
-from typing import List, Dict
+from typing import List, Dict, Tuple
 from collections import defaultdict
 
-from models import Activity, TimeSlot
+from models import Activity, ActivityType
+from .times import to_minutes
 
 
 class SlotScorer:
@@ -24,14 +25,15 @@ class SlotScorer:
     def __init__(self):
         """Initialize scorer with tracking state."""
         self.daily_counts: Dict[date_type, int] = defaultdict(int)
-        self.weekly_patterns: Dict[str, List[int]] = defaultdict(list)  # activity_id -> [weekdays]
+        self.daily_type_counts: Dict[Tuple[date_type, ActivityType], int] = defaultdict(int)
+        # activity_id -> bookings per weekday (Monday=0), a fixed 7 counters
+        self.weekly_patterns: Dict[str, List[int]] = defaultdict(lambda: [0] * 7)
 
     def score_slot(
         self,
         activity: Activity,
         date: date_type,
-        start_time: time_type,
-        booked_slots: List[TimeSlot]
+        start_time: time_type
     ) -> float:
         """Score a valid time slot (0-10 scale, higher is better).
 
@@ -39,7 +41,6 @@ class SlotScorer:
             activity: The activity to schedule
             date: The date to schedule on
             start_time: The start time
-            booked_slots: Already scheduled time slots
 
         Returns:
             Score from 0-10 (higher = better fit)
@@ -47,13 +48,13 @@ class SlotScorer:
         score = 0.0
 
         # 1. Time preference matching (0-10 points)
-        score += self._score_time_preference(activity, start_time)
+        score += self._score_time_preference(activity, to_minutes(start_time))
 
         # 2. Activity grouping bonus (0-2 points)
-        score += self._score_grouping(activity, date, booked_slots)
+        score += self._score_grouping(activity, date)
 
         # 3. Overcrowding penalty (0 to -2 points)
-        score += self._score_overcrowding(date, booked_slots)
+        score += self._score_overcrowding(date)
 
         # 4. Consistency bonus (0-2 points)
         score += self._score_consistency(activity, date)
@@ -63,7 +64,46 @@ class SlotScorer:
 
         return max(0.0, min(10.0, score))  # Clamp to [0, 10]
 
-    def _score_time_preference(self, activity: Activity, start_time: time_type) -> float:
+    def score_many(
+        self,
+        activity: Activity,
+        dates: List[date_type],
+        start_minutes: List[int]
+    ) -> List[List[float]]:
+        """Score a whole grid of candidate slots.
+
+        Gives the same scores as ``score_slot`` for every (date, start) pair,
+        but the time term is computed once per start and the day terms once
+        per date.
+
+        Args:
+            activity: The activity to schedule
+            dates: Candidate dates (rows)
+            start_minutes: Candidate start times in minutes since midnight (columns)
+
+        Returns:
+            Matrix of 0-10 scores indexed [date][start]
+        """
+        time_scores = [
+            self._score_time_preference(activity, start)
+            for start in start_minutes
+        ]
+
+        matrix = []
+        for date in dates:
+            grouping = self._score_grouping(activity, date)
+            overcrowding = self._score_overcrowding(date)
+            consistency = self._score_consistency(activity, date)
+            day_preference = self._score_day_preference(activity, date)
+
+            matrix.append([
+                max(0.0, min(10.0, score + grouping + overcrowding + consistency + day_preference))
+                for score in time_scores
+            ])
+
+        return matrix
+
+    def _score_time_preference(self, activity: Activity, start: int) -> float:
         """Score how well the time matches activity preferences (0-10).
 
         If activity has a time window:
@@ -79,15 +119,14 @@ class SlotScorer:
         """
         if activity.time_window_start and activity.time_window_end:
             # Calculate position within window (0.0 = start, 1.0 = end)
-            window_start_minutes = activity.time_window_start.hour * 60 + activity.time_window_start.minute
-            window_end_minutes = activity.time_window_end.hour * 60 + activity.time_window_end.minute
-            slot_minutes = start_time.hour * 60 + start_time.minute
+            window_start_minutes = activity.window_start_min
+            window_end_minutes = activity.window_end_min
 
             window_duration = window_end_minutes - window_start_minutes
             if window_duration <= 0:
                 return 5.0
 
-            position = (slot_minutes - window_start_minutes) / window_duration
+            position = (start - window_start_minutes) / window_duration
 
             # Parabolic scoring: peak at center (0.5), lower at edges
             # f(x) = -20(x - 0.5)^2 + 10
@@ -98,7 +137,7 @@ class SlotScorer:
 
         else:
             # No time window - use general preferences
-            hour = start_time.hour
+            hour = start // 60
 
             if 6 <= hour < 9:
                 return 8.0  # Morning
@@ -109,45 +148,25 @@ class SlotScorer:
             else:
                 return 4.0  # Late night/early morning
 
-    def _score_grouping(
-        self,
-        activity: Activity,
-        date: date_type,
-        booked_slots: List[TimeSlot]
-    ) -> float:
+    def _score_grouping(self, activity: Activity, date: date_type) -> float:
         """Bonus for scheduling similar activities on same day (0-2).
 
         Grouping similar activities (e.g., multiple fitness sessions) can be
         beneficial for motivation and routine building.
         """
-        same_day_slots = [s for s in booked_slots if s.date == date]
-
-        if not same_day_slots:
-            return 0.0
-
         # Count activities of same type on this day
-        same_type_count = 0
-        for slot in same_day_slots:
-            # We need to look up the activity to check type
-            # For now, we'll use a simple heuristic based on activity ID prefix
-            # (In full implementation, would pass activity lookup dict)
-            if activity.id[:3] == slot.activity_id[:3]:  # Same prefix = likely same type
-                same_type_count += 1
+        same_type_count = self.daily_type_counts.get((date, activity.type), 0)
 
         # Bonus: 1 point for 1 similar activity, 2 points for 2+
-        return min(2.0, same_type_count)
+        return float(min(2, same_type_count))
 
-    def _score_overcrowding(
-        self,
-        date: date_type,
-        booked_slots: List[TimeSlot]
-    ) -> float:
+    def _score_overcrowding(self, date: date_type) -> float:
         """Penalty for days with too many activities (0 to -2).
 
         Having too many activities in one day can be overwhelming.
         Target: 2-4 activities per day is ideal.
         """
-        same_day_count = sum(1 for s in booked_slots if s.date == date)
+        same_day_count = self.daily_counts.get(date, 0)
 
         if same_day_count <= 3:
             return 0.0  # Ideal range
@@ -163,14 +182,13 @@ class SlotScorer:
 
         Scheduling activities on the same day of week builds routine.
         """
-        weekday = date.weekday()
-        past_weekdays = self.weekly_patterns.get(activity.id, [])
+        weekday_counts = self.weekly_patterns.get(activity.id)
 
-        if not past_weekdays:
+        if weekday_counts is None:
             return 0.0  # First occurrence
 
-        # Count how many times this activity was scheduled on this weekday
-        same_weekday_count = past_weekdays.count(weekday)
+        # How many times this activity was scheduled on this weekday
+        same_weekday_count = weekday_counts[date.weekday()]
 
         if same_weekday_count >= 2:
             return 2.0  # Strong pattern
@@ -197,6 +215,14 @@ class SlotScorer:
         """Record a booking to update scoring state.
 
         This allows the scorer to track patterns and adjust future scores.
+        Day and same-type counts come only from recorded bookings.
         """
         self.daily_counts[date] += 1
-        self.weekly_patterns[activity.id].append(date.weekday())
+        self.daily_type_counts[(date, activity.type)] += 1
+        self.weekly_patterns[activity.id][date.weekday()] += 1
+
+    def unrecord_booking(self, activity: Activity, date: date_type):
+        """Forget a booking previously passed to ``record_booking``."""
+        self.daily_counts[date] -= 1
+        self.daily_type_counts[(date, activity.type)] -= 1
+        self.weekly_patterns[activity.id][date.weekday()] -= 1
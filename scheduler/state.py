@@ -2,47 +2,155 @@
 
 This module maintains the calendar state during scheduling, tracking:
 - All booked time slots
+- A per-date interval index over booked slots (for fast overlap queries)
+- A 5-minute occupancy grid for the client
+- A resource ledger of specialist and equipment usage (optionally shared by many clients)
+- Per-date load counters (bookings and booked minutes)
 - Specialist bookings (for concurrent limit checking)
 - Equipment usage (for concurrent limit checking)
-- Failed scheduling attempts with reasons
+- Failed scheduling attempts: counters per constraint and resource, plus a
+  few sample violations
 """
 
+import math
+import random
 from datetime import date as date_type, time as time_type
-from typing import List, Dict, Set
+from typing import Iterable, List, Dict, Optional, Set, Tuple, Union
+from heapq import nsmallest
 from collections import defaultdict
 from dataclasses import dataclass, field
 
 from models import Activity, TimeSlot
+from .booking import Booking
 from .constraints import ConstraintViolation
+from .intervals import IntervalIndex
+from .ledger import ResourceLedger
+from .occupancy import OccupancyGrid
+
+
+# Violations kept per failed activity besides the first one
+SAMPLE_SIZE = 5
 
 
 @dataclass
 class SchedulingAttempt:
-    """Record of a failed scheduling attempt."""
+    """Record of a failed scheduling attempt.
+
+    Every rejected candidate is counted, but only the first violation and a
+    uniform reservoir sample of ``SAMPLE_SIZE`` are kept (Li's Algorithm L,
+    which draws random numbers only when a sample is replaced).
+    """
     activity: Activity
     attempts: int = 0
-    violations: List[ConstraintViolation] = field(default_factory=list)
+    counts: Dict[Tuple[str, Optional[str]], int] = field(default_factory=dict)
+    first: Optional[ConstraintViolation] = None
+    samples: List[ConstraintViolation] = field(default_factory=list)
+    _weight: float = field(default=1.0, repr=False)
+    _next_sample: int = field(default=0, repr=False)
+
+    def record(self, violation: ConstraintViolation, rng: random.Random, count: int = 1) -> None:
+        """Count a violation and update the sample.
+
+        Args:
+            violation: The constraint violation that caused failure
+            rng: Random source for the reservoir
+            count: Number of rejected candidates it stands for (e.g. every
+                time slot of a date rejected as a whole)
+        """
+        key = (violation.constraint_type, violation.resource)
+        self.counts[key] = self.counts.get(key, 0) + count
+
+        if self.first is None:
+            self.first = violation
+
+        while count and len(self.samples) < SAMPLE_SIZE:
+            self.attempts += 1
+            count -= 1
+            self.samples.append(violation)
+            if len(self.samples) == SAMPLE_SIZE:
+                self._weight = math.exp(math.log(1.0 - rng.random()) / SAMPLE_SIZE)
+                self._skip(rng, self.attempts)
+
+        if count:
+            self.attempts += count
+            while self._next_sample <= self.attempts:
+                self.samples[rng.randrange(SAMPLE_SIZE)] = violation
+                self._weight *= math.exp(math.log(1.0 - rng.random()) / SAMPLE_SIZE)
+                self._skip(rng, self._next_sample)
+
+    def _skip(self, rng: random.Random, position: int) -> None:
+        """Pick the next attempt number after `position` that replaces a sample."""
+        if self._weight >= 1.0:
+            self._next_sample = position + 1
+        else:
+            skip = math.log(1.0 - rng.random()) / math.log1p(-self._weight)
+            self._next_sample = position + int(skip) + 1
+
+    def sample_reasons(self) -> List[str]:
+        """Format the sampled violations (the only time their reasons are built).
+
+        Returns:
+            Distinct reasons of the sampled violations, in sample order
+        """
+        return list(dict.fromkeys(violation.reason for violation in self.samples))
+
+    def violation_types(self) -> Dict[str, int]:
+        """Count violations by constraint type.
+
+        Returns:
+            Constraint type -> number of rejected candidates
+        """
+        totals: Dict[str, int] = {}
+        for (constraint_type, _), count in self.counts.items():
+            totals[constraint_type] = totals.get(constraint_type, 0) + count
+        return totals
 
 
 class SchedulerState:
     """Maintains the state of the scheduler during execution."""
 
-    def __init__(self):
-        """Initialize empty scheduler state."""
-        self.booked_slots: List[TimeSlot] = []
-        self.specialist_bookings: Dict[str, List[TimeSlot]] = defaultdict(list)
-        self.equipment_bookings: Dict[str, List[TimeSlot]] = defaultdict(list)
+    def __init__(self, ledger: Optional[ResourceLedger] = None):
+        """Initialize empty scheduler state.
+
+        Args:
+            ledger: Resource ledger shared with other clients' states
+                (default: a private ledger for this client only)
+        """
+        self.booked_slots: List[Booking] = []
+        self.slot_index = IntervalIndex()
+        self.specialist_bookings: Dict[str, List[Booking]] = defaultdict(list)
+        self.equipment_bookings: Dict[str, List[Booking]] = defaultdict(list)
+        self.client_occupancy = OccupancyGrid()
+        self.ledger = ledger if ledger is not None else ResourceLedger()
+        self.day_counts: Dict[date_type, int] = {}
+        self.day_minutes: Dict[date_type, int] = {}
         self.failed_activities: Dict[str, SchedulingAttempt] = {}
+        self._sample_rng = random.Random(0)
         self.activity_occurrences: Dict[str, int] = defaultdict(int)
 
-    def add_booking(self, slot: TimeSlot) -> None:
+    def add_booking(self, slot: Union[Booking, TimeSlot]) -> Booking:
         """Add a successful booking to state.
 
         Args:
-            slot: The time slot to book
+            slot: The booking to add (TimeSlots are converted)
+
+        Returns:
+            The stored booking
         """
+        if isinstance(slot, TimeSlot):
+            slot = Booking.from_time_slot(slot)
+
         self.booked_slots.append(slot)
 
+        start = slot.start_min
+        end = slot.end_min
+        self.slot_index.add(slot.date, start, end, slot)
+        self.client_occupancy.add(slot.date, start, end)
+
+        # Track day load
+        self.day_counts[slot.date] = self.day_counts.get(slot.date, 0) + 1
+        self.day_minutes[slot.date] = self.day_minutes.get(slot.date, 0) + slot.duration_minutes
+
         # Track specialist usage
         if slot.specialist_id:
             self.specialist_bookings[slot.specialist_id].append(slot)
@@ -51,50 +159,136 @@ class SchedulerState:
         for equip_id in slot.equipment_ids:
             self.equipment_bookings[equip_id].append(slot)
 
+        # Record specialist/equipment usage for capacity checks
+        self.ledger.add(slot)
+
         # Track activity occurrence count
         self.activity_occurrences[slot.activity_id] += 1
 
+        return slot
+
+    def remove_booking(self, slot: Booking) -> bool:
+        """Remove a booking previously returned by ``add_booking``.
+
+        Reverses every index and counter update made when it was added,
+        including its entries in the (possibly shared) resource ledger.
+
+        Args:
+            slot: The stored booking (matched by identity)
+
+        Returns:
+            True if the booking was found and removed
+        """
+        start = slot.start_min
+        end = slot.end_min
+        if not self.slot_index.remove(slot.date, start, end, slot):
+            return False
+
+        _remove_identical(self.booked_slots, slot)
+        self.client_occupancy.remove(slot.date, start, end)
+
+        self.day_counts[slot.date] -= 1
+        self.day_minutes[slot.date] -= slot.duration_minutes
+        if not self.day_counts[slot.date]:
+            del self.day_counts[slot.date]
+            del self.day_minutes[slot.date]
+
+        if slot.specialist_id:
+            _remove_identical(self.specialist_bookings[slot.specialist_id], slot)
+
+        for equip_id in slot.equipment_ids:
+            _remove_identical(self.equipment_bookings[equip_id], slot)
+
+        self.ledger.remove(slot)
+
+        self.activity_occurrences[slot.activity_id] -= 1
+        if not self.activity_occurrences[slot.activity_id]:
+            del self.activity_occurrences[slot.activity_id]
+
+        return True
+
     def record_failure(
         self,
         activity: Activity,
-        violation: ConstraintViolation
+        violation: ConstraintViolation,
+        count: int = 1
     ) -> None:
         """Record a failed scheduling attempt.
 
         Args:
             activity: The activity that failed to schedule
             violation: The constraint violation that caused failure
+            count: Number of rejected candidate slots it stands for
         """
-        if activity.id not in self.failed_activities:
-            self.failed_activities[activity.id] = SchedulingAttempt(
-                activity=activity,
-                attempts=1,
-                violations=[violation]
-            )
-        else:
-            attempt = self.failed_activities[activity.id]
-            attempt.attempts += 1
-            attempt.violations.append(violation)
+        attempt = self.failed_activities.get(activity.id)
+        if attempt is None:
+            attempt = self.failed_activities[activity.id] = SchedulingAttempt(activity=activity)
+        attempt.record(violation, self._sample_rng, count)
 
-    def get_slots_for_date(self, date: date_type) -> List[TimeSlot]:
+    def get_slots_for_date(self, date: date_type) -> List[Booking]:
         """Get all booked slots for a specific date.
 
         Args:
             date: The date to query
 
         Returns:
-            List of time slots on that date
+            List of bookings on that date
         """
         return [slot for slot in self.booked_slots if slot.date == date]
 
-    def get_slots_for_activity(self, activity_id: str) -> List[TimeSlot]:
+    def get_time_slots(self) -> List[TimeSlot]:
+        """Export all bookings as validated TimeSlot models.
+
+        Returns:
+            TimeSlots in booking order
+        """
+        return [slot.to_time_slot() for slot in self.booked_slots]
+
+    def get_day_load(self, date: date_type) -> int:
+        """Get the number of bookings on a date.
+
+        Args:
+            date: The date to query
+
+        Returns:
+            Number of slots booked on that date
+        """
+        return self.day_counts.get(date, 0)
+
+    def get_lightest_days(
+        self,
+        dates: Iterable[date_type],
+        k: Optional[int] = None,
+        max_count: Optional[int] = None
+    ) -> List[date_type]:
+        """Order dates by how many bookings they hold (lightest first).
+
+        Ties keep the order of ``dates``.
+
+        Args:
+            dates: Candidate dates
+            k: Only return the k lightest dates (default: all)
+            max_count: Drop dates with this many bookings or more
+
+        Returns:
+            Dates sorted by booking count (ascending)
+        """
+        counts = self.day_counts
+        if max_count is not None:
+            dates = [d for d in dates if counts.get(d, 0) < max_count]
+
+        if k is None:
+            return sorted(dates, key=lambda d: counts.get(d, 0))
+        return nsmallest(k, dates, key=lambda d: counts.get(d, 0))
+
+    def get_slots_for_activity(self, activity_id: str) -> List[Booking]:
         """Get all booked slots for a specific activity.
 
         Args:
             activity_id: The activity ID to query
 
         Returns:
-            List of time slots for that activity
+            List of bookings for that activity
         """
         return [slot for slot in self.booked_slots if slot.activity_id == activity_id]
 
@@ -115,11 +309,10 @@ class SchedulerState:
         Returns:
             (start_date, end_date) or None if no bookings
         """
-        if not self.booked_slots:
+        if not self.day_counts:
             return None
 
-        dates = [slot.date for slot in self.booked_slots]
-        return min(dates), max(dates)
+        return min(self.day_counts), max(self.day_counts)
 
     def get_statistics(self) -> Dict:
         """Get scheduling statistics.
@@ -139,17 +332,12 @@ class SchedulerState:
             }
 
         # Calculate statistics
-        dates = [slot.date for slot in self.booked_slots]
-        date_counts = defaultdict(int)
-        for d in dates:
-            date_counts[d] += 1
-
-        busiest_day = max(date_counts.items(), key=lambda x: x[1]) if date_counts else None
+        busiest_day = max(self.day_counts.items(), key=lambda x: x[1]) if self.day_counts else None
 
         return {
             "total_slots": len(self.booked_slots),
             "unique_activities": len(self.activity_occurrences),
-            "date_range": (min(dates), max(dates)),
+            "date_range": (min(self.day_counts), max(self.day_counts)),
             "busiest_day": busiest_day,
             "specialist_usage": {
                 spec_id: len(slots)
@@ -171,19 +359,14 @@ class SchedulerState:
         report = []
 
         for activity_id, attempt in self.failed_activities.items():
-            # Count violation types
-            violation_counts = defaultdict(int)
-            for v in attempt.violations:
-                violation_counts[v.constraint_type] += 1
-
             report.append({
                 "activity_id": activity_id,
                 "activity_name": attempt.activity.name,
                 "activity_type": attempt.activity.type.value,
                 "priority": attempt.activity.priority,
                 "attempts": attempt.attempts,
-                "violation_types": dict(violation_counts),
-                "sample_reason": attempt.violations[0].reason if attempt.violations else None
+                "violation_types": attempt.violation_types(),
+                "sample_reason": attempt.first.reason if attempt.first else None
             })
 
         # Sort by priority (most critical first)
@@ -192,9 +375,26 @@ class SchedulerState:
         return report
 
     def clear(self) -> None:
-        """Clear all state (useful for testing)."""
+        """Clear all state (useful for testing).
+
+        Only this client's bookings are released from a shared ledger.
+        """
+        for slot in self.booked_slots:
+            self.ledger.remove(slot)
         self.booked_slots.clear()
+        self.slot_index.clear()
+        self.client_occupancy.clear()
+        self.day_counts.clear()
+        self.day_minutes.clear()
         self.specialist_bookings.clear()
         self.equipment_bookings.clear()
         self.failed_activities.clear()
         self.activity_occurrences.clear()
+
+
+def _remove_identical(slots: List[Booking], slot: Booking) -> None:
+    """Remove `slot` itself from a list (equal bookings are left alone)."""
+    for i, other in enumerate(slots):
+        if other is slot:
+            del slots[i]
+            return
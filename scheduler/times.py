@@ -0,0 +1,23 @@
+"""Time arithmetic helpers for the scheduling engine.
+
+The scheduler reasons about times of day as integer minutes since midnight,
+which keeps overlap and containment tests to plain integer comparisons.
+"""
+
+from datetime import time as time_type
+
+MINUTES_PER_DAY = 24 * 60
+
+
+def to_minutes(t: time_type) -> int:
+    """Convert a time of day to minutes since midnight."""
+    return t.hour * 60 + t.minute
+
+
+def from_minutes(minutes: int) -> time_type:
+    """Convert minutes since midnight back to a time of day.
+
+    Values past midnight wrap around, matching ``datetime.time`` arithmetic.
+    """
+    minutes %= MINUTES_PER_DAY
+    return time_type(minutes // 60, minutes % 60)
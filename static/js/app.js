@@ -1,8 +1,12 @@
 // Global state
 let currentDate = new Date();
-let scheduleData = [];
+let scheduleData = [];    // Slots of the month shown in the calendar (date only)
+let scheduleKey = null;   // Month and ETag scheduleData was loaded for
 let summaryData = null;
 
+// How often open dashboards revalidate the schedule (ms)
+const REFRESH_INTERVAL = 5 * 60 * 1000;
+
 // Activity type icons
 const TYPE_ICONS = {
     'Medication': '💊',
@@ -29,6 +33,7 @@ document.addEventListener('DOMContentLoaded', async () => {
         renderCalendar();
         setupEventListeners();
         hideLoading();
+        setInterval(refreshSchedule, REFRESH_INTERVAL);
     } catch (error) {
         console.error('Error initializing app:', error);
         alert('Failed to load schedule data. Please ensure the scheduler has been run.');
@@ -46,7 +51,29 @@ async function loadData() {
 
     summaryData = summaryResult.data;
 
-    const scheduleResponse = await fetch('/api/schedule');
+    await loadSchedule();
+}
+
+// Load the slots of the month shown in the calendar. Revalidates with the
+// server; the browser cache answers a 304 with the stored copy.
+// Returns true if the data changed.
+async function loadSchedule() {
+    const year = currentDate.getFullYear();
+    const month = currentDate.getMonth();
+    const start = formatDate(new Date(year, month, 1));
+    const end = formatDate(new Date(year, month + 1, 0));
+
+    const scheduleResponse = await fetch(
+        `/api/schedule?start=${start}&end=${end}&fields=date`,
+        { cache: 'no-cache' }
+    );
+    const etag = scheduleResponse.headers.get('ETag');
+    const key = `${start}|${etag}`;
+
+    if (etag && key === scheduleKey) {
+        return false;
+    }
+
     const scheduleResult = await scheduleResponse.json();
 
     if (!scheduleResult.success) {
@@ -54,6 +81,19 @@ async function loadData() {
     }
 
     scheduleData = scheduleResult.data;
+    scheduleKey = key;
+    return true;
+}
+
+// Re-render the calendar if the schedule was regenerated
+async function refreshSchedule() {
+    try {
+        if (await loadSchedule()) {
+            renderCalendar();
+        }
+    } catch (error) {
+        console.error('Error refreshing schedule:', error);
+    }
 }
 
 // Hide loading, show content
@@ -214,7 +254,7 @@ async function selectDate(dateStr) {
         })}`;
 
     // Fetch and render daily schedule
-    const response = await fetch(`/api/schedule/day/${dateStr}`);
+    const response = await fetch(`/api/schedule/day/${dateStr}`, { cache: 'no-cache' });
     const result = await response.json();
 
     if (!result.success) {
@@ -306,15 +346,21 @@ async function renderFailures() {
 
 // Setup event listeners
 function setupEventListeners() {
-    document.getElementById('prev-month').addEventListener('click', () => {
-        currentDate.setMonth(currentDate.getMonth() - 1);
-        renderCalendar();
-    });
+    document.getElementById('prev-month').addEventListener('click', () => changeMonth(-1));
+    document.getElementById('next-month').addEventListener('click', () => changeMonth(1));
+}
 
-    document.getElementById('next-month').addEventListener('click', () => {
-        currentDate.setMonth(currentDate.getMonth() + 1);
+// Move the calendar by a number of months and load that month
+async function changeMonth(offset) {
+    currentDate.setDate(1);
+    currentDate.setMonth(currentDate.getMonth() + offset);
+
+    try {
+        await loadSchedule();
         renderCalendar();
-    });
+    } catch (error) {
+        console.error('Error loading schedule:', error);
+    }
 }
 
 // Utility functions
@@ -0,0 +1,57 @@
+"""Tests for schedule day and month aggregates."""
+
+import json
+from datetime import date
+
+from models import Activity, ActivityType, Frequency, FrequencyPattern
+from scheduler.booking import Booking
+from utils import save_aggregates
+
+
+def make_activity(activity_id, activity_type, priority):
+    """A weekly activity of the given type and priority."""
+    return Activity(
+        id=activity_id,
+        name=f"Activity {activity_id}",
+        type=activity_type,
+        priority=priority,
+        frequency=Frequency(pattern=FrequencyPattern.WEEKLY, count=1),
+        duration_minutes=30
+    )
+
+
+class TestAggregates:
+    """Tests for save_aggregates."""
+
+    def test_day_and_month_totals(self, tmp_path):
+        """Test counts, booked minutes and priority/type mixes per day and month."""
+        activities = [
+            make_activity("act_001", ActivityType.MEDICATION, 1),
+            make_activity("act_002", ActivityType.FITNESS, 3),
+        ]
+        slots = [
+            Booking("act_002", date(2026, 1, 1), 600, 45),
+            Booking("act_001", date(2025, 12, 31), 420, 5),
+            Booking("act_002", date(2025, 12, 31), 480, 45),
+            Booking("act_999", date(2025, 12, 30), 480, 20),
+        ]
+
+        aggregates = save_aggregates(slots, activities, tmp_path / "calendar.json")
+
+        assert json.loads((tmp_path / "calendar.json").read_text()) == aggregates
+        assert list(aggregates["days"]) == ["2025-12-30", "2025-12-31", "2026-01-01"]
+        assert aggregates["days"]["2025-12-31"] == {
+            "count": 2,
+            "booked_minutes": 50,
+            "priorities": {"1": 1, "3": 1},
+            "types": {"Medication": 1, "Fitness": 1},
+        }
+        assert aggregates["days"]["2025-12-30"]["types"] == {"Unknown": 1}
+        assert aggregates["months"]["2025-12"] == {
+            "count": 3,
+            "booked_minutes": 70,
+            "priorities": {"5": 1, "1": 1, "3": 1},
+            "types": {"Unknown": 1, "Medication": 1, "Fitness": 1},
+            "active_days": 2,
+        }
+        assert aggregates["months"]["2026-01"]["active_days"] == 1
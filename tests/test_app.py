@@ -0,0 +1,216 @@
+"""Tests for the Flask API's cached JSON responses."""
+
+import gzip
+import json
+import os
+import pytest
+
+import app as web
+from utils import ScheduleRepository
+
+
+# Enough slots that the /api/schedule body is worth gzipping
+SLOTS = [
+    {"activity_id": f"act_00{i % 3 + 1}", "date": f"2025-12-{day:02d}", "start_time": f"{7 + i}:00:00",
+     "duration_minutes": 30, "specialist_id": None, "equipment_ids": []}
+    for day in range(9, 15) for i in range(3)
+]
+
+ACTIVITIES = [
+    {"id": "act_001", "name": "Walk", "type": "Fitness", "priority": 2},
+    {"id": "act_002", "name": "Consult", "type": "Consultation", "priority": 1},
+    {"id": "act_003", "name": "Stretch", "type": "Fitness", "priority": 3},
+]
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """A test client serving a repository over a temporary output directory."""
+    (tmp_path / "schedule.json").write_text(json.dumps(SLOTS))
+    (tmp_path / "activities.json").write_text(json.dumps(ACTIVITIES))
+    monkeypatch.setattr(web, "repository", ScheduleRepository(
+        tmp_path / "schedule.json", tmp_path / "activities.json", tmp_path / "schedule_columns"
+    ))
+    monkeypatch.setattr(web, "_body_cache", {})
+    return web.app.test_client()
+
+
+def touch_later(path):
+    """Move a file's mtime a second forward so the repository sees a change."""
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestCachedJson:
+    """Tests for ETag/Last-Modified revalidation, gzip and the body cache."""
+
+    def test_validators_and_vary(self, client):
+        """Test responses carry a weak ETag, Last-Modified and Vary."""
+        response = client.get("/api/schedule")
+
+        assert response.status_code == 200
+        assert response.headers["ETag"].startswith('W/"')
+        assert "Last-Modified" in response.headers
+        assert "no-cache" in response.headers["Cache-Control"]
+        assert "Accept-Encoding" in response.vary
+        assert len(response.get_json()["data"]) == len(SLOTS)
+
+    def test_not_modified_on_if_none_match(self, client):
+        """Test a matching ETag gets a bodiless 304 with the same validators."""
+        etag = client.get("/api/schedule").headers["ETag"]
+
+        response = client.get("/api/schedule", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.data == b""
+        assert response.headers["ETag"] == etag
+        assert "Accept-Encoding" in response.vary
+        assert client.get("/api/schedule", headers={"If-None-Match": 'W/"other"'}).status_code == 200
+
+    def test_not_modified_on_if_modified_since(self, client):
+        """Test If-Modified-Since at or after Last-Modified gets a 304."""
+        last_modified = client.get("/api/schedule").headers["Last-Modified"]
+
+        response = client.get("/api/schedule", headers={"If-Modified-Since": last_modified})
+
+        assert response.status_code == 304
+        assert response.data == b""
+        assert client.get(
+            "/api/schedule", headers={"If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"}
+        ).status_code == 200
+
+    def test_if_none_match_takes_precedence(self, client):
+        """Test a stale ETag wins over a fresh If-Modified-Since."""
+        last_modified = client.get("/api/schedule").headers["Last-Modified"]
+
+        response = client.get("/api/schedule", headers={
+            "If-None-Match": 'W/"other"', "If-Modified-Since": last_modified
+        })
+
+        assert response.status_code == 200
+
+    def test_gzip_only_when_accepted(self, client):
+        """Test large bodies are gzipped only for clients that accept gzip."""
+        plain = client.get("/api/schedule", headers={"Accept-Encoding": "identity"})
+        zipped = client.get("/api/schedule", headers={"Accept-Encoding": "gzip, deflate"})
+
+        assert "Content-Encoding" not in plain.headers
+        assert zipped.headers["Content-Encoding"] == "gzip"
+        assert json.loads(gzip.decompress(zipped.data)) == plain.get_json()
+        assert zipped.headers["ETag"] == plain.headers["ETag"]
+
+    def test_small_bodies_not_gzipped(self, client):
+        """Test bodies under GZIP_MIN_SIZE are sent as-is even when gzip is accepted."""
+        response = client.get("/api/schedule/day/2025-12-09", headers={"Accept-Encoding": "gzip"})
+
+        assert len(response.data) < web.GZIP_MIN_SIZE
+        assert "Content-Encoding" not in response.headers
+        assert len(response.get_json()["data"]) == 3
+
+    def test_body_cached_per_url(self, client):
+        """Test each URL and encoding gets its own cached body."""
+        client.get("/api/schedule")
+        client.get("/api/schedule")
+        client.get("/api/schedule", headers={"Accept-Encoding": "gzip"})
+        client.get("/api/schedule/day/2025-12-09")
+
+        assert len(web._body_cache) == 3
+        assert {path for path, _, _ in web._body_cache} == {"/api/schedule?", "/api/schedule/day/2025-12-09?"}
+
+    def test_body_cache_invalidated_when_etag_changes(self, client, tmp_path):
+        """Test a changed schedule file gets a new ETag and a freshly built body."""
+        first = client.get("/api/schedule")
+
+        schedule_path = tmp_path / "schedule.json"
+        schedule_path.write_text(json.dumps(SLOTS[:2]))
+        touch_later(schedule_path)
+
+        second = client.get("/api/schedule", headers={"If-None-Match": first.headers["ETag"]})
+
+        assert second.status_code == 200
+        assert second.headers["ETag"] != first.headers["ETag"]
+        assert len(second.get_json()["data"]) == 2
+        assert client.get("/api/schedule", headers={"If-None-Match": second.headers["ETag"]}).status_code == 304
+
+
+class TestScheduleQuery:
+    """Tests for /api/schedule filters, pagination and projection."""
+
+    @pytest.mark.parametrize("query", [
+        "priority=high", "limit=0", "limit=-1", "limit=ten", "fields=activity_id,colour",
+        "limit=2&cursor=bogus", "start=2025-13-01", "end=yesterday"
+    ])
+    def test_bad_parameters_are_400(self, client, query):
+        """Test malformed parameters are rejected as client errors."""
+        response = client.get(f"/api/schedule?{query}")
+
+        assert response.status_code == 400
+        assert response.get_json()["success"] is False
+        assert response.get_json()["error"]
+
+    def test_stale_cursor_is_400(self, client, tmp_path):
+        """Test a cursor from before the schedule changed is rejected."""
+        cursor = client.get("/api/schedule?limit=2").get_json()["next_cursor"]
+
+        schedule_path = tmp_path / "schedule.json"
+        schedule_path.write_text(json.dumps(SLOTS[:5]))
+        touch_later(schedule_path)
+
+        response = client.get(f"/api/schedule?limit=2&cursor={cursor}")
+        assert response.status_code == 400
+        assert "stale" in response.get_json()["error"]
+
+    def test_next_cursor_only_with_limit(self, client):
+        """Test next_cursor is returned when paging and absent otherwise."""
+        assert "next_cursor" not in client.get("/api/schedule?type=Fitness").get_json()
+
+        page = client.get("/api/schedule?type=Fitness&limit=5").get_json()
+        assert len(page["data"]) == 5
+        assert page["next_cursor"]
+
+        last = client.get("/api/schedule?type=Fitness&limit=100").get_json()
+        assert len(last["data"]) == 12
+        assert last["next_cursor"] is None
+
+    def test_pages_cover_filtered_slots(self, client):
+        """Test following next_cursor returns every matching slot once, in order."""
+        expected = client.get("/api/schedule?start=2025-12-10&priority=2").get_json()["data"]
+
+        url = "/api/schedule?start=2025-12-10&priority=2&limit=2"
+        page = client.get(url).get_json()
+        slots = page["data"]
+        while page["next_cursor"] is not None:
+            page = client.get(f"{url}&cursor={page['next_cursor']}").get_json()
+            slots.extend(page["data"])
+
+        assert slots == expected
+        assert [s["date"] for s in slots] == [f"2025-12-{day}" for day in range(10, 15)]
+
+    def test_field_projection(self, client):
+        """Test ?fields= returns only the requested fields of each slot."""
+        response = client.get("/api/schedule?activity_id=act_002&fields=date, start_time,activity_name")
+
+        assert response.status_code == 200
+        assert response.get_json()["data"][0] == {
+            "date": "2025-12-09", "start_time": "8:00:00", "activity_name": "Consult"
+        }
+        assert all(set(slot) == {"date", "start_time", "activity_name"} for slot in response.get_json()["data"])
+
+
+class TestDaySchedule:
+    """Tests for /api/schedule/day/<date>."""
+
+    def test_day_slots(self, client):
+        """Test a day's slots are returned in start time order, empty for a free day."""
+        day = client.get("/api/schedule/day/2025-12-10").get_json()["data"]
+
+        assert [s["start_time"] for s in day] == ["7:00:00", "8:00:00", "9:00:00"]
+        assert client.get("/api/schedule/day/2026-01-01").get_json()["data"] == []
+
+    @pytest.mark.parametrize("day", ["bad", "2025-12-32", "2025-12"])
+    def test_invalid_date_is_400(self, client, day):
+        """Test a malformed date is a client error, like a bad ?start=."""
+        response = client.get(f"/api/schedule/day/{day}")
+
+        assert response.status_code == 400
+        assert response.get_json()["success"] is False
@@ -0,0 +1,133 @@
+"""Tests for parallel multi-client batch scheduling."""
+
+import json
+import pytest
+from datetime import date, time
+
+from models import Specialist, SpecialistType, AvailabilityBlock, Equipment
+from scheduler.availability import SpecialistAvailability
+from scheduler.batch import schedule_clients, schedule_clients_shared
+
+
+def write_client(client_dir, start_date=None):
+    """Write a one-activity client dataset."""
+    client_dir.mkdir()
+    activities = [{
+        "id": "act_001",
+        "name": "Strength session",
+        "type": "Fitness",
+        "priority": 1,
+        "frequency": {"pattern": "Weekly", "count": 2},
+        "duration_minutes": 60,
+        "specialist_id": "spec_001",
+        "equipment_ids": ["equip_001"]
+    }]
+    (client_dir / "activities.json").write_text(json.dumps(activities))
+    if start_date:
+        (client_dir / "metadata.json").write_text(json.dumps({"start_date": start_date}))
+
+
+@pytest.fixture
+def resources():
+    """Shared specialist and equipment."""
+    specialist = Specialist(
+        id="spec_001",
+        name="Coach",
+        type=SpecialistType.TRAINER,
+        availability=[
+            AvailabilityBlock(day_of_week=day, start_time=time(8, 0), end_time=time(17, 0))
+            for day in range(5)
+        ]
+    )
+    equipment = Equipment(id="equip_001", name="Rack", location="Gym")
+    return [specialist], [equipment]
+
+
+def test_schedule_clients_writes_per_client_results(tmp_path, resources):
+    """Test every client is scheduled and saved to its own directory."""
+    specialists, equipment = resources
+    write_client(tmp_path / "alice", start_date="2025-12-08")
+    write_client(tmp_path / "bob")
+
+    summaries = list(schedule_clients(
+        [tmp_path / "alice", tmp_path / "bob"],
+        tmp_path / "out",
+        specialists,
+        equipment,
+        duration_days=14,
+        default_start_date=date(2025, 12, 15),
+        max_workers=2
+    ))
+
+    assert sorted(s["client"] for s in summaries) == ["alice", "bob"]
+    for name in ("alice", "bob"):
+        schedule = json.loads((tmp_path / "out" / name / "schedule.json").read_text())
+        assert len(schedule) == 4
+        assert (tmp_path / "out" / name / "failures.json").exists()
+
+    bob_metadata = json.loads((tmp_path / "out" / "bob" / "schedule_metadata.json").read_text())
+    assert bob_metadata["start_date"] == "2025-12-15"
+
+
+def test_schedule_clients_rejects_duplicate_names(tmp_path, resources):
+    """Test clients that would share an output directory are rejected."""
+    specialists, equipment = resources
+    with pytest.raises(ValueError):
+        list(schedule_clients(
+            [tmp_path / "a" / "client", tmp_path / "b" / "client"],
+            tmp_path / "out",
+            specialists,
+            equipment
+        ))
+
+
+def test_shared_capacity_across_clients(tmp_path, resources):
+    """Test clients on a shared ledger never double-book the specialist."""
+    specialists, equipment = resources
+    write_client(tmp_path / "alice", start_date="2025-12-08")
+    write_client(tmp_path / "bob", start_date="2025-12-08")
+
+    summaries = list(schedule_clients_shared(
+        [tmp_path / "alice", tmp_path / "bob"],
+        tmp_path / "out",
+        specialists,
+        equipment,
+        duration_days=14
+    ))
+
+    assert [s["client"] for s in summaries] == ["alice", "bob"]
+    starts = [
+        (slot["date"], slot["start_time"])
+        for name in ("alice", "bob")
+        for slot in json.loads((tmp_path / "out" / name / "schedule.json").read_text())
+    ]
+    assert len(starts) == 8
+    assert len(set(starts)) == 8
+
+
+def test_availability_compiled_once_over_batch_horizon(tmp_path, resources, monkeypatch):
+    """Test clients reuse one set of masks covering every client's dates."""
+    specialists, equipment = resources
+    write_client(tmp_path / "alice", start_date="2025-12-08")
+    write_client(tmp_path / "bob", start_date="2025-12-15")
+
+    compiled = []
+    original_init = SpecialistAvailability.__init__
+
+    def counting_init(self, *args, **kwargs):
+        compiled.append(self)
+        original_init(self, *args, **kwargs)
+
+    monkeypatch.setattr(SpecialistAvailability, "__init__", counting_init)
+
+    list(schedule_clients_shared(
+        [tmp_path / "alice", tmp_path / "bob"],
+        tmp_path / "out",
+        specialists,
+        equipment,
+        duration_days=14
+    ))
+
+    assert len(compiled) == 1
+    assert min(compiled[0]._dates) == date(2025, 12, 8)
+    assert max(compiled[0]._dates) == date(2025, 12, 28)
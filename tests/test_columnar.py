@@ -0,0 +1,68 @@
+"""Tests for the columnar schedule store."""
+
+import json
+import pytest
+from datetime import date
+
+from scheduler.booking import Booking
+from utils import save_columnar, save_schedule, ColumnarSchedule
+
+
+def make_slots():
+    """Bookings across three days, deliberately out of date order."""
+    return [
+        Booking("act_002", date(2025, 12, 10), 615, 45, "spec_001", ["equip_001", "equip_002"]),
+        Booking("act_001", date(2025, 12, 8), 420, 30),
+        Booking("act_003", date(2025, 12, 9), 480, 60, None, ["equip_002"]),
+        Booking("act_001", date(2025, 12, 9), 420, 30),
+    ]
+
+
+class TestColumnarSchedule:
+    """Tests for save_columnar and ColumnarSchedule."""
+
+    def test_round_trip_matches_schedule_json(self, tmp_path):
+        """Test rows come back as schedule.json dicts, in date and time order."""
+        slots = make_slots()
+        assert save_columnar(slots, tmp_path / "columns") == 4
+        save_schedule(slots, tmp_path / "schedule.json")
+        expected = json.loads((tmp_path / "schedule.json").read_text())
+
+        with ColumnarSchedule(tmp_path / "columns") as store:
+            assert len(store) == 4
+            rows = store.slots()
+
+        assert rows == sorted(expected, key=lambda s: (s["date"], s["start_time"]))
+
+    def test_date_range_slicing(self, tmp_path):
+        """Test date ranges are inclusive and open-ended when omitted."""
+        save_columnar(make_slots(), tmp_path / "columns")
+
+        with ColumnarSchedule(tmp_path / "columns") as store:
+            day = store.slots(date(2025, 12, 9), date(2025, 12, 9))
+            assert [(s["activity_id"], s["start_time"]) for s in day] == [
+                ("act_001", "07:00:00"), ("act_003", "08:00:00")
+            ]
+            assert store.index_range(date(2025, 12, 9)) == (1, 4)
+            assert store.index_range(end_date=date(2025, 12, 8)) == (0, 1)
+            assert store.slots(date(2026, 1, 1)) == []
+
+    def test_empty_store(self, tmp_path):
+        """Test an empty schedule can be written and read."""
+        save_columnar([], tmp_path / "columns")
+        with ColumnarSchedule(tmp_path / "columns") as store:
+            assert len(store) == 0
+            assert store.slots() == []
+
+    def test_rejects_missing_or_incompatible_store(self, tmp_path):
+        """Test opening a missing or foreign-layout store fails clearly."""
+        with pytest.raises(FileNotFoundError):
+            ColumnarSchedule(tmp_path / "missing")
+
+        save_columnar(make_slots(), tmp_path / "columns")
+        meta_path = tmp_path / "columns" / "meta.json"
+        meta = json.loads(meta_path.read_text())
+        meta["version"] = 0
+        meta_path.write_text(json.dumps(meta))
+        with pytest.raises(ValueError):
+            ColumnarSchedule(tmp_path / "columns")
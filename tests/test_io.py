@@ -0,0 +1,104 @@
+"""Tests for schedule file I/O."""
+
+import gzip
+import json
+import pytest
+from datetime import date, time
+
+from models import TimeSlot
+from scheduler.booking import Booking
+from utils import save_json, save_schedule, load_activities, load_timeslots, load_travel
+
+
+def make_slots():
+    """A couple of bookings, one with a specialist and equipment."""
+    return [
+        Booking("act_001", date(2025, 12, 8), 420, 30),
+        Booking("act_002", date(2025, 12, 9), 615, 45, "spec_001", ["equip_001", "equip_002"]),
+    ]
+
+
+class TestSaveSchedule:
+    """Tests for the streaming schedule writer."""
+
+    def test_matches_save_json_output(self, tmp_path):
+        """Test indented and compact arrays are byte-identical to save_json."""
+        slots = make_slots()
+        for indent in (2, None):
+            save_json(slots, tmp_path / "expected.json", indent=indent)
+            save_schedule(slots, tmp_path / "streamed.json", indent=indent)
+            assert (tmp_path / "streamed.json").read_text() == (tmp_path / "expected.json").read_text()
+
+    def test_empty_schedule(self, tmp_path):
+        """Test an empty schedule is an empty JSON array."""
+        assert save_schedule([], tmp_path / "schedule.json") == 0
+        assert json.loads((tmp_path / "schedule.json").read_text()) == []
+
+    def test_ndjson_gzip_round_trip(self, tmp_path):
+        """Test suffixes select gzipped NDJSON and load_timeslots reads it back."""
+        slots = make_slots()
+        path = tmp_path / "schedule.ndjson.gz"
+
+        assert save_schedule(slots, path) == 2
+
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        assert [json.loads(line)["activity_id"] for line in lines] == ["act_001", "act_002"]
+        assert load_timeslots(path) == [slot.to_time_slot() for slot in slots]
+
+    def test_accepts_time_slots(self, tmp_path):
+        """Test TimeSlot models are written like bookings."""
+        slot = TimeSlot(activity_id="act_001", date=date(2025, 12, 8), start_time=time(7, 0), duration_minutes=30)
+        save_schedule([slot], tmp_path / "schedule.json", indent=None)
+        assert load_timeslots(tmp_path / "schedule.json") == [slot]
+
+
+class TestLoaders:
+    """Tests for the bulk-validating loaders."""
+
+    def test_loads_valid_items(self, tmp_path):
+        """Test every item is validated into a model."""
+        path = tmp_path / "travel.json"
+        path.write_text(json.dumps([{
+            "id": "travel_001",
+            "start_date": "2025-12-20",
+            "end_date": "2025-12-27",
+            "location": "Lisbon"
+        }]))
+
+        travel = load_travel(path)
+        assert travel[0].location == "Lisbon"
+        assert travel[0].start_date == date(2025, 12, 20)
+
+    def test_reports_each_invalid_item(self, tmp_path):
+        """Test errors name each failing item by index and ID."""
+        valid = {
+            "id": "act_001",
+            "name": "Walk",
+            "type": "Fitness",
+            "priority": 1,
+            "frequency": {"pattern": "Daily", "count": 1},
+            "duration_minutes": 30
+        }
+        path = tmp_path / "activities.json"
+        path.write_text(json.dumps([
+            valid,
+            {**valid, "id": "act_002", "priority": 9},
+            {**valid, "id": "act_003", "duration_minutes": 1, "name": ""},
+        ]))
+
+        with pytest.raises(ValueError) as excinfo:
+            load_activities(path)
+
+        lines = str(excinfo.value).splitlines()
+        assert lines[0] == "Validation errors in activities:"
+        assert lines[1].startswith("Activity 1 (act_002): priority:")
+        assert lines[2].startswith("Activity 2 (act_003): ")
+        assert "name:" in lines[2] and "duration_minutes:" in lines[2]
+
+    def test_rejects_non_array(self, tmp_path):
+        """Test a JSON object is not accepted as a list of items."""
+        path = tmp_path / "activities.json"
+        path.write_text("{}")
+        with pytest.raises(ValueError, match="must contain a JSON array"):
+            load_activities(path)
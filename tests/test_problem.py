@@ -0,0 +1,118 @@
+"""Tests for compiled problem files."""
+
+import json
+import pickle
+import pytest
+from datetime import date
+
+from scheduler import problem as problem_module
+from scheduler.problem import MAGIC, compile_problem, load_problem, schema_hash, source_hash
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """A minimal dataset directory."""
+    (tmp_path / "activities.json").write_text(json.dumps([{
+        "id": "act_001",
+        "name": "Strength session",
+        "type": "Fitness",
+        "priority": 1,
+        "frequency": {"pattern": "Weekly", "count": 2},
+        "duration_minutes": 60,
+        "specialist_id": "spec_001"
+    }]))
+    (tmp_path / "specialists.json").write_text(json.dumps([{
+        "id": "spec_001",
+        "name": "Coach",
+        "type": "Trainer",
+        "availability": [{"day_of_week": 0, "start_time": "08:00:00", "end_time": "12:00:00"}],
+        "days_off": ["2025-12-15"]
+    }]))
+    (tmp_path / "equipment.json").write_text("[]")
+    (tmp_path / "metadata.json").write_text(json.dumps({
+        "start_date": "2025-12-08", "end_date": "2025-12-21"
+    }))
+    return tmp_path
+
+
+class TestProblemCache:
+    """Tests for compile_problem and load_problem."""
+
+    def test_compiles_on_first_load(self, data_dir):
+        """Test the first load validates the JSON and writes the compiled file."""
+        problem = load_problem(data_dir)
+
+        assert (data_dir / "problem.bin").read_bytes().startswith(MAGIC)
+        assert problem.start_date == date(2025, 12, 8)
+        assert problem.end_date == date(2025, 12, 21)
+        assert problem.travel_periods == []
+        assert problem.availability["spec_001"].covers(date(2025, 12, 8), 480, 540)
+        assert not problem.availability["spec_001"].covers(date(2025, 12, 15), 480, 540)
+
+    def test_warm_load_uses_compiled_file(self, data_dir, monkeypatch):
+        """Test an up-to-date compiled file is read without recompiling."""
+        compiled = compile_problem(data_dir)
+        monkeypatch.setattr(
+            "scheduler.problem.compile_problem",
+            lambda *args: pytest.fail("recompiled an up-to-date problem")
+        )
+
+        problem = load_problem(data_dir)
+        assert problem.activities == compiled.activities
+        assert problem.specialists == compiled.specialists
+
+    def test_source_change_recompiles(self, data_dir):
+        """Test editing the source JSON invalidates the compiled file."""
+        load_problem(data_dir)
+        activities = json.loads((data_dir / "activities.json").read_text())
+        activities[0]["name"] = "Renamed"
+        (data_dir / "activities.json").write_text(json.dumps(activities))
+
+        assert load_problem(data_dir).activities[0].name == "Renamed"
+
+    def test_corrupt_file_recompiles(self, data_dir):
+        """Test an unreadable compiled file is replaced."""
+        load_problem(data_dir)
+        path = data_dir / "problem.bin"
+        path.write_bytes(path.read_bytes()[:60])
+
+        assert load_problem(data_dir).activities[0].id == "act_001"
+        assert len(path.read_bytes()) > 60
+
+    def test_schema_change_recompiles(self, data_dir, monkeypatch):
+        """Test a compiled file written by other model code is not loaded."""
+        load_problem(data_dir)
+        monkeypatch.setattr(problem_module, "schema_hash", lambda: b"\x00" * 32)
+
+        compiled = []
+        original_compile = problem_module.compile_problem
+
+        def counting_compile(*args):
+            compiled.append(args)
+            return original_compile(*args)
+
+        monkeypatch.setattr(problem_module, "compile_problem", counting_compile)
+
+        assert load_problem(data_dir).activities[0].id == "act_001"
+        assert len(compiled) == 1
+
+    def test_unloadable_payload_recompiles(self, data_dir):
+        """Test any error while unpickling is treated as a stale cache."""
+        path = data_dir / "problem.bin"
+        payload = pickle.dumps(_Unloadable(), protocol=pickle.HIGHEST_PROTOCOL)
+        path.write_bytes(MAGIC + schema_hash() + source_hash(data_dir) + payload)
+
+        assert load_problem(data_dir).activities[0].id == "act_001"
+        assert path.read_bytes() != MAGIC + schema_hash() + source_hash(data_dir) + payload
+
+
+def _fail_to_restore():
+    """Raise like a payload whose classes no longer match the code."""
+    raise TypeError("payload no longer matches the code")
+
+
+class _Unloadable:
+    """Pickles fine but raises TypeError when unpickled."""
+
+    def __reduce__(self):
+        return (_fail_to_restore, ())
@@ -0,0 +1,219 @@
+"""Tests for the cached schedule repository."""
+
+import json
+import os
+import pytest
+from datetime import date
+
+from scheduler.booking import Booking
+from utils import ScheduleRepository, save_columnar
+
+
+SLOTS = [
+    {"activity_id": "act_002", "date": "2025-12-09", "start_time": "10:00:00",
+     "duration_minutes": 45, "specialist_id": "spec_001", "equipment_ids": []},
+    {"activity_id": "act_001", "date": "2025-12-09", "start_time": "07:00:00",
+     "duration_minutes": 30, "specialist_id": None, "equipment_ids": []},
+    {"activity_id": "act_001", "date": "2025-12-31", "start_time": "07:00:00",
+     "duration_minutes": 30, "specialist_id": None, "equipment_ids": []},
+    {"activity_id": "act_003", "date": "2026-01-02", "start_time": "08:00:00",
+     "duration_minutes": 60, "specialist_id": None, "equipment_ids": ["equip_001"]},
+]
+
+ACTIVITIES = [
+    {"id": "act_001", "name": "Walk", "type": "Fitness", "priority": 2, "details": "Brisk"},
+    {"id": "act_002", "name": "Consult", "type": "Consultation", "priority": 1},
+]
+
+
+@pytest.fixture
+def repository(tmp_path):
+    """A repository over small schedule and activity files."""
+    (tmp_path / "schedule.json").write_text(json.dumps(SLOTS))
+    (tmp_path / "activities.json").write_text(json.dumps(ACTIVITIES))
+    return ScheduleRepository(tmp_path / "schedule.json", tmp_path / "activities.json")
+
+
+class TestScheduleRepository:
+    """Tests for ScheduleRepository indexes and invalidation."""
+
+    def test_enrichment(self, repository):
+        """Test slots are joined with activity details and listed in date and time order."""
+        slots = repository.all_slots()
+
+        assert [s["activity_id"] for s in slots] == ["act_001", "act_002", "act_001", "act_003"]
+        assert slots[1]["activity_name"] == "Consult"
+        assert slots[1]["priority"] == 1
+        assert slots[3]["activity_name"] == "Unknown"
+        assert slots[3]["activity_type"] == "Unknown"
+        assert slots[3]["priority"] == 5
+
+    def test_day_sorted_with_details(self, repository):
+        """Test a day's slots are sorted by start time and carry details."""
+        day = repository.day("2025-12-09")
+
+        assert [s["start_time"] for s in day] == ["07:00:00", "10:00:00"]
+        assert day[0]["details"] == "Brisk"
+        assert day[1]["details"] == ""
+        assert repository.day("2025-12-10") == []
+
+    def test_date_range(self, repository):
+        """Test date ranges are inclusive and open-ended when omitted."""
+        assert [s["date"] for s in repository.date_range("2025-12-10", "2025-12-31")] == ["2025-12-31"]
+        assert [s["date"] for s in repository.date_range(end="2025-12-09")] == ["2025-12-09"] * 2
+        assert [s["date"] for s in repository.date_range(start="2026-01-01")] == ["2026-01-02"]
+        assert repository.date_range("2027-01-01", "2027-12-31") == []
+
+    def test_month_and_activity(self, repository):
+        """Test the month and activity indexes."""
+        december = repository.month(2025, 12)
+
+        assert sorted(december) == ["2025-12-09", "2025-12-31"]
+        assert len(december["2025-12-09"]) == 2
+        assert repository.month(2026, 2) == {}
+        assert [s["date"] for s in repository.for_activity("act_001")] == ["2025-12-09", "2025-12-31"]
+        assert repository.for_activity("act_999") == []
+
+    def test_query_filters(self, repository):
+        """Test filters combine with each other and with the date range."""
+        slots, next_cursor = repository.query(activity_id="act_001")
+        assert [s["date"] for s in slots] == ["2025-12-09", "2025-12-31"]
+        assert next_cursor is None
+
+        assert [s["activity_id"] for s in repository.query(priority=1)[0]] == ["act_002"]
+        assert [s["date"] for s in repository.query(end="2025-12-09", activity_type="Fitness")[0]] == ["2025-12-09"]
+        assert repository.query(activity_type="Fitness", priority=1)[0] == []
+        assert repository.query(activity_id="act_999")[0] == []
+
+    def test_query_pagination(self, repository):
+        """Test cursor pages cover every slot once, in date and time order."""
+        seen = []
+        cursor = None
+        while True:
+            page, cursor = repository.query(limit=3, cursor=cursor)
+            assert len(page) <= 3
+            seen.extend(page)
+            if cursor is None:
+                break
+
+        assert seen == repository.date_range()
+        assert [(s["date"], s["start_time"]) for s in seen] == sorted(
+            (s["date"], s["start_time"]) for s in SLOTS
+        )
+
+    def test_query_rejects_bad_cursor(self, repository, tmp_path):
+        """Test malformed and stale cursors are rejected."""
+        _, cursor = repository.query(limit=1)
+
+        with pytest.raises(ValueError):
+            repository.query(cursor="not-a-cursor")
+
+        schedule_path = tmp_path / "schedule.json"
+        schedule_path.write_text(json.dumps(SLOTS[:2]))
+        stat = os.stat(schedule_path)
+        os.utime(schedule_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        with pytest.raises(ValueError, match="stale"):
+            repository.query(limit=1, cursor=cursor)
+
+    def test_calendar_computed_without_file(self, repository):
+        """Test calendar aggregates are computed from the slots when calendar.json is absent."""
+        days, month = repository.calendar(2025, 12)
+
+        assert days["2025-12-09"] == {
+            "count": 2,
+            "booked_minutes": 75,
+            "priorities": {"2": 1, "1": 1},
+            "types": {"Fitness": 1, "Consultation": 1},
+        }
+        assert month["count"] == 3
+        assert month["active_days"] == 2
+        assert repository.calendar(2026, 2) == ({}, None)
+
+    def test_calendar_prefers_fresh_file(self, tmp_path):
+        """Test calendar.json is served when written after the schedule, ignored when older."""
+        aggregates = {"days": {"2025-12-09": {"count": 99}}, "months": {"2025-12": {"count": 99}}}
+        (tmp_path / "schedule.json").write_text(json.dumps(SLOTS))
+        (tmp_path / "activities.json").write_text(json.dumps(ACTIVITIES))
+        calendar_path = tmp_path / "calendar.json"
+        calendar_path.write_text(json.dumps(aggregates))
+        repository = ScheduleRepository(
+            tmp_path / "schedule.json", tmp_path / "activities.json", aggregates_path=calendar_path
+        )
+
+        assert repository.calendar(2025, 12) == ({"2025-12-09": {"count": 99}}, {"count": 99})
+
+        stat = os.stat(calendar_path)
+        os.utime(calendar_path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10_000_000_000))
+        assert repository.calendar(2025, 12)[1]["count"] == 3
+
+    def test_calendar_file_stale_after_activities_edit(self, tmp_path):
+        """Test calendar.json is ignored once activities.json is edited after it."""
+        (tmp_path / "schedule.json").write_text(json.dumps(SLOTS))
+        activities_path = tmp_path / "activities.json"
+        activities_path.write_text(json.dumps(ACTIVITIES))
+        calendar_path = tmp_path / "calendar.json"
+        calendar_path.write_text(json.dumps({"days": {}, "months": {"2025-12": {"count": 99}}}))
+        repository = ScheduleRepository(
+            tmp_path / "schedule.json", activities_path, aggregates_path=calendar_path
+        )
+        assert repository.calendar(2025, 12)[1] == {"count": 99}
+
+        activities_path.write_text(json.dumps([{**ACTIVITIES[0], "priority": 1}, ACTIVITIES[1]]))
+        stat = os.stat(calendar_path)
+        os.utime(activities_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        days, month = repository.calendar(2025, 12)
+        assert month["count"] == 3
+        assert days["2025-12-09"]["priorities"] == {"1": 2}
+
+    def test_reloads_when_file_changes(self, repository, tmp_path):
+        """Test the indexes are rebuilt only after a source file changes."""
+        first = repository.all_slots()
+        assert repository.all_slots() is first
+
+        schedule_path = tmp_path / "schedule.json"
+        schedule_path.write_text(json.dumps(SLOTS[:1]))
+        stat = os.stat(schedule_path)
+        os.utime(schedule_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert len(repository.all_slots()) == 1
+        assert repository.month(2026, 1) == {}
+
+    def test_cache_validators_follow_file_changes(self, repository, tmp_path):
+        """Test the ETag is stable until a source file changes."""
+        etag, last_modified = repository.cache_validators()
+        assert repository.cache_validators() == (etag, last_modified)
+        assert last_modified.tzinfo is not None
+
+        activities_path = tmp_path / "activities.json"
+        activities_path.write_text(json.dumps(ACTIVITIES[:1]))
+        stat = os.stat(activities_path)
+        os.utime(activities_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        new_etag, new_last_modified = repository.cache_validators()
+        assert new_etag != etag
+        assert new_last_modified > last_modified
+
+    def test_columns_used_only_when_current(self, tmp_path):
+        """Test the columnar store is used until schedule.json is rewritten after it."""
+        schedule_path = tmp_path / "schedule.json"
+        schedule_path.write_text(json.dumps(SLOTS))
+        (tmp_path / "activities.json").write_text(json.dumps(ACTIVITIES))
+        save_columnar([Booking("act_001", date(2025, 12, 9), 420, 30)], tmp_path / "columns")
+        stat = os.stat(schedule_path)
+        os.utime(tmp_path / "columns" / "meta.json", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        repository = ScheduleRepository(
+            schedule_path, tmp_path / "activities.json", columns_dir=tmp_path / "columns"
+        )
+
+        assert len(repository.all_slots()) == 1
+
+        os.utime(schedule_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+        assert len(repository.all_slots()) == 4
+
+    def test_missing_file(self, tmp_path):
+        """Test a missing schedule raises FileNotFoundError."""
+        repository = ScheduleRepository(tmp_path / "schedule.json", tmp_path / "activities.json")
+        with pytest.raises(FileNotFoundError):
+            repository.all_slots()
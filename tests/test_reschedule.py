@@ -0,0 +1,159 @@
+"""Tests for incremental rescheduling of an existing schedule."""
+
+import pytest
+from datetime import date, time
+
+from models import (
+    Activity, Frequency, FrequencyPattern, ActivityType, Equipment, MaintenanceWindow,
+    Specialist, SpecialistType, AvailabilityBlock, TravelPeriod
+)
+from scheduler import (
+    GreedyScheduler, AddActivity, AddMaintenance, AddTravel, RemoveActivity, SpecialistDayOff
+)
+
+
+START = date(2025, 12, 8)  # Monday
+
+
+def weekly(activity_id, count=2, **kwargs):
+    """Build a weekly activity."""
+    return Activity(
+        id=activity_id,
+        name=f"Activity {activity_id}",
+        type=kwargs.pop("type", ActivityType.FITNESS),
+        priority=kwargs.pop("priority", 2),
+        frequency=Frequency(pattern=FrequencyPattern.WEEKLY, count=count),
+        duration_minutes=kwargs.pop("duration_minutes", 60),
+        **kwargs
+    )
+
+
+@pytest.fixture
+def scheduler():
+    """A scheduled two-week calendar with one specialist and one piece of equipment."""
+    specialist = Specialist(
+        id="spec_001",
+        name="Coach",
+        type=SpecialistType.TRAINER,
+        availability=[
+            AvailabilityBlock(day_of_week=day, start_time=time(8, 0), end_time=time(17, 0))
+            for day in range(5)
+        ]
+    )
+    equipment = Equipment(id="equip_001", name="Rack", location="Gym")
+    activities = [
+        weekly("act_coach", specialist_id="spec_001"),
+        weekly("act_rack", equipment_ids=["equip_001"]),
+        weekly("act_remote", remote_capable=True),
+    ]
+    scheduler = GreedyScheduler(
+        activities=activities,
+        specialists=[specialist],
+        equipment=[equipment],
+        travel_periods=[],
+        start_date=START,
+        duration_days=14
+    )
+    scheduler.schedule()
+    return scheduler
+
+
+def snapshot(scheduler):
+    """Bookings as comparable tuples."""
+    return {
+        (s.activity_id, s.date, s.start_min) for s in scheduler.state.booked_slots
+    }
+
+
+class TestReschedule:
+    """Tests for GreedyScheduler.reschedule."""
+
+    def test_specialist_day_off_moves_only_that_specialists_bookings(self, scheduler):
+        """Test a sick day unbooks the specialist's bookings on that date only."""
+        before = snapshot(scheduler)
+        sick_day = next(s.date for s in scheduler.state.booked_slots if s.activity_id == "act_coach")
+
+        result = scheduler.reschedule(SpecialistDayOff("spec_001", sick_day))
+
+        assert [s.activity_id for s in result.removed] == ["act_coach"]
+        assert len(result.added) == 1
+        assert result.added[0].date != sick_day
+        after = snapshot(scheduler)
+        assert before - after == {(s.activity_id, s.date, s.start_min) for s in result.removed}
+        assert after - before == {(s.activity_id, s.date, s.start_min) for s in result.added}
+
+    def test_travel_keeps_remote_capable_bookings(self, scheduler):
+        """Test remote-only travel unbooks in-person sessions but not remote ones."""
+        travel = TravelPeriod(
+            id="travel_001",
+            start_date=START,
+            end_date=date(2025, 12, 14),
+            location="Lisbon",
+            remote_activities_only=True
+        )
+
+        result = scheduler.reschedule(AddTravel(travel))
+
+        assert result.removed
+        assert all(s.activity_id != "act_remote" for s in result.removed)
+        assert all(s.date > travel.end_date for s in result.added)
+        assert sum(
+            1 for s in scheduler.state.booked_slots
+            if s.activity_id == "act_remote" and s.date <= travel.end_date
+        ) == 2
+
+    def test_timed_maintenance_only_hits_overlapping_bookings(self, scheduler):
+        """Test a maintenance window only unbooks equipment use it overlaps."""
+        slot = next(s for s in scheduler.state.booked_slots if s.activity_id == "act_rack")
+        window = MaintenanceWindow(
+            start_date=slot.date,
+            end_date=slot.date,
+            start_time=slot.start_time,
+            end_time=time(23, 0)
+        )
+
+        result = scheduler.reschedule(AddMaintenance("equip_001", window))
+
+        assert result.removed == [slot]
+        assert result.added[0].activity_id == "act_rack"
+        assert scheduler.checker._check_equipment(
+            scheduler.activities[1], slot.date, slot.start_min, scheduler.state
+        ) is not None
+
+    def test_add_and_remove_activity(self, scheduler):
+        """Test activities can join and leave without touching other bookings."""
+        before = snapshot(scheduler)
+
+        added = scheduler.reschedule(AddActivity(weekly("act_new", count=1)))
+        assert len(added.added) == 2
+        assert snapshot(scheduler) - before == {
+            (s.activity_id, s.date, s.start_min) for s in added.added
+        }
+
+        removed = scheduler.reschedule(RemoveActivity("act_new"))
+        assert snapshot(scheduler) == before
+        assert len(removed.removed) == 2
+        assert scheduler.state.get_occurrence_count("act_new") == 0
+
+    def test_counters_match_a_fresh_state(self, scheduler):
+        """Test removal leaves the same day counters as never booking."""
+        scheduler.reschedule(RemoveActivity("act_coach"))
+
+        state = scheduler.state
+        expected = {}
+        for slot in state.booked_slots:
+            expected[slot.date] = expected.get(slot.date, 0) + 1
+        assert state.day_counts == expected
+        assert all(
+            count == expected.get(d, 0) for d, count in scheduler.scorer.daily_counts.items()
+        )
+        assert len(state.ledger.specialist_index["spec_001"]) == 0
+
+    def test_unknown_ids_are_rejected(self, scheduler):
+        """Test changes naming unknown resources or activities raise ValueError."""
+        with pytest.raises(ValueError):
+            scheduler.reschedule(SpecialistDayOff("spec_999", START))
+        with pytest.raises(ValueError):
+            scheduler.reschedule(RemoveActivity("act_999"))
+        with pytest.raises(ValueError):
+            scheduler.reschedule(AddActivity(weekly("act_coach")))
@@ -0,0 +1,130 @@
+"""Tests for rolling-horizon scheduling."""
+
+import pytest
+from datetime import date, time, timedelta
+
+from models import (
+    Activity, Frequency, FrequencyPattern, ActivityType,
+    Specialist, SpecialistType, AvailabilityBlock
+)
+from scheduler import GreedyScheduler, RollingScheduler
+
+
+START = date(2025, 12, 8)  # Monday
+
+
+def make_activity(activity_id, pattern, count=1, **kwargs):
+    """Build an activity with the given frequency."""
+    return Activity(
+        id=activity_id,
+        name=f"Activity {activity_id}",
+        type=ActivityType.FITNESS,
+        priority=2,
+        frequency=Frequency(pattern=pattern, count=count, **kwargs.pop("frequency", {})),
+        duration_minutes=30,
+        **kwargs
+    )
+
+
+@pytest.fixture
+def activities():
+    """A daily, a weekly and a monthly activity."""
+    return [
+        make_activity("act_daily", FrequencyPattern.DAILY),
+        make_activity("act_weekly", FrequencyPattern.WEEKLY, count=2, specialist_id="spec_001"),
+        make_activity("act_monthly", FrequencyPattern.MONTHLY),
+    ]
+
+
+@pytest.fixture
+def specialists():
+    """One weekday specialist."""
+    return [Specialist(
+        id="spec_001",
+        name="Coach",
+        type=SpecialistType.TRAINER,
+        availability=[
+            AvailabilityBlock(day_of_week=day, start_time=time(8, 0), end_time=time(17, 0))
+            for day in range(5)
+        ]
+    )]
+
+
+class TestRollingScheduler:
+    """Tests for RollingScheduler."""
+
+    def test_windows_add_up_to_full_horizon_requirements(self, activities, specialists):
+        """Test per-window required occurrences sum to the single-horizon totals."""
+        rolling = RollingScheduler(activities, specialists, [], [], START, window_days=28)
+        windows = list(rolling.run(90))
+
+        assert [w.duration_days for w in windows] == [28, 28, 28, 6]
+        assert [w.start_date for w in windows] == [
+            START + timedelta(days=offset) for offset in (0, 28, 56, 84)
+        ]
+
+        full = GreedyScheduler(activities, specialists, [], [], START, duration_days=90)
+        for activity in activities:
+            assert sum(w._calculate_required_occurrences(activity) for w in windows) == \
+                full._calculate_required_occurrences(activity)
+
+    def test_bookings_stay_inside_their_window(self, activities, specialists):
+        """Test each window books only its own dates and meets its requirements."""
+        rolling = RollingScheduler(activities, specialists, [], [], START, window_days=14)
+
+        for window in rolling.run(42):
+            slots = window.state.booked_slots
+            assert all(window.start_date <= s.date <= window.end_date for s in slots)
+            assert len(slots) == sum(
+                window._calculate_required_occurrences(a) for a in activities
+            )
+
+        assert rolling.next_start == START + timedelta(days=42)
+        assert rolling.elapsed_days == 42
+
+    def test_weekly_patterns_carry_forward(self, activities, specialists):
+        """Test consistency state accumulates across windows."""
+        rolling = RollingScheduler(activities, specialists, [], [], START, window_days=7)
+        windows = list(rolling.run(21))
+
+        assert len(rolling.weekly_patterns["act_weekly"]) == 7
+        assert sum(rolling.weekly_patterns["act_weekly"]) == 6
+        assert all(w.scorer.weekly_patterns is rolling.weekly_patterns for w in windows)
+
+    def test_extends_an_existing_schedule(self, activities, specialists):
+        """Test a rolling run can resume after an earlier full run."""
+        first = GreedyScheduler(activities, specialists, [], [], START, duration_days=28)
+        first.schedule()
+
+        rolling = RollingScheduler(
+            activities, specialists, [], [],
+            first.end_date + timedelta(days=1),
+            elapsed_days=28,
+            weekly_patterns=first.scorer.weekly_patterns
+        )
+        window = rolling.schedule_window(28)
+
+        assert window.start_date == START + timedelta(days=28)
+        assert window._calculate_required_occurrences(activities[2]) == 1
+        assert sum(rolling.weekly_patterns["act_weekly"]) == 16
+        assert sum(first.scorer.weekly_patterns["act_weekly"]) == 8
+
+    def test_rejects_empty_windows(self, activities, specialists):
+        """Test window length must be positive."""
+        with pytest.raises(ValueError):
+            RollingScheduler(activities, specialists, [], [], START, window_days=0)
+
+        rolling = RollingScheduler(activities, specialists, [], [], START, window_days=7)
+        with pytest.raises(ValueError):
+            rolling.schedule_window(0)
+        assert rolling.next_start == START
+
+    def test_frozen_dates_leave_availability(self, activities, specialists):
+        """Test compiled availability drops each window's dates once it is frozen."""
+        rolling = RollingScheduler(activities, specialists, [], [], START, window_days=7)
+        availability = rolling.availability["spec_001"]
+        availability.blocks(START + timedelta(days=30))
+
+        list(rolling.run(21))
+
+        assert list(availability._dates) == [START + timedelta(days=30)]
@@ -0,0 +1,685 @@
+"""Tests for scheduler state indexes and the constraint checks built on them."""
+
+from datetime import time, date
+
+from models import (
+    Activity, Frequency, FrequencyPattern, ActivityType, TimeSlot, Equipment,
+    Specialist, SpecialistType, AvailabilityBlock, TravelPeriod, MaintenanceWindow
+)
+from scheduler import BalancedScheduler, ConstraintChecker, GreedyScheduler, SchedulerState, SlotScorer
+from scheduler.booking import Booking
+from scheduler.constraints import ConstraintViolation
+from scheduler.state import SAMPLE_SIZE
+from scheduler.availability import SpecialistAvailability, merge_blocks
+from scheduler.intervals import IntervalIndex
+from scheduler.ledger import ResourceLedger
+from scheduler.occupancy import OccupancyGrid
+
+
+DAY = date(2025, 12, 9)
+
+
+def make_activity(activity_id="act_001", duration=30, **kwargs):
+    """Build a weekly activity with sensible defaults."""
+    return Activity(
+        id=activity_id,
+        name=f"Activity {activity_id}",
+        type=kwargs.pop("type", ActivityType.FITNESS),
+        priority=kwargs.pop("priority", 2),
+        frequency=Frequency(pattern=FrequencyPattern.WEEKLY, count=1),
+        duration_minutes=duration,
+        **kwargs
+    )
+
+
+def book(state, activity_id, start, duration=30, day=DAY, **kwargs):
+    """Add a booking to state and return it."""
+    slot = TimeSlot(
+        activity_id=activity_id,
+        date=day,
+        start_time=start,
+        duration_minutes=duration,
+        **kwargs
+    )
+    state.add_booking(slot)
+    return slot
+
+
+class TestIntervalIndex:
+    """Tests for the per-date interval index."""
+
+    def test_overlap_queries(self):
+        """Test overlap detection is half-open and per date."""
+        index = IntervalIndex()
+        index.add(DAY, 480, 540, "a")   # 08:00-09:00
+        index.add(DAY, 600, 630, "b")   # 10:00-10:30
+
+        assert index.find_overlap(DAY, 510, 570) == "a"
+        assert index.find_overlap(DAY, 620, 700) == "b"
+        assert index.find_overlap(DAY, 540, 600) is None
+        assert index.find_overlap(date(2025, 12, 10), 480, 540) is None
+
+    def test_overlap_with_nested_intervals(self):
+        """Test a long interval is found behind shorter later ones."""
+        index = IntervalIndex()
+        index.add(DAY, 480, 720, "long")
+        index.add(DAY, 500, 510, "short")
+
+        assert index.find_overlap(DAY, 600, 610) == "long"
+        assert index.count_overlaps(DAY, 505, 506) == 2
+
+    def test_is_free_and_next_gap(self):
+        """Test point-in-time and gap queries."""
+        index = IntervalIndex()
+        index.add(DAY, 480, 540)
+        index.add(DAY, 550, 600)
+
+        assert not index.is_free(DAY, 480)
+        assert index.is_free(DAY, 540)
+        assert index.next_free_gap(DAY, 480, 10) == 540
+        assert index.next_free_gap(DAY, 480, 30) == 600
+        assert index.next_free_gap(DAY, 480, 60, latest_end=650) is None
+
+    def test_remove(self):
+        """Test removed intervals no longer overlap."""
+        index = IntervalIndex()
+        index.add(DAY, 480, 540, "a")
+
+        assert index.remove(DAY, 480, 540, "a")
+        assert not index.overlaps(DAY, 480, 540)
+        assert len(index) == 0
+
+
+class TestStateOverlapChecks:
+    """Tests for overlap checks backed by SchedulerState."""
+
+    def test_overlap_violation_names_conflicting_slot(self):
+        """Test overlapping candidate reports the booked activity."""
+        state = SchedulerState()
+        book(state, "act_900", time(8, 0), duration=60)
+
+        checker = ConstraintChecker([], [], [])
+        violation = checker.check_time_slot(make_activity(), DAY, time(8, 30), state)
+
+        assert violation is not None
+        assert violation.constraint_type == "overlap"
+        assert "act_900" in violation.reason
+
+    def test_adjacent_slot_is_valid(self):
+        """Test a slot starting when another ends does not overlap."""
+        state = SchedulerState()
+        book(state, "act_900", time(8, 0), duration=60)
+
+        checker = ConstraintChecker([], [], [])
+        assert checker.check_time_slot(make_activity(), DAY, time(9, 0), state) is None
+
+    def test_clear_resets_index(self):
+        """Test clearing state empties the interval index."""
+        state = SchedulerState()
+        book(state, "act_900", time(8, 0))
+        state.clear()
+
+        assert not state.slot_index.overlaps(DAY, 0, 24 * 60)
+
+
+class TestOccupancyGrid:
+    """Tests for 5-minute occupancy grids."""
+
+    def test_free_and_peak(self):
+        """Test slice queries over bucket counts."""
+        grid = OccupancyGrid()
+        grid.add(DAY, 480, 540)
+        grid.add(DAY, 510, 570)
+
+        assert grid.is_free(DAY, 570, 600)
+        assert not grid.is_free(DAY, 535, 545)
+        assert grid.peak(DAY, 480, 600) == 2
+        assert grid.peak(DAY, 540, 600) == 1
+
+    def test_remove_releases_buckets(self):
+        """Test removing a booking frees its buckets."""
+        grid = OccupancyGrid()
+        grid.add(DAY, 480, 540)
+        grid.remove(DAY, 480, 540)
+
+        assert grid.is_free(DAY, 0, 24 * 60)
+        assert grid.row(DAY) is None
+
+    def test_counts_past_255_stay_exact(self):
+        """Test a row widens instead of clipping, so removals never under-report."""
+        grid = OccupancyGrid()
+        for _ in range(260):
+            grid.add(DAY, 480, 540)
+        assert grid.peak(DAY, 480, 540) == 260
+
+        for _ in range(10):
+            grid.remove(DAY, 480, 540)
+        assert grid.peak(DAY, 480, 540) == 250
+        assert not grid.is_free(DAY, 500, 505)
+        assert grid.is_free(DAY, 540, 600)
+
+        for _ in range(250):
+            grid.remove(DAY, 480, 540)
+        assert grid.row(DAY) is None
+
+    def test_sub_bucket_touch_is_not_an_overlap(self):
+        """Test the checker confirms grid hits against exact intervals."""
+        state = SchedulerState()
+        book(state, "act_900", time(8, 0), duration=32)  # ends 08:32
+
+        checker = ConstraintChecker([], [], [])
+        activity = make_activity(duration=30)
+        assert not state.client_occupancy.is_free(DAY, 513, 543)
+        assert checker._check_overlap(activity, DAY, 513, state) is None
+
+
+class TestEquipmentCapacity:
+    """Tests for equipment concurrency limits."""
+
+    def test_capacity_uses_peak_concurrency(self):
+        """Test two non-overlapping users leave room for a third on capacity 2."""
+        equipment = Equipment(
+            id="equip_001", name="Rack", location="Gym", max_concurrent_users=2
+        )
+        state = SchedulerState()
+        book(state, "act_901", time(8, 0), equipment_ids=["equip_001"])
+        book(state, "act_902", time(8, 30), equipment_ids=["equip_001"])
+
+        checker = ConstraintChecker([], [equipment], [])
+        activity = make_activity(duration=60, equipment_ids=["equip_001"])
+        assert checker._check_equipment(activity, DAY, 480, state) is None
+
+        book(state, "act_903", time(8, 15), equipment_ids=["equip_001"])
+        violation = checker._check_equipment(activity, DAY, 480, state)
+        assert violation is not None
+        assert "capacity" in violation.reason
+
+
+class TestLedgerCapacity:
+    """Tests for ledger capacity checks on widely shared resources."""
+
+    def test_more_than_255_concurrent_bookings(self):
+        """Test a full resource is reported full past the byte counter range."""
+        ledger = ResourceLedger()
+        bookings = [
+            Booking(f"act_{i:03d}", DAY, 480, 60, None, ["equip_001"]) for i in range(300)
+        ]
+        for booking in bookings:
+            ledger.add(booking)
+
+        assert ledger.equipment_index["equip_001"].peak_overlap(DAY, 480, 540) == 300
+        assert not ledger.equipment_has_capacity("equip_001", DAY, 480, 540, 300)
+        assert ledger.equipment_has_capacity("equip_001", DAY, 480, 540, 301)
+
+        for booking in bookings[:50]:
+            ledger.remove(booking)
+
+        assert not ledger.equipment_has_capacity("equip_001", DAY, 480, 540, 250)
+        assert ledger.equipment_has_capacity("equip_001", DAY, 480, 540, 251)
+
+
+class TestMaintenanceIndex:
+    """Tests for the per-(equipment, date) maintenance index."""
+
+    def make_rack(self, windows):
+        """Build a single rack with the given maintenance windows."""
+        return Equipment(
+            id="equip_001", name="Rack", location="Gym", maintenance_windows=windows
+        )
+
+    def test_windows_indexed_by_date(self):
+        """Test timed and all-day windows block only the dates they cover."""
+        rack = self.make_rack([
+            MaintenanceWindow(start_date=DAY, end_date=DAY,
+                              start_time=time(8, 0), end_time=time(9, 0)),
+            MaintenanceWindow(start_date=date(2025, 12, 10), end_date=date(2025, 12, 11)),
+        ])
+        checker = ConstraintChecker([], [rack], [])
+        state = SchedulerState()
+        activity = make_activity(equipment_ids=["equip_001"])
+
+        assert checker._check_equipment(activity, DAY, 450, state) is None
+        assert "08:00:00-09:00:00" in checker._check_equipment(activity, DAY, 470, state).reason
+        assert checker._check_equipment(activity, DAY, 540, state) is None
+        assert checker._check_equipment_day(activity, DAY) is None
+        for day in (date(2025, 12, 10), date(2025, 12, 11)):
+            assert "on " in checker._check_equipment_day(activity, day).reason
+            assert checker._check_equipment(activity, day, 600, state) is not None
+        assert checker._check_equipment(activity, date(2025, 12, 12), 470, state) is None
+
+    def test_set_equipment_rebuilds(self):
+        """Test replacing the equipment replaces the maintenance index."""
+        checker = ConstraintChecker([], [self.make_rack([MaintenanceWindow(start_date=DAY, end_date=DAY)])], [])
+        checker.set_equipment([self.make_rack([])])
+
+        activity = make_activity(equipment_ids=["equip_001"])
+        assert checker._check_equipment(activity, DAY, 480, SchedulerState()) is None
+
+
+class TestSpecialistAvailability:
+    """Tests for compiled specialist availability masks."""
+
+    def make_specialist(self, days_off=()):
+        """Build a specialist working split Tuesday shifts."""
+        return Specialist(
+            id="spec_001",
+            name="Dr. Test",
+            type=SpecialistType.PHYSICIAN,
+            availability=[
+                AvailabilityBlock(day_of_week=1, start_time=time(8, 0), end_time=time(12, 0)),
+                AvailabilityBlock(day_of_week=1, start_time=time(12, 0), end_time=time(14, 0)),
+                AvailabilityBlock(day_of_week=1, start_time=time(16, 0), end_time=time(18, 0)),
+            ],
+            days_off=list(days_off)
+        )
+
+    def test_merge_blocks(self):
+        """Test touching and overlapping blocks are merged."""
+        assert merge_blocks([(600, 700), (480, 600), (650, 720), (900, 960)]) == (
+            (480, 900), (720, 960)
+        )
+
+    def test_covers_merged_and_days_off(self):
+        """Test lookups across merged blocks, gaps, other weekdays and days off."""
+        mask = SpecialistAvailability(
+            self.make_specialist(days_off=[date(2025, 12, 16)]), DAY, date(2025, 12, 31)
+        )
+
+        assert mask.covers(DAY, 690, 750)        # 11:30-12:30 spans merged blocks
+        assert not mask.covers(DAY, 810, 870)    # 13:30-14:30 runs into the gap
+        assert mask.covers(DAY, 960, 1080)
+        assert not mask.covers(date(2025, 12, 10), 600, 630)  # Wednesday
+        assert not mask.covers(date(2025, 12, 16), 600, 630)  # Tuesday off
+        assert mask.covers(date(2026, 1, 6), 600, 630)        # Outside horizon
+
+    def test_checker_reasons_and_rebuild(self):
+        """Test violation reasons and that set_specialists recompiles masks."""
+        checker = ConstraintChecker([self.make_specialist()], [], [], DAY, date(2025, 12, 31))
+        activity = make_activity(duration=60, specialist_id="spec_001")
+
+        assert checker._check_specialist(activity, DAY, 690) is None
+        assert "Wednesday" in checker._check_specialist(
+            activity, date(2025, 12, 10), 540
+        ).reason
+
+        checker.set_specialists([self.make_specialist(days_off=[DAY])])
+        assert "day off" in checker._check_specialist(activity, DAY, 540).reason
+
+
+class TestBatchEvaluation:
+    """Tests for grid-wide constraint checks and scoring."""
+
+    def test_check_many_matches_check_time_slot(self):
+        """Test every grid cell agrees with the single-slot check."""
+        state = SchedulerState()
+        book(state, "act_900", time(8, 0), duration=60)
+        checker = ConstraintChecker([], [], [])
+        activity = make_activity(
+            duration=30, time_window_start=time(7, 0), time_window_end=time(10, 0)
+        )
+        dates = [DAY, date(2025, 12, 10)]
+        starts = [420, 450, 480, 510, 540, 570]
+
+        matrix = checker.check_many(activity, dates, starts, state)
+
+        for row, day in zip(matrix, dates):
+            for violation, start in zip(row, starts):
+                single = checker.check_time_slot(activity, day, time(start // 60, start % 60), state)
+                assert (violation is None) == (single is None)
+                if single is not None:
+                    assert violation.constraint_type == single.constraint_type
+
+    def test_score_many_matches_score_slot(self):
+        """Test every grid cell gets the single-slot score."""
+        scorer = SlotScorer()
+        activity = make_activity()
+        scorer.record_booking(make_activity("act_900"), DAY)
+        starts = [360, 600, 1080]
+
+        matrix = scorer.score_many(activity, [DAY, date(2025, 12, 10)], starts)
+
+        assert matrix[0] == [
+            scorer.score_slot(activity, DAY, time(m // 60, m % 60)) for m in starts
+        ]
+        assert matrix[1][0] == 8.0
+
+
+class TestConstraintOrdering:
+    """Tests for whole-day checks, adaptive check order and constraint stats."""
+
+    def make_specialist(self):
+        """Build a specialist working Tuesdays 08:00-12:00."""
+        return Specialist(
+            id="spec_001",
+            name="Dr. Test",
+            type=SpecialistType.PHYSICIAN,
+            availability=[AvailabilityBlock(day_of_week=1, start_time=time(8, 0), end_time=time(12, 0))]
+        )
+
+    def test_blocked_dates_reject_whole_rows(self):
+        """Test travel and specialist weekdays reject a date before any slot check."""
+        travel = TravelPeriod(
+            id="travel_001", start_date=date(2025, 12, 16), end_date=date(2025, 12, 16),
+            location="Lisbon", remote_activities_only=True
+        )
+        checker = ConstraintChecker([self.make_specialist()], [], [travel])
+        activity = make_activity(specialist_id="spec_001")
+        dates = [DAY, date(2025, 12, 10), date(2025, 12, 16)]
+
+        matrix = checker.check_many(activity, dates, [480, 510, 540], SchedulerState())
+
+        assert matrix[0] == [None, None, None]
+        assert {v.constraint_type for v in matrix[1]} == {"specialist"}
+        assert "Wednesday" in matrix[1][0].reason
+        assert {v.constraint_type for v in matrix[2]} == {"travel"}
+
+        stats = checker.stats_report()
+        assert stats["travel"]["checks"] == 3
+        assert stats["travel"]["rejections"] == 1
+        assert stats["specialist_day"]["rejections"] == 1
+        assert stats["overlap"]["checks"] == 3  # Only the open date's slots
+
+    def test_unknown_specialist_without_date_checks(self):
+        """Test slot checks report an unknown specialist whatever their order."""
+        checker = ConstraintChecker([], [], [])
+        activity = make_activity(specialist_id="spec_404")
+
+        matrix = checker.check_many(activity, [DAY], [480], SchedulerState(), dates_checked=True)
+        assert "spec_404 not found" in matrix[0][0].reason
+        assert "not found" in checker._check_specialist_capacity(activity, DAY, 480, SchedulerState()).reason
+
+    def test_prune_dates(self):
+        """Test blocked and full dates are dropped and reported once each."""
+        state = SchedulerState()
+        book(state, "act_900", time(8, 0), duration=75)   # 08:00-09:15
+        book(state, "act_901", time(9, 30), duration=30)  # 09:30-10:00
+        book(state, "act_902", time(8, 0), duration=30, day=date(2025, 12, 16))
+        checker = ConstraintChecker([self.make_specialist()], [], [])
+        activity = make_activity(duration=30, specialist_id="spec_001")
+        dates = [date(2025, 12, 16), DAY, date(2025, 12, 10)]
+
+        open_dates, blocked = checker.prune_dates(activity, dates, [480, 510, 540, 570], state)
+
+        assert open_dates == [date(2025, 12, 16)]
+        assert [(v.date, v.constraint_type) for v in blocked] == [
+            (DAY, "overlap"), (date(2025, 12, 10), "specialist")
+        ]
+        assert "No free 30-minute gap" in blocked[0].reason
+        assert checker.stats["day_full"].rejections == 1
+
+        # A 15-minute activity fits the 09:15-09:30 gap, so the day stays open
+        short = make_activity(duration=15, specialist_id="spec_001")
+        assert checker.prune_dates(short, [DAY], [480, 510, 540, 570], state)[0] == [DAY]
+
+    def test_reorders_by_rejection_rate(self, monkeypatch):
+        """Test the check that rejects most often moves to the front."""
+        monkeypatch.setattr("scheduler.constraints.REORDER_INTERVAL", 4)
+        checker = ConstraintChecker([self.make_specialist()], [], [])
+        activity = make_activity(duration=60, specialist_id="spec_001")
+
+        # Free client calendar, so only the specialist's hours reject
+        checker.check_many(activity, [DAY], [600, 660, 720, 780], SchedulerState())
+
+        order = [name for name, _ in checker._slot_checks(activity)]
+        assert order[0] == "specialist"
+        assert checker.stats["specialist"].rejection_rate == 0.5
+
+        checker.reset_stats()
+        assert checker.stats["specialist"].checks == 0
+        assert [name for name, _ in checker._slot_checks(activity)][0] == "overlap"
+
+
+class TestTravelLookup:
+    """Tests for the per-date travel lookup."""
+
+    def make_trip(self, trip_id, start, end, remote_only=True):
+        """Build a trip from day-of-December numbers."""
+        return TravelPeriod(
+            id=trip_id, start_date=date(2025, 12, start), end_date=date(2025, 12, end),
+            location=f"City {trip_id}", remote_activities_only=remote_only
+        )
+
+    def test_first_remote_only_trip_wins(self):
+        """Test overlapping trips report the first remote-only one and others are ignored."""
+        checker = ConstraintChecker([], [], [
+            self.make_trip("a", 8, 9, remote_only=False),
+            self.make_trip("b", 9, 12),
+            self.make_trip("c", 11, 14),
+        ])
+        activity = make_activity()
+
+        assert checker._check_travel(activity, date(2025, 12, 8)) is None
+        assert checker._check_travel(activity, date(2025, 12, 9)).resource == "City b"
+        assert checker._check_travel(activity, date(2025, 12, 12)).resource == "City b"
+        assert checker._check_travel(activity, date(2025, 12, 13)).resource == "City c"
+        assert checker._check_travel(activity, date(2025, 12, 15)) is None
+        assert checker._check_travel(make_activity(remote_capable=True), date(2025, 12, 10)) is None
+
+    def test_set_travel_periods_rebuilds(self):
+        """Test replacing the trips replaces the lookup."""
+        checker = ConstraintChecker([], [], [self.make_trip("a", 8, 9)])
+        checker.set_travel_periods([self.make_trip("b", 20, 21)])
+
+        assert checker._check_travel(make_activity(), date(2025, 12, 8)) is None
+        assert checker._check_travel(make_activity(), date(2025, 12, 21)) is not None
+
+    def test_travel_blocks(self):
+        """Test the public travel test agrees with the travel check."""
+        checker = ConstraintChecker([], [], [
+            self.make_trip("a", 8, 9, remote_only=False),
+            self.make_trip("b", 9, 12),
+        ])
+
+        assert not checker.travel_blocks(make_activity(), date(2025, 12, 8))
+        assert checker.travel_blocks(make_activity(), date(2025, 12, 9))
+        assert not checker.travel_blocks(make_activity(remote_capable=True), date(2025, 12, 9))
+
+
+class TestDayLoad:
+    """Tests for incremental per-date load counters."""
+
+    def test_counts_and_lightest_days(self):
+        """Test counters follow bookings and lightest-day queries keep date order on ties."""
+        state = SchedulerState()
+        other = date(2025, 12, 10)
+        empty = date(2025, 12, 11)
+        book(state, "act_900", time(8, 0), duration=30)
+        book(state, "act_901", time(9, 0), duration=45)
+        book(state, "act_902", time(8, 0), duration=30, day=other)
+
+        assert state.get_day_load(DAY) == 2
+        assert state.day_minutes[DAY] == 75
+        assert state.get_lightest_days([DAY, other, empty]) == [empty, other, DAY]
+        assert state.get_lightest_days([DAY, other, empty], k=2) == [empty, other]
+        assert state.get_lightest_days([DAY, other, empty], max_count=2) == [empty, other]
+        assert state.get_statistics()["busiest_day"] == (DAY, 2)
+
+        state.clear()
+        assert state.get_day_load(DAY) == 0
+        assert state.get_date_range() is None
+
+
+class TestScorerIndexes:
+    """Tests for the scorer's per-date and per-type counters."""
+
+    def test_grouping_uses_activity_type(self):
+        """Test grouping counts only same-type bookings on the same day."""
+        scorer = SlotScorer()
+        fitness = make_activity("act_001", type=ActivityType.FITNESS)
+        scorer.record_booking(make_activity("act_900", type=ActivityType.FOOD), DAY)
+
+        assert scorer._score_grouping(fitness, DAY) == 0.0
+
+        scorer.record_booking(make_activity("act_901", type=ActivityType.FITNESS), DAY)
+        scorer.record_booking(make_activity("act_902", type=ActivityType.FITNESS), DAY)
+        assert scorer._score_grouping(fitness, DAY) == 2.0
+        assert scorer._score_grouping(fitness, date(2025, 12, 10)) == 0.0
+
+    def test_overcrowding_uses_daily_counts(self):
+        """Test the overcrowding penalty follows recorded bookings."""
+        scorer = SlotScorer()
+        for i in range(5):
+            scorer.record_booking(make_activity(f"act_90{i}"), DAY)
+
+        assert scorer._score_overcrowding(DAY) == -1.0
+        assert scorer._score_overcrowding(date(2025, 12, 10)) == 0.0
+
+
+class TestMinuteArithmetic:
+    """Tests for integer-minute time handling."""
+
+    def test_slot_minutes(self):
+        """Test TimeSlot exposes start and end minutes."""
+        slot = TimeSlot(activity_id="act_900", date=DAY, start_time=time(23, 30), duration_minutes=60)
+
+        assert slot.start_min == 1410
+        assert slot.end_min == 1470
+
+    def test_window_rejects_midnight_wraparound(self):
+        """Test an activity running past midnight does not fit a late window."""
+        checker = ConstraintChecker([], [], [])
+        activity = make_activity(
+            duration=60, time_window_start=time(22, 0), time_window_end=time(23, 59)
+        )
+
+        violation = checker.check_time_slot(activity, DAY, time(23, 30), SchedulerState())
+        assert violation is not None
+        assert violation.constraint_type == "time_window"
+        assert checker.check_time_slot(activity, DAY, time(22, 30), SchedulerState()) is None
+
+    def test_unwindowed_starts_end_by_midnight(self):
+        """Test long activities without a window get no start that runs into the next date."""
+        activity = make_activity(duration=300)
+
+        for scheduler_class in (GreedyScheduler, BalancedScheduler):
+            scheduler = scheduler_class([activity], [], [], [], DAY, duration_days=7)
+            starts = scheduler._generate_start_minutes(activity)
+
+            assert starts[0] == 360
+            assert starts[-1] == 1140
+            assert scheduler._generate_start_minutes(make_activity(duration=30))[-1] == 1230
+
+
+class TestBooking:
+    """Tests for the internal booking record."""
+
+    def test_add_booking_converts_and_exports(self):
+        """Test TimeSlots become bookings in state and round-trip on export."""
+        state = SchedulerState()
+        slot = TimeSlot(
+            activity_id="act_900", date=DAY, start_time=time(8, 15),
+            duration_minutes=45, equipment_ids=["equip_001"]
+        )
+
+        booking = state.add_booking(slot)
+
+        assert isinstance(booking, Booking)
+        assert (booking.start_min, booking.end_min, booking.start_time) == (495, 540, time(8, 15))
+        assert state.equipment_bookings["equip_001"] == [booking]
+        assert state.get_time_slots() == [slot]
+        assert Booking.from_time_slot(slot) == booking
+
+
+class TestSharedLedger:
+    """Tests for specialist and equipment capacity across clients."""
+
+    def make_specialist(self, max_clients=1):
+        """Build a specialist available all Tuesday."""
+        return Specialist(
+            id="spec_001",
+            name="Coach",
+            type=SpecialistType.TRAINER,
+            availability=[AvailabilityBlock(day_of_week=1, start_time=time(6, 0), end_time=time(20, 0))],
+            max_concurrent_clients=max_clients
+        )
+
+    def test_specialist_capacity_spans_clients(self):
+        """Test one client's booking blocks another client on a shared ledger."""
+        ledger = ResourceLedger()
+        alice, bob = SchedulerState(ledger), SchedulerState(ledger)
+        book(alice, "act_900", time(8, 0), duration=60, specialist_id="spec_001")
+
+        checker = ConstraintChecker([self.make_specialist()], [], [])
+        activity = make_activity(duration=30, specialist_id="spec_001")
+
+        violation = checker.check_time_slot(activity, DAY, time(8, 30), bob)
+        assert violation is not None
+        assert "capacity" in violation.reason
+        assert checker.check_time_slot(activity, DAY, time(9, 0), bob) is None
+        assert checker.check_time_slot(activity, DAY, time(8, 30), SchedulerState()) is None
+
+        checker.set_specialists([self.make_specialist(max_clients=2)])
+        assert checker.check_time_slot(activity, DAY, time(8, 30), bob) is None
+
+    def test_clear_releases_only_own_bookings(self):
+        """Test clearing one client's state leaves other clients on the ledger."""
+        ledger = ResourceLedger()
+        alice, bob = SchedulerState(ledger), SchedulerState(ledger)
+        book(alice, "act_900", time(8, 0), equipment_ids=["equip_001"])
+        book(bob, "act_901", time(8, 0), equipment_ids=["equip_001"])
+
+        alice.clear()
+
+        assert ledger.equipment_index["equip_001"].count_overlaps(DAY, 480, 510) == 1
+        assert not ledger.equipment_has_capacity("equip_001", DAY, 480, 510, 1)
+        assert ledger.equipment_has_capacity("equip_001", DAY, 480, 510, 2)
+
+
+class TestFailureTracking:
+    """Tests for bounded failure records."""
+
+    def test_counts_and_bounded_samples(self):
+        """Test every violation is counted while only a few are kept."""
+        state = SchedulerState()
+        activity = make_activity()
+        for i in range(1000):
+            resource = "spec_001" if i % 3 else "spec_002"
+            state.record_failure(activity, ConstraintViolation(
+                "specialist", activity.id, DAY, 480 + i % 60, "{0} busy at {start_time}", (resource,), resource
+            ))
+        state.record_failure(activity, ConstraintViolation("overlap", activity.id, DAY, 600, "Overlap"))
+
+        attempt = state.failed_activities[activity.id]
+        assert attempt.attempts == 1001
+        assert attempt.counts == {("specialist", "spec_002"): 334, ("specialist", "spec_001"): 666, ("overlap", None): 1}
+        assert len(attempt.samples) == SAMPLE_SIZE
+        assert len({id(v) for v in attempt.samples}) == SAMPLE_SIZE
+
+        [record] = state.get_failure_report()
+        assert record["attempts"] == 1001
+        assert record["violation_types"] == {"specialist": 1000, "overlap": 1}
+        assert record["sample_reason"] == "spec_002 busy at 08:00:00"
+        assert set(attempt.sample_reasons()) <= {
+            f"{resource} busy at {hour:02d}:{minute:02d}:00"
+            for resource in ("spec_001", "spec_002") for hour in (8, 9) for minute in range(60)
+        } | {"Overlap"}
+
+    def test_weighted_failures_count_like_expanded_slots(self):
+        """Test a date rejected as a whole counts once per candidate time."""
+        weighted = SchedulerState()
+        expanded = SchedulerState()
+        activity = make_activity()
+        day_full = ConstraintViolation("overlap", activity.id, DAY, 480, "Day full")
+        travel = ConstraintViolation("travel", activity.id, DAY, 480, "Travelling", resource="trip")
+
+        weighted.record_failure(activity, day_full, count=3)
+        weighted.record_failure(activity, travel, count=40)
+        for _ in range(3):
+            expanded.record_failure(activity, day_full)
+        for _ in range(40):
+            expanded.record_failure(activity, travel)
+
+        assert weighted.get_failure_report() == expanded.get_failure_report()
+        attempt = weighted.failed_activities[activity.id]
+        assert attempt.attempts == 43
+        assert len(attempt.samples) == SAMPLE_SIZE
+        assert set(attempt.sample_reasons()) <= {"Day full", "Travelling"}
+
+    def test_reasons_are_formatted_lazily(self):
+        """Test reasons render the slot date and time from the template."""
+        violation = ConstraintViolation(
+            "specialist", "act_001", DAY, 570, "{0} not available at {start_time} on {date:%A}s", ("Dr. A",), "spec_001"
+        )
+
+        assert violation.start_time == time(9, 30)
+        assert violation.reason == "Dr. A not available at 09:30:00 on Tuesdays"
@@ -1,6 +1,9 @@
 """Utility functions for health activity scheduler."""
 
-from .io import load_activities, load_specialists, load_equipment, load_travel, save_json, load_timeslots, load_json
+from .io import load_activities, load_specialists, load_equipment, load_travel, save_json, save_schedule, load_timeslots, load_json
+from .columnar import save_columnar, ColumnarSchedule
+from .aggregates import save_aggregates
+from .repository import ScheduleRepository
 
 __all__ = [
     "load_activities",
@@ -8,6 +11,11 @@ __all__ = [
     "load_equipment",
     "load_travel",
     "save_json",
+    "save_schedule",
     "load_timeslots",
     "load_json",
+    "save_columnar",
+    "ColumnarSchedule",
+    "save_aggregates",
+    "ScheduleRepository",
 ]
@@ -0,0 +1,98 @@
+"""Per-day and per-month schedule aggregates.
+
+The scheduler writes these next to schedule.json as calendar.json so the
+calendar view can be served without touching individual slots:
+
+    {
+        "days":   {"2025-12-08": {"count", "booked_minutes", "priorities", "types"}},
+        "months": {"2025-12":    {"count", "booked_minutes", "priorities", "types", "active_days"}}
+    }
+
+``priorities`` maps priority ("1"-"5") and ``types`` maps activity type to a
+slot count.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+
+from .io import save_json
+
+
+def _empty_bucket() -> Dict[str, Any]:
+    return {"count": 0, "booked_minutes": 0, "priorities": {}, "types": {}}
+
+
+def _add(bucket: Dict[str, Any], minutes: int, priority: str, activity_type: str) -> None:
+    bucket["count"] += 1
+    bucket["booked_minutes"] += minutes
+    bucket["priorities"][priority] = bucket["priorities"].get(priority, 0) + 1
+    bucket["types"][activity_type] = bucket["types"].get(activity_type, 0) + 1
+
+
+def aggregate_rows(rows: Iterable[Tuple[str, int, int, str]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Aggregate slots by day and by month.
+
+    Args:
+        rows: (date as YYYY-MM-DD, duration in minutes, priority, activity type) per slot
+
+    Returns:
+        {"days": {date: stats}, "months": {YYYY-MM: stats}}, both in date order
+    """
+    days: Dict[str, Dict[str, Any]] = {}
+    months: Dict[str, Dict[str, Any]] = {}
+
+    for date, minutes, priority, activity_type in rows:
+        priority_key = str(priority)
+        _add(days.setdefault(date, _empty_bucket()), minutes, priority_key, activity_type)
+        month = months.setdefault(date[:7], {**_empty_bucket(), "active_days": 0})
+        _add(month, minutes, priority_key, activity_type)
+
+    for date in days:
+        months[date[:7]]["active_days"] += 1
+
+    return {
+        "days": {date: days[date] for date in sorted(days)},
+        "months": {month: months[month] for month in sorted(months)},
+    }
+
+
+def schedule_aggregates(slots: Iterable[Any], activities: List[Any]) -> Dict[str, Dict[str, Any]]:
+    """
+    Aggregate scheduled slots by day and by month.
+
+    Args:
+        slots: Bookings or TimeSlots, e.g. ``state.booked_slots``
+        activities: Activity models the schedule was built from
+
+    Returns:
+        {"days": {date: stats}, "months": {YYYY-MM: stats}}
+    """
+    activity_map = {a.id: a for a in activities}
+    rows = []
+    for slot in slots:
+        activity = activity_map.get(slot.activity_id)
+        rows.append((
+            slot.date.isoformat(),
+            slot.duration_minutes,
+            activity.priority if activity else 5,
+            activity.type.value if activity else "Unknown",
+        ))
+    return aggregate_rows(rows)
+
+
+def save_aggregates(slots: Iterable[Any], activities: List[Any], file_path: str | Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Write the day and month aggregates of a schedule (calendar.json).
+
+    Args:
+        slots: Bookings or TimeSlots, e.g. ``state.booked_slots``
+        activities: Activity models the schedule was built from
+        file_path: Path to output file
+
+    Returns:
+        The aggregates written
+    """
+    aggregates = schedule_aggregates(slots, activities)
+    save_json(aggregates, file_path)
+    return aggregates
@@ -0,0 +1,251 @@
+"""Columnar schedule store with memory-mapped per-field arrays.
+
+``schedule.json`` has to be parsed in full even to answer a question about
+one day. A columnar store keeps each field of the schedule in its own flat
+binary array, sorted by date and start time, plus a small string table:
+
+    schedule_columns/
+        meta.json          counts, array layout and the ID string tables
+        activity.bin       uint32 index into meta["activities"]
+        date.bin           int32 date ordinal (date.toordinal())
+        start.bin          uint16 start minute since midnight
+        duration.bin       uint16 duration in minutes
+        specialist.bin     int32 index into meta["specialists"] (-1 = none)
+        equip_offset.bin   uint32 row start into equip.bin (count + 1 entries)
+        equip.bin          uint32 index into meta["equipment"]
+
+``ColumnarSchedule`` memory-maps the arrays and binary-searches the date
+column, so a date range is answered by touching only the rows inside it.
+Arrays are written with the standard library ``array`` module in native
+byte order; the layout is recorded in meta.json and checked on open.
+"""
+
+import json
+import mmap
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date as date_type, time as time_type
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+FORMAT_VERSION = 1
+
+# Column name -> array typecode
+COLUMNS: Dict[str, str] = {
+    "activity": "I",
+    "date": "i",
+    "start": "H",
+    "duration": "H",
+    "specialist": "i",
+    "equip_offset": "I",
+    "equip": "I",
+}
+
+
+def save_columnar(slots: Iterable[Any], directory: str | Path) -> int:
+    """
+    Write scheduled slots as a columnar store.
+
+    Args:
+        slots: Bookings or TimeSlots, e.g. ``state.booked_slots``
+        directory: Store directory (created if needed; existing columns are replaced)
+
+    Returns:
+        Number of slots written
+    """
+    path = Path(directory)
+    path.mkdir(parents=True, exist_ok=True)
+
+    rows = sorted(slots, key=lambda s: (s.date, s.start_min))
+
+    strings: Dict[str, Dict[str, int]] = {"activities": {}, "specialists": {}, "equipment": {}}
+
+    def intern(table: str, value: str) -> int:
+        ids = strings[table]
+        if value not in ids:
+            ids[value] = len(ids)
+        return ids[value]
+
+    columns = {name: array(typecode) for name, typecode in COLUMNS.items()}
+    columns["equip_offset"].append(0)
+
+    for slot in rows:
+        columns["activity"].append(intern("activities", slot.activity_id))
+        columns["date"].append(slot.date.toordinal())
+        columns["start"].append(slot.start_min)
+        columns["duration"].append(slot.duration_minutes)
+        columns["specialist"].append(
+            intern("specialists", slot.specialist_id) if slot.specialist_id else -1
+        )
+        for equip_id in slot.equipment_ids:
+            columns["equip"].append(intern("equipment", equip_id))
+        columns["equip_offset"].append(len(columns["equip"]))
+
+    for name, column in columns.items():
+        with open(path / f"{name}.bin", "wb") as f:
+            column.tofile(f)
+
+    meta = {
+        "version": FORMAT_VERSION,
+        "count": len(rows),
+        "byteorder": sys.byteorder,
+        "columns": {name: [typecode, array(typecode).itemsize] for name, typecode in COLUMNS.items()},
+        **{table: list(ids) for table, ids in strings.items()},
+    }
+    with open(path / "meta.json", "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2)
+
+    return len(rows)
+
+
+class ColumnarSchedule:
+    """Read-only, memory-mapped view of a columnar schedule store."""
+
+    def __init__(self, directory: str | Path):
+        """
+        Open a store written by ``save_columnar``.
+
+        Args:
+            directory: Store directory
+
+        Raises:
+            FileNotFoundError: If the store doesn't exist
+            ValueError: If the store was written with an incompatible layout
+        """
+        path = Path(directory)
+        meta_path = path / "meta.json"
+        if not meta_path.exists():
+            raise FileNotFoundError(f"Columnar schedule not found: {directory}")
+
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+
+        expected = {name: [typecode, array(typecode).itemsize] for name, typecode in COLUMNS.items()}
+        if (
+            meta.get("version") != FORMAT_VERSION
+            or meta.get("byteorder") != sys.byteorder
+            or meta.get("columns") != expected
+        ):
+            raise ValueError(f"Incompatible columnar schedule layout in {directory}")
+
+        self.activities: List[str] = meta["activities"]
+        self.specialists: List[str] = meta["specialists"]
+        self.equipment: List[str] = meta["equipment"]
+        self._count: int = meta["count"]
+
+        self._maps: List[mmap.mmap] = []
+        self._columns: Dict[str, Any] = {
+            name: self._map(path / f"{name}.bin", typecode)
+            for name, typecode in COLUMNS.items()
+        }
+
+    def _map(self, file_path: Path, typecode: str) -> Any:
+        """Memory-map one column as a typed memoryview (or an empty array)."""
+        with open(file_path, "rb") as f:
+            if not f.seek(0, 2):
+                return array(typecode)  # Empty files can't be mapped
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._maps.append(mapped)
+        return memoryview(mapped).cast(typecode)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __enter__(self) -> "ColumnarSchedule":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the memory maps."""
+        for column in self._columns.values():
+            if isinstance(column, memoryview):
+                column.release()
+        self._columns = {}
+        for mapped in self._maps:
+            mapped.close()
+        self._maps = []
+
+    def index_range(
+        self,
+        start_date: Optional[date_type] = None,
+        end_date: Optional[date_type] = None
+    ) -> Tuple[int, int]:
+        """
+        Find the rows booked between two dates (inclusive).
+
+        Args:
+            start_date: First date (default: the beginning)
+            end_date: Last date (default: the end)
+
+        Returns:
+            (first row, one past the last row)
+        """
+        dates = self._columns["date"]
+        lo = 0 if start_date is None else bisect_left(dates, start_date.toordinal())
+        hi = self._count if end_date is None else bisect_right(dates, end_date.toordinal())
+        return lo, max(lo, hi)
+
+    def row(self, i: int) -> Dict[str, Any]:
+        """
+        Build one row as the JSON-ready dict stored in schedule.json.
+
+        Args:
+            i: Row index
+
+        Returns:
+            Slot dict (activity_id, date, start_time, duration_minutes, specialist_id, equipment_ids)
+        """
+        columns = self._columns
+        start = columns["start"][i]
+        specialist = columns["specialist"][i]
+        equip = columns["equip"]
+        return {
+            "activity_id": self.activities[columns["activity"][i]],
+            "date": date_type.fromordinal(columns["date"][i]).isoformat(),
+            "start_time": time_type(start // 60, start % 60).isoformat(),
+            "duration_minutes": columns["duration"][i],
+            "specialist_id": self.specialists[specialist] if specialist >= 0 else None,
+            "equipment_ids": [
+                self.equipment[equip[j]]
+                for j in range(columns["equip_offset"][i], columns["equip_offset"][i + 1])
+            ],
+        }
+
+    def iter_slots(
+        self,
+        start_date: Optional[date_type] = None,
+        end_date: Optional[date_type] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over slots between two dates (inclusive), in date and time order.
+
+        Args:
+            start_date: First date (default: the beginning)
+            end_date: Last date (default: the end)
+
+        Yields:
+            Slot dicts
+        """
+        lo, hi = self.index_range(start_date, end_date)
+        for i in range(lo, hi):
+            yield self.row(i)
+
+    def slots(
+        self,
+        start_date: Optional[date_type] = None,
+        end_date: Optional[date_type] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        List slots between two dates (inclusive), in date and time order.
+
+        Args:
+            start_date: First date (default: the beginning)
+            end_date: Last date (default: the end)
+
+        Returns:
+            Slot dicts
+        """
+        return list(self.iter_slots(start_date, end_date))
@@ -1,9 +1,16 @@
 """JSON I/O utilities for loading and saving data."""
 
+import gzip
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any
-from pydantic import ValidationError
+from typing import IO, Iterable, List, Dict, Any, Optional, Type, TypeVar
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+try:
+    import orjson  # Optional: faster JSON parsing
+except ImportError:
+    orjson = None
 
 from models import Activity, Specialist, Equipment, TravelPeriod, TimeSlot
 
@@ -26,8 +33,31 @@ def load_json(file_path: str | Path) -> Dict[str, Any] | List[Dict[str, Any]]:
     if not path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
 
-    with open(path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    opener = gzip.open if path.suffix == '.gz' else open
+    with opener(path, 'rb') as f:
+        return _loads(f.read())
+
+
+def _loads(raw: bytes | str) -> Any:
+    """Parse JSON with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _open_text(path: Path, mode: str, compress: Optional[bool] = None) -> IO[str]:
+    """Open a UTF-8 text file, gzip-compressed if `compress` (default: a .gz suffix)."""
+    if compress is None:
+        compress = path.suffix == '.gz'
+    if compress:
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+def _is_ndjson(path: Path) -> bool:
+    """Check for a newline-delimited JSON file name (optionally gzipped)."""
+    suffixes = path.suffixes[-2:] if path.suffix == '.gz' else path.suffixes[-1:]
+    return bool(suffixes) and suffixes[0] in ('.ndjson', '.jsonl')
 
 
 def save_json(data: List[Any] | Dict[str, Any], file_path: str | Path, indent: int = 2) -> None:
@@ -42,6 +72,10 @@ def save_json(data: List[Any] | Dict[str, Any], file_path: str | Path, indent: i
     path = Path(file_path)
     path.parent.mkdir(parents=True, exist_ok=True)
 
+    # Convert scheduler bookings to TimeSlot models
+    if isinstance(data, list) and len(data) > 0 and hasattr(data[0], 'to_time_slot'):
+        data = [item.to_time_slot() for item in data]
+
     # Handle Pydantic models
     if isinstance(data, list) and len(data) > 0 and hasattr(data[0], 'model_dump'):
         json_data = [item.model_dump(mode='json') for item in data]
@@ -54,76 +88,160 @@ def save_json(data: List[Any] | Dict[str, Any], file_path: str | Path, indent: i
         json.dump(json_data, f, indent=indent, default=str)
 
 
-def load_activities(file_path: str | Path) -> List[Activity]:
+def save_schedule(
+    slots: Iterable[Any],
+    file_path: str | Path,
+    indent: Optional[int] = 2,
+    ndjson: Optional[bool] = None,
+    compress: Optional[bool] = None
+) -> int:
     """
-    Load activities from JSON file.
+    Stream scheduled slots to a JSON array or NDJSON file.
+
+    Slots are serialized and written one at a time, so no list of dumped
+    slots is ever built. Scheduler bookings (``state.booked_slots``) are
+    written without converting them to TimeSlot models. With the defaults,
+    a ``.json`` file is byte-for-byte what ``save_json`` writes.
 
     Args:
-        file_path: Path to activities JSON file
+        slots: Bookings or TimeSlots, e.g. ``state.booked_slots``
+        file_path: Path to output file
+        indent: JSON array indentation level (None = compact; ignored for NDJSON)
+        ndjson: Write one slot per line (default: a .ndjson/.jsonl file name)
+        compress: Gzip the output (default: a .gz suffix)
 
     Returns:
-        List of validated Activity objects
+        Number of slots written
+    """
+    path = Path(file_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    if ndjson is None:
+        ndjson = _is_ndjson(path)
+
+    count = 0
+    with _open_text(path, 'w', compress) as f:
+        if ndjson:
+            for slot in slots:
+                f.write(json.dumps(_slot_dict(slot), default=str))
+                f.write('\n')
+                count += 1
+            return count
+
+        if indent is None:
+            separator, prefix = ', ', ''
+        else:
+            separator, prefix = ',\n', ' ' * indent
+
+        for slot in slots:
+            text = json.dumps(_slot_dict(slot), indent=indent, default=str)
+            if indent is not None:
+                text = prefix + text.replace('\n', '\n' + prefix)
+            f.write(separator if count else ('[' if indent is None else '[\n'))
+            f.write(text)
+            count += 1
+
+        if not count:
+            f.write('[]')
+        else:
+            f.write(']' if indent is None else '\n]')
+
+    return count
+
+
+def _slot_dict(slot: Any) -> Dict[str, Any]:
+    """JSON-ready dict for a scheduler booking or a TimeSlot."""
+    if hasattr(slot, 'to_dict'):
+        return slot.to_dict()
+    return slot.model_dump(mode='json')
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: Type[ModelT]) -> TypeAdapter:
+    """Build (once per model) the adapter validating a whole list of `model`."""
+    return TypeAdapter(List[model])
+
+
+def _validate_list(
+    data: Any,
+    model: Type[ModelT],
+    label: str,
+    what: str,
+    file_kind: str
+) -> List[ModelT]:
+    """Validate a JSON array of models in one pass.
+
+    Args:
+        data: Parsed JSON
+        model: Model each item must validate as
+        label: Item name used in error messages (e.g. "Activity")
+        what: Plural used in the error summary (e.g. "activities")
+        file_kind: File name used when data is not an array (e.g. "Activities")
+
+    Returns:
+        List of validated models
 
     Raises:
-        FileNotFoundError: If file doesn't exist
-        ValidationError: If activities fail validation
+        ValueError: If data is not a list, or listing every invalid item
     """
-    data = load_json(file_path)
-
     if not isinstance(data, list):
-        raise ValueError("Activities file must contain a JSON array")
+        raise ValueError(f"{file_kind} file must contain a JSON array")
 
-    activities = []
-    errors = []
+    try:
+        return _list_adapter(model).validate_python(data)
+    except ValidationError as e:
+        item_errors: Dict[int, List[str]] = {}
+        for error in e.errors():
+            index, *field = error["loc"]
+            location = ".".join(str(part) for part in field) or "item"
+            item_errors.setdefault(index, []).append(f"{location}: {error['msg']}")
 
-    for i, item in enumerate(data):
-        try:
-            activity = Activity(**item)
-            activities.append(activity)
-        except ValidationError as e:
-            errors.append(f"Activity {i} ({item.get('id', 'unknown')}): {e}")
+        lines = []
+        for index, messages in item_errors.items():
+            item = data[index]
+            item_id = item.get('id', 'unknown') if isinstance(item, dict) else 'unknown'
+            name = f"{label} {index}" if model is TimeSlot else f"{label} {index} ({item_id})"
+            lines.append(f"{name}: {'; '.join(messages)}")
 
-    if errors:
-        error_msg = "\n".join(errors)
-        raise ValidationError(f"Validation errors in activities:\n{error_msg}")
+        error_msg = "\n".join(lines)
+        raise ValueError(f"Validation errors in {what}:\n{error_msg}") from e
 
-    return activities
 
-
-def load_specialists(file_path: str | Path) -> List[Specialist]:
+def load_activities(file_path: str | Path) -> List[Activity]:
     """
-    Load specialists from JSON file.
+    Load activities from JSON file.
 
     Args:
-        file_path: Path to specialists JSON file
+        file_path: Path to activities JSON file
 
     Returns:
-        List of validated Specialist objects
+        List of validated Activity objects
 
     Raises:
         FileNotFoundError: If file doesn't exist
-        ValidationError: If specialists fail validation
+        ValueError: If activities fail validation (one line per invalid item)
     """
-    data = load_json(file_path)
+    return _validate_list(load_json(file_path), Activity, "Activity", "activities", "Activities")
 
-    if not isinstance(data, list):
-        raise ValueError("Specialists file must contain a JSON array")
 
-    specialists = []
-    errors = []
+def load_specialists(file_path: str | Path) -> List[Specialist]:
+    """
+    Load specialists from JSON file.
 
-    for i, item in enumerate(data):
-        try:
-            specialist = Specialist(**item)
-            specialists.append(specialist)
-        except ValidationError as e:
-            errors.append(f"Specialist {i} ({item.get('id', 'unknown')}): {e}")
+    Args:
+        file_path: Path to specialists JSON file
 
-    if errors:
-        error_msg = "\n".join(errors)
-        raise ValidationError(f"Validation errors in specialists:\n{error_msg}")
+    Returns:
+        List of validated Specialist objects
 
-    return specialists
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        ValueError: If specialists fail validation (one line per invalid item)
+    """
+    return _validate_list(load_json(file_path), Specialist, "Specialist", "specialists", "Specialists")
 
 
 def load_equipment(file_path: str | Path) -> List[Equipment]:
@@ -138,28 +256,9 @@ def load_equipment(file_path: str | Path) -> List[Equipment]:
 
     Raises:
         FileNotFoundError: If file doesn't exist
-        ValidationError: If equipment fail validation
+        ValueError: If equipment fail validation (one line per invalid item)
     """
-    data = load_json(file_path)
-
-    if not isinstance(data, list):
-        raise ValueError("Equipment file must contain a JSON array")
-
-    equipment_list = []
-    errors = []
-
-    for i, item in enumerate(data):
-        try:
-            equipment = Equipment(**item)
-            equipment_list.append(equipment)
-        except ValidationError as e:
-            errors.append(f"Equipment {i} ({item.get('id', 'unknown')}): {e}")
-
-    if errors:
-        error_msg = "\n".join(errors)
-        raise ValidationError(f"Validation errors in equipment:\n{error_msg}")
-
-    return equipment_list
+    return _validate_list(load_json(file_path), Equipment, "Equipment", "equipment", "Equipment")
 
 
 def load_travel(file_path: str | Path) -> List[TravelPeriod]:
@@ -174,34 +273,18 @@ def load_travel(file_path: str | Path) -> List[TravelPeriod]:
 
     Raises:
         FileNotFoundError: If file doesn't exist
-        ValidationError: If travel periods fail validation
+        ValueError: If travel periods fail validation (one line per invalid item)
     """
-    data = load_json(file_path)
-
-    if not isinstance(data, list):
-        raise ValueError("Travel file must contain a JSON array")
-
-    travel_periods = []
-    errors = []
-
-    for i, item in enumerate(data):
-        try:
-            travel = TravelPeriod(**item)
-            travel_periods.append(travel)
-        except ValidationError as e:
-            errors.append(f"Travel {i} ({item.get('id', 'unknown')}): {e}")
-
-    if errors:
-        error_msg = "\n".join(errors)
-        raise ValidationError(f"Validation errors in travel periods:\n{error_msg}")
-
-    return travel_periods
+    return _validate_list(load_json(file_path), TravelPeriod, "Travel", "travel periods", "Travel")
 
 
 def load_timeslots(file_path: str | Path) -> List[TimeSlot]:
     """
     Load time slots from JSON file.
 
+    Reads files written by ``save_schedule`` too: NDJSON (.ndjson/.jsonl)
+    and gzip-compressed (.gz) files.
+
     Args:
         file_path: Path to time slots JSON file
 
@@ -210,25 +293,15 @@ def load_timeslots(file_path: str | Path) -> List[TimeSlot]:
 
     Raises:
         FileNotFoundError: If file doesn't exist
-        ValidationError: If time slots fail validation
+        ValueError: If time slots fail validation (one line per invalid item)
     """
-    data = load_json(file_path)
-
-    if not isinstance(data, list):
-        raise ValueError("TimeSlots file must contain a JSON array")
-
-    timeslots = []
-    errors = []
-
-    for i, item in enumerate(data):
-        try:
-            slot = TimeSlot(**item)
-            timeslots.append(slot)
-        except ValidationError as e:
-            errors.append(f"TimeSlot {i}: {e}")
-
-    if errors:
-        error_msg = "\n".join(errors)
-        raise ValidationError(f"Validation errors in time slots:\n{error_msg}")
+    path = Path(file_path)
+    if _is_ndjson(path):
+        if not path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+        with _open_text(path, 'r') as f:
+            data = [_loads(line) for line in f if line.strip()]
+    else:
+        data = load_json(path)
 
-    return timeslots
+    return _validate_list(data, TimeSlot, "TimeSlot", "time slots", "TimeSlots")
@@ -0,0 +1,383 @@
+"""Cached, indexed view of a saved schedule for the web API.
+
+``ScheduleRepository`` loads the schedule and activities once, joins the
+activity details onto every slot, and builds the indexes the API serves
+from (by date, by month and by activity). Calendar aggregates come from the
+calendar.json written with the schedule, or are computed from the slots.
+
+Every access first compares the source files' modification times and sizes
+with those seen at load time, so a re-run of the scheduler is picked up on
+the next request without a restart.
+"""
+
+import hashlib
+import os
+import threading
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .aggregates import aggregate_rows
+from .columnar import ColumnarSchedule
+from .io import load_json
+
+
+# Enriched row fields that have a posting-list index for filtering
+FILTER_FIELDS: Tuple[str, ...] = ("activity_id", "activity_type", "priority")
+
+
+class _ScheduleIndex:
+    """One loaded schedule and its indexes (replaced as a whole on reload)."""
+
+    def __init__(self):
+        self.activity_map: Dict[str, Dict[str, Any]] = {}
+        self.slots: List[Dict[str, Any]] = []
+        self.by_date: Dict[str, List[Dict[str, Any]]] = {}
+        self.day_details: Dict[str, List[Dict[str, Any]]] = {}
+        self.by_month: Dict[Tuple[int, int], Dict[str, List[Dict[str, Any]]]] = {}
+        self.day_stats: Dict[Tuple[int, int], Dict[str, Dict[str, Any]]] = {}
+        self.month_stats: Dict[Tuple[int, int], Dict[str, Any]] = {}
+        self.by_activity: Dict[str, List[Dict[str, Any]]] = {}
+        self.dates: List[str] = []
+
+        # Enriched rows in date and start time order, with their dates for
+        # bisecting and, per filter value, the sorted positions of its rows
+        self.ordered: List[Dict[str, Any]] = []
+        self.ordered_dates: List[str] = []
+        self.postings: Dict[str, Dict[Any, List[int]]] = {}
+
+        self.etag: str = ""
+        self.last_modified: Optional[datetime] = None
+
+
+class ScheduleRepository:
+    """In-memory schedule indexes, reloaded when the source files change."""
+
+    def __init__(
+        self,
+        schedule_path: str | Path,
+        activities_path: str | Path,
+        columns_dir: Optional[str | Path] = None,
+        aggregates_path: Optional[str | Path] = None
+    ):
+        """
+        Set up the repository (files are read lazily on first access).
+
+        Args:
+            schedule_path: schedule.json written by the scheduler
+            activities_path: activities.json the schedule was built from
+            columns_dir: Columnar store to read instead of schedule.json when
+                present and no older than it
+            aggregates_path: calendar.json written with the schedule; computed from
+                the slots when missing or older than the schedule or activities
+        """
+        self.schedule_path = Path(schedule_path)
+        self.activities_path = Path(activities_path)
+        self.columns_dir = Path(columns_dir) if columns_dir else None
+        self.aggregates_path = Path(aggregates_path) if aggregates_path else None
+
+        self._lock = threading.Lock()
+        self._signature: Optional[Tuple] = None
+        self._index = _ScheduleIndex()
+
+    def _columns_meta(self) -> Optional[Path]:
+        """meta.json of the columnar store, or None if there is no store."""
+        if self.columns_dir is None:
+            return None
+        meta = self.columns_dir / "meta.json"
+        return meta if meta.exists() else None
+
+    def _use_columns(self) -> bool:
+        """Check the columnar store exists and is no older than schedule.json."""
+        meta = self._columns_meta()
+        if meta is None:
+            return False
+        if not self.schedule_path.exists():
+            return True
+        return os.stat(meta).st_mtime_ns >= os.stat(self.schedule_path).st_mtime_ns
+
+    def _schedule_file(self) -> Path:
+        """The schedule file the slots are loaded from."""
+        return self.columns_dir / "meta.json" if self._use_columns() else self.schedule_path
+
+    def _source_files(self) -> List[Path]:
+        """Files whose changes invalidate the cache."""
+        # Both schedule stores are watched, so a rewrite of either is noticed
+        meta = self._columns_meta()
+        files = [self.schedule_path] if meta is None or self.schedule_path.exists() else []
+        if meta is not None:
+            files.append(meta)
+        files.append(self.activities_path)
+        if self.aggregates_path is not None and self.aggregates_path.exists():
+            files.append(self.aggregates_path)
+        return files
+
+    def _aggregates_fresh(self) -> bool:
+        """Check calendar.json exists and was written no earlier than the schedule or activities.
+
+        Its priority and type mixes come from activities.json, so an edit to
+        the activities makes it stale just like a new schedule does.
+        """
+        if self.aggregates_path is None or not self.aggregates_path.exists():
+            return False
+        written = os.stat(self.aggregates_path).st_mtime_ns
+        return all(
+            written >= os.stat(path).st_mtime_ns
+            for path in (self._schedule_file(), self.activities_path)
+        )
+
+    def _current_signature(self) -> Tuple:
+        """(path, mtime, size) of every source file."""
+        signature = []
+        for path in self._source_files():
+            stat = os.stat(path)
+            signature.append((str(path), stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def refresh(self) -> _ScheduleIndex:
+        """
+        Reload and re-index if any source file changed since the last load.
+
+        Returns:
+            The current index
+
+        Raises:
+            FileNotFoundError: If a source file doesn't exist
+        """
+        signature = self._current_signature()
+        if signature != self._signature:
+            with self._lock:
+                if signature != self._signature:
+                    index = self._load()
+                    index.etag = hashlib.sha1(repr(signature).encode()).hexdigest()[:20]
+                    index.last_modified = datetime.fromtimestamp(
+                        max(mtime for _, mtime, _ in signature) // 1_000_000_000, timezone.utc
+                    )
+                    self._index = index
+                    self._signature = signature
+        return self._index
+
+    def _load(self) -> _ScheduleIndex:
+        """Read the source files and build every index."""
+        index = _ScheduleIndex()
+
+        if self._use_columns():
+            with ColumnarSchedule(self.columns_dir) as store:
+                index.slots = store.slots()
+        else:
+            index.slots = load_json(self.schedule_path)
+
+        index.activity_map = {a["id"]: a for a in load_json(self.activities_path)}
+
+        for slot in index.slots:
+            activity = index.activity_map.get(slot["activity_id"], {})
+            row = {
+                **slot,
+                "activity_name": activity.get("name", "Unknown"),
+                "activity_type": activity.get("type", "Unknown"),
+                "priority": activity.get("priority", 5)
+            }
+
+            date_key = slot["date"]
+            index.by_date.setdefault(date_key, []).append(row)
+            index.day_details.setdefault(date_key, []).append(
+                {**row, "details": activity.get("details", "")}
+            )
+            month_key = (int(date_key[:4]), int(date_key[5:7]))
+            index.by_month.setdefault(month_key, {}).setdefault(date_key, []).append(slot)
+
+        for by_date in (index.by_date, index.day_details):
+            for day_rows in by_date.values():
+                day_rows.sort(key=lambda row: row["start_time"])
+        index.dates = sorted(index.by_date)
+
+        index.ordered = [row for date in index.dates for row in index.by_date[date]]
+        index.ordered_dates = [row["date"] for row in index.ordered]
+        for row in index.ordered:
+            index.by_activity.setdefault(row["activity_id"], []).append(row)
+        index.postings = {field: {} for field in FILTER_FIELDS}
+        for position, row in enumerate(index.ordered):
+            for field, postings in index.postings.items():
+                postings.setdefault(row[field], []).append(position)
+
+        if self._aggregates_fresh():
+            aggregates = load_json(self.aggregates_path)
+        else:
+            aggregates = aggregate_rows(
+                (row["date"], row["duration_minutes"], row["priority"], row["activity_type"])
+                for row in index.ordered
+            )
+        for date_key, stats in aggregates["days"].items():
+            month_key = (int(date_key[:4]), int(date_key[5:7]))
+            index.day_stats.setdefault(month_key, {})[date_key] = stats
+        for month, stats in aggregates["months"].items():
+            index.month_stats[(int(month[:4]), int(month[5:7]))] = stats
+
+        return index
+
+    def cache_validators(self) -> Tuple[str, datetime]:
+        """
+        Get HTTP cache validators for the loaded schedule.
+
+        Returns:
+            (ETag derived from the source files' mtimes and sizes, last modification time)
+        """
+        index = self.refresh()
+        return index.etag, index.last_modified
+
+    def activity_map(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the raw activities by ID.
+
+        Returns:
+            Activity ID -> activity dict from activities.json
+        """
+        return self.refresh().activity_map
+
+    def all_slots(self) -> List[Dict[str, Any]]:
+        """
+        Get every slot enriched with activity name, type and priority.
+
+        Returns:
+            Enriched slots in date and start time order, whichever store
+            they were loaded from
+        """
+        return self.refresh().ordered
+
+    def day(self, date: str) -> List[Dict[str, Any]]:
+        """
+        Get one day's slots (enriched, plus activity details).
+
+        Args:
+            date: Date as YYYY-MM-DD
+
+        Returns:
+            Slots sorted by start time
+        """
+        return self.refresh().day_details.get(date, [])
+
+    def date_range(self, start: Optional[str] = None, end: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get enriched slots between two dates (inclusive).
+
+        Args:
+            start: First date as YYYY-MM-DD (default: the beginning)
+            end: Last date as YYYY-MM-DD (default: the end)
+
+        Returns:
+            Slots in date and start time order
+        """
+        return self.query(start, end)[0]
+
+    def query(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        activity_id: Optional[str] = None,
+        activity_type: Optional[str] = None,
+        priority: Optional[int] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Get a page of enriched slots matching every given filter.
+
+        The date range is bisected on the date-ordered rows and the most
+        selective filter's posting list is walked within it, so a request
+        never scans the whole schedule.
+
+        Args:
+            start: First date as YYYY-MM-DD (default: the beginning)
+            end: Last date as YYYY-MM-DD (default: the end)
+            activity_id: Only this activity's slots
+            activity_type: Only slots of this activity type
+            priority: Only slots of this priority
+            limit: Page size (default: everything)
+            cursor: ``next_cursor`` from the previous page
+
+        Returns:
+            (slots in date and start time order, cursor for the next page or None)
+
+        Raises:
+            ValueError: If the cursor is malformed or the schedule changed since it was issued
+        """
+        index = self.refresh()
+
+        lo = 0 if start is None else bisect_left(index.ordered_dates, start)
+        hi = len(index.ordered) if end is None else bisect_right(index.ordered_dates, end)
+        if cursor is not None:
+            lo = max(lo, self._decode_cursor(cursor, index))
+
+        filters = {
+            field: value
+            for field, value in zip(FILTER_FIELDS, (activity_id, activity_type, priority))
+            if value is not None
+        }
+
+        if filters:
+            # Walk the shortest posting list and check the others per row
+            field = min(filters, key=lambda f: len(index.postings[f].get(filters[f], ())))
+            postings = index.postings[field].get(filters.pop(field), [])
+            positions = postings[bisect_left(postings, lo):bisect_left(postings, hi)]
+        else:
+            positions = range(lo, hi)
+
+        page: List[Dict[str, Any]] = []
+        for position in positions:
+            row = index.ordered[position]
+            if all(row[f] == value for f, value in filters.items()):
+                if limit is not None and len(page) == limit:
+                    return page, f"{position}.{index.etag}"
+                page.append(row)
+
+        return page, None
+
+    @staticmethod
+    def _decode_cursor(cursor: str, index: _ScheduleIndex) -> int:
+        """Turn a cursor back into a row position, checking it belongs to this index."""
+        position, _, etag = cursor.partition(".")
+        if not position.isdigit() or not etag:
+            raise ValueError(f"Invalid cursor: {cursor}")
+        if etag != index.etag:
+            raise ValueError("Cursor is stale: the schedule changed, start again without a cursor")
+        return int(position)
+
+    def month(self, year: int, month: int) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get a month's raw slots grouped by date.
+
+        Args:
+            year: Calendar year
+            month: Calendar month (1-12)
+
+        Returns:
+            Date (YYYY-MM-DD) -> slots booked that day
+        """
+        return self.refresh().by_month.get((year, month), {})
+
+    def calendar(self, year: int, month: int) -> Tuple[Dict[str, Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        Get a month's precomputed aggregates.
+
+        Args:
+            year: Calendar year
+            month: Calendar month (1-12)
+
+        Returns:
+            (date -> day stats for days with bookings, month stats or None if nothing is booked)
+        """
+        index = self.refresh()
+        return index.day_stats.get((year, month), {}), index.month_stats.get((year, month))
+
+    def for_activity(self, activity_id: str) -> List[Dict[str, Any]]:
+        """
+        Get every enriched slot of one activity.
+
+        Args:
+            activity_id: The activity ID
+
+        Returns:
+            Slots in date and start time order
+        """
+        return self.refresh().by_activity.get(activity_id, [])